@@ -1,12 +1,23 @@
 import streamlit as st
 import asyncio
 import logging
+import threading
+from concurrent.futures import Future
 from datetime import datetime
+from typing import AsyncIterator, Dict, Iterator, List, Optional
 import uuid
 
 from src.infrastructure.di.container import Container
-from src.infrastructure.config.settings import Settings
-from src.domain.entities import Document
+from src.presentation.streamlit.formatting import (
+    cached_message_html,
+    format_message_html
+)
+from src.presentation.streamlit.history import ChatHistoryWindow
+from src.infrastructure.document.text_extractor import (
+    SUPPORTED_EXTENSIONS,
+    extract_text
+)
+from src.domain.entities import Document, IngestionProgress, Message
 
 # Configure logging to help track application behavior and debug issues
 logging.basicConfig(
@@ -15,6 +26,74 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class BackgroundEventLoop:
+    """
+    A single asyncio event loop running in a daemon thread for the life of
+    the process. Streamlit reruns the script on every interaction; running
+    all coroutines on this loop keeps the singleton adapters' connection
+    pools bound to one loop instead of a new one per asyncio.run().
+    """
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self.loop.run_forever,
+            name="streamlit-event-loop",
+            daemon=True
+        )
+        self.thread.start()
+
+    def submit(self, coroutine) -> Future:
+        """Schedules a coroutine on the loop without waiting for it."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def run(self, coroutine):
+        """Runs a coroutine on the loop and waits for its result."""
+        return self.submit(coroutine).result()
+
+    def iterate(self, async_iterator: AsyncIterator) -> Iterator:
+        """
+        Drives an async iterator on the loop, yielding its items to the
+        calling thread as they arrive. Stopping early closes the iterator.
+        """
+        try:
+            while True:
+                try:
+                    yield self.run(async_iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self.run(async_iterator.aclose())
+
+
+class DocumentUpload:
+    """
+    A document being ingested on the background event loop. The loop
+    thread replaces progress as batches complete; reruns only read it.
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self.progress = IngestionProgress()
+        self.future: Optional[Future] = None
+
+    def update(self, progress: IngestionProgress):
+        """Progress callback for the ingestion use case."""
+        self.progress = progress
+
+
+@st.cache_resource
+def get_event_loop() -> BackgroundEventLoop:
+    """Starts the background event loop once per process."""
+    return BackgroundEventLoop()
+
+
+@st.cache_resource
+def get_container() -> Container:
+    """Builds the container once per process and warms up the LLM client."""
+    container = Container()
+    get_event_loop().run(container.llm().warmup())
+    return container
+
+
 class StreamlitApp:
 
 
@@ -23,20 +102,23 @@ class StreamlitApp:
     This class maintains clean architecture by delegating business logic to usecases.
     """
     def __init__(self):
-        # Initialize container and settings
-        self.container = Container()
-        self.settings = Settings()
-        self.container.config()
+        # Reuse the event loop and container across reruns
+        self.runtime = get_event_loop()
+        self.container = get_container()
+        self.settings = self.container.config()
         
         # Initialize use cases
         self.chat_completion = self.container.chat_completion()
         self.document_ingestion = self.container.document_ingestion()
+        self.chat_repository = self.container.chat_repository()
         
         # Initialize session state if needed
-        if 'messages' not in st.session_state:
-            st.session_state.messages = []
+        if 'history' not in st.session_state:
+            st.session_state.history = ChatHistoryWindow()
         if 'session_id' not in st.session_state:
             st.session_state.session_id = str(uuid.uuid4())
+        if 'uploads' not in st.session_state:
+            st.session_state.uploads = []
 
     def setup_page(self):
         """Configure the Streamlit page layout and styling."""
@@ -67,88 +149,177 @@ class StreamlitApp:
         """, unsafe_allow_html=True)
 
     def render_chat_messages(self):
-        """Display chat messages with appropriate styling."""
-        for message in st.session_state.messages:
-            with st.container():
-                if message["role"] == "user":
-                    st.markdown(f"""
-                    <div class="user-message">
-                        <strong>You:</strong> {message["content"]}
-                    </div>
-                    """, unsafe_allow_html=True)
-                else:
-                    st.markdown(f"""
-                    <div class="assistant-message">
-                        <strong>Assistant:</strong> {message["content"]}
-                    </div>
-                    """, unsafe_allow_html=True)
+        """
+        Display the visible window of chat messages as a single HTML
+        block, with a button that pages older messages in from the chat
+        repository.
+        """
+        history = st.session_state.history
+        hidden = history.hidden_count
+        if hidden and st.button(f"Load older messages ({hidden} more)"):
+            history.load_older(self.fetch_messages)
+
+        st.markdown(
+            "".join(cached_message_html(message["role"], message["content"])
+                    for message in history.visible),
+            unsafe_allow_html=True
+        )
+
+    def fetch_messages(self, offset: int, limit: int) -> List[Dict]:
+        """Read a range of this session's stored messages."""
+        older = self.runtime.run(self.chat_repository.get_messages(
+            st.session_state.session_id, offset, limit))
+        return [
+            {
+                "role": message.role,
+                "content": message.content,
+                "timestamp": message.timestamp
+            }
+            for message in older
+        ]
+
+    def render_message(self, role: str, content: str, target=st):
+        """Render a single chat message with the style for its role."""
+        target.markdown(format_message_html(role, content),
+                        unsafe_allow_html=True)
 
-    async def process_user_message(self, user_input: str):
+    def process_user_message(self, user_input: str):
         """
-        Process user input and generate response using the chat completion use case.
+        Process user input and stream the response from the chat completion
+        use case, rendering tokens as they arrive.
         
         Args:
             user_input: The user's message text
         """
         try:
+            history = st.session_state.history
+            history.trim()
+
             # Add user message to state
-            st.session_state.messages.append({
+            history.append({
                 "role": "user",
                 "content": user_input,
                 "timestamp": datetime.utcnow()
             })
-            
-            # Generate response using chat completion use case
-            response = await self.chat_completion.execute(
+            self.render_message("user", user_input)
+            placeholder = st.empty()
+
+            # Stream the response using chat completion use case
+            content = ""
+            timestamp = datetime.utcnow()
+            stream = self.chat_completion.execute_stream(
                 session_id=st.session_state.session_id,
-                user_input=user_input
+                user_input=user_input,
+                temperature=st.session_state.get("temperature", 0.7)
             )
+            for item in self.runtime.iterate(stream):
+                if isinstance(item, Message):
+                    content = item.content
+                    timestamp = item.timestamp
+                else:
+                    content += item
+                self.render_message("assistant", content, placeholder)
             
             # Add assistant response to state
-            st.session_state.messages.append({
+            history.append({
                 "role": "assistant",
-                "content": response.content,
-                "timestamp": response.timestamp
+                "content": content,
+                "timestamp": timestamp
             })
             
         except Exception as e:
             logger.error(f"Error processing message: {str(e)}")
             st.error("An error occurred while processing your message. Please try again.")
 
-    async def process_document_upload(self, uploaded_file):
+    def submit_document_upload(self, uploaded_file):
+        """
+        Start ingesting an uploaded document in the background, so the
+        chat stays usable while it is processed.
+
+        Args:
+            uploaded_file: The uploaded file from Streamlit
+        """
+        upload = DocumentUpload(uploaded_file.name)
+        upload.future = self.runtime.submit(self.process_document_upload(
+            uploaded_file.name, uploaded_file.getvalue(), upload))
+        st.session_state.uploads.append(upload)
+
+    async def process_document_upload(self, filename: str, data: bytes,
+                                      upload: DocumentUpload):
         """
         Process uploaded document for RAG context.
         
         Args:
-            uploaded_file: The uploaded file from Streamlit
+            filename: Name of the uploaded file
+            data: Raw content of the uploaded file
+            upload: Receives progress of the ingestion
         """
         try:
-            # Read file content
-            content = uploaded_file.read()
-            if isinstance(content, bytes):
-                content = content.decode('utf-8')
+            # Extract text off the event loop; PDF parsing is CPU-bound
+            loop = asyncio.get_running_loop()
+            content = await loop.run_in_executor(
+                None, extract_text, data, filename)
             
             # Create document entity
             document = Document(
                 content=content,
-                source=uploaded_file.name,
+                source=filename,
                 metadata={
-                    "filename": uploaded_file.name,
+                    "filename": filename,
                     "upload_time": datetime.utcnow().isoformat()
                 }
             )
             
             # Use document ingestion use case
-            await self.document_ingestion.execute(
+            return await self.document_ingestion.execute(
                 documents=[document],
-                chunk_size=1000  # Configure based on your needs
+                chunk_size=1000,  # Configure based on your needs
+                progress_callback=upload.update
             )
             
-            st.success(f"Successfully processed document: {uploaded_file.name}")
-            
         except Exception as e:
             logger.error(f"Error processing document: {str(e)}")
-            st.error("An error occurred while processing the document. Please try again.")
+            raise
+
+    def uploads_pending(self) -> bool:
+        """Whether any upload is still being ingested."""
+        return any(not upload.future.done()
+                   for upload in st.session_state.uploads)
+
+    def render_uploads(self):
+        """Show the uploads, polling for progress only while one runs."""
+        if self.uploads_pending():
+            self.render_upload_progress()
+        else:
+            self.render_upload_status()
+
+    @st.fragment(run_every=1.0)
+    def render_upload_progress(self):
+        """
+        Redraw the uploads once a second. When the last one finishes,
+        rerun the whole app so it falls back to the static render and
+        the timer stops.
+        """
+        if not self.uploads_pending():
+            st.rerun()
+        self.render_upload_status()
+
+    def render_upload_status(self):
+        """Show the progress or outcome of each upload."""
+        for upload in st.session_state.uploads:
+            progress = upload.progress
+            if not upload.future.done():
+                st.progress(
+                    progress.fraction,
+                    text=f"Processing {upload.name}: "
+                         f"{progress.stored_chunks}/{progress.total_chunks} "
+                         f"chunks"
+                )
+            elif upload.future.exception() is not None:
+                st.error(f"An error occurred while processing "
+                         f"{upload.name}. Please try again.")
+            else:
+                st.success(f"Successfully processed document: {upload.name}")
 
     def render_sidebar(self):
         """Render the sidebar with document upload and configuration options."""
@@ -156,12 +327,13 @@ class StreamlitApp:
             st.header("Document Upload")
             uploaded_file = st.file_uploader(
                 "Upload a document for context",
-                type=['txt', 'pdf', 'docx']
+                type=list(SUPPORTED_EXTENSIONS)
             )
             
             if uploaded_file:
                 if st.button("Process Document"):
-                    asyncio.run(self.process_document_upload(uploaded_file))
+                    self.submit_document_upload(uploaded_file)
+            self.render_uploads()
             
             st.header("Configuration")
             st.slider(
@@ -170,13 +342,15 @@ class StreamlitApp:
                 max_value=1.0,
                 value=0.7,
                 step=0.1,
+                key="temperature",
                 help="Controls randomness in responses"
             )
 
     def render_chat_interface(self):
         """Render the main chat interface."""
-        # Display chat messages
+        # Display chat messages, with new ones streamed in below them
         self.render_chat_messages()
+        live_area = st.container()
         
         # Chat input
         with st.container():
@@ -189,9 +363,8 @@ class StreamlitApp:
             if st.button("Send") or (user_input and user_input != st.session_state.get('last_input', '')):
                 if user_input:
                     st.session_state.last_input = user_input
-                    asyncio.run(self.process_user_message(user_input))
-                    # Clear input after sending
-                    st.experimental_rerun()
+                    with live_area:
+                        self.process_user_message(user_input)
 
 def main():
     """Main function to run the Streamlit application."""
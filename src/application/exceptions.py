@@ -16,3 +16,8 @@ class VectorDBException(ApplicationException):
 class ChatRepositoryException(ApplicationException):
     """Raised when chat repository operations fail"""
     pass
+
+
+class IngestionJobException(ApplicationException):
+    """Raised when ingestion job queue operations fail"""
+    pass
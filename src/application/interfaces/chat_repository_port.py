@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from typing import Optional, List
-from src.domain.entities import ChatSession
+from src.domain.entities import ChatSession, Message, SessionPage
 
 
 class ChatRepositoryPort(ABC):
@@ -18,6 +19,34 @@ class ChatRepositoryPort(ABC):
         """Retrieves a chat session by ID"""
         pass
 
+    async def get_session_window(
+        self,
+        session_id: str,
+        window_size: int
+    ) -> Optional[ChatSession]:
+        """
+        Retrieves a chat session with only its last window_size messages.
+        Earlier messages stay in storage and are counted in
+        history_offset. Defaults to loading the full session.
+        """
+        return await self.get_session(session_id)
+
+    async def get_messages(
+        self,
+        session_id: str,
+        offset: int,
+        limit: int
+    ) -> List[Message]:
+        """
+        Retrieves up to limit messages of a session starting at position
+        offset, oldest first. Used to page back through long histories.
+        Defaults to slicing the full session.
+        """
+        session = await self.get_session(session_id)
+        if not session:
+            return []
+        return session.messages[offset:offset + limit]
+
     @abstractmethod
     async def delete_session(self, session_id: str) -> None:
         """Deletes a chat session"""
@@ -28,3 +57,37 @@ class ChatRepositoryPort(ABC):
                             offset: int = 0) -> List[ChatSession]:
         """Lists chat sessions with pagination"""
         pass
+
+    @abstractmethod
+    async def list_session_summaries(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None
+    ) -> SessionPage:
+        """
+        Lists summaries of the most recently active sessions, without
+        their messages. Pass a page's next_cursor to fetch the next one.
+        """
+        pass
+
+    async def initialize(self) -> None:
+        """
+        Prepares storage, such as indexes, on startup.
+        Optional hook; does nothing by default.
+        """
+        pass
+
+    @asynccontextmanager
+    async def lock_session(self, session_id: str):
+        """
+        Serializes turns on one session: hold it from loading a session
+        until its update is saved. Optional hook; does not lock by default.
+        """
+        yield
+
+    async def close(self) -> None:
+        """
+        Flushes pending writes and releases connections on shutdown.
+        Optional hook; does nothing by default.
+        """
+        pass
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from src.domain.entities import IngestionJob
+
+
+class IngestionJobStorePort(ABC):
+    """
+    Port interface for the durable queue of ingestion jobs.
+    Jobs are claimed oldest first under a lease. A running job's worker
+    renews the lease with every update; a job whose lease expires, such
+    as one left running by a crashed process, can be claimed again.
+    """
+    @abstractmethod
+    async def enqueue_job(self, job: IngestionJob) -> None:
+        """Stores a new job, with its documents, as queued"""
+        pass
+
+    @abstractmethod
+    async def claim_job(self, lease_timeout: float) -> Optional[IngestionJob]:
+        """
+        Atomically claims the oldest job that is queued, or running with
+        a lease not renewed for lease_timeout seconds, marks it running
+        and returns it with its documents. Returns None if no job is
+        available. Each claim counts as an attempt.
+        """
+        pass
+
+    @abstractmethod
+    async def update_job(self, job: IngestionJob) -> bool:
+        """
+        Stores a job's status, progress and error and renews its lease.
+        Returns False, writing nothing, if the job has been claimed again
+        since this attempt started.
+        """
+        pass
+
+    @abstractmethod
+    async def get_job(self, job_id: str) -> Optional[IngestionJob]:
+        """Retrieves a job's status by ID, without its documents"""
+        pass
+
+    async def close(self) -> None:
+        """Releases storage resources. Does nothing by default."""
+        pass
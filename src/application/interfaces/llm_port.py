@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from src.domain.entities import Message, Embedding
 
 
@@ -29,6 +29,33 @@ class LLMPort(ABC):
         """
         pass
 
+    async def stream_response(
+        self,
+        messages: List[Message],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """
+        Generates a response like generate_response, yielding its content
+        in pieces as they are produced. Closing the iterator early cancels
+        the generation. The default implementation yields the complete
+        response at once.
+
+        Args:
+            messages: List of previous messages in the conversation
+            temperature: Controls randomness in the response (0-1)
+            max_tokens: Maximum length of the generated response
+
+        Yields:
+            str: Successive pieces of the response content
+        """
+        response = await self.generate_response(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        yield response.content
+
     @abstractmethod
     async def generate_embedding(self, text: str) -> Embedding:
         """
@@ -41,3 +68,32 @@ class LLMPort(ABC):
             Embedding: The generated embedding vector
         """
         pass
+
+    @abstractmethod
+    async def generate_embeddings(self, texts: List[str]) -> List[Embedding]:
+        """
+        Generates embedding vectors for several texts at once.
+        Implementations should batch requests to the provider rather
+        than issuing one call per text.
+
+        Args:
+            texts: The texts to generate embeddings for
+
+        Returns:
+            List[Embedding]: One embedding per input text, in input order
+        """
+        pass
+
+    async def warmup(self) -> None:
+        """
+        Prepares connections to the provider before the first request.
+        Optional hook; the default implementation does nothing.
+        """
+        pass
+
+    async def close(self) -> None:
+        """
+        Releases connections and other provider resources.
+        Optional hook; the default implementation does nothing.
+        """
+        pass
@@ -14,6 +14,30 @@ class VectorDBPort(ABC):
         """Stores a document and its embedding in the vector database"""
         pass
 
+    @abstractmethod
+    async def store_embeddings(self, documents: List[Document],
+                               embeddings: List[Embedding]) -> None:
+        """
+        Stores many documents and their embeddings in bulk.
+
+        Args:
+            documents: Documents to store
+            embeddings: Embedding for each document, in the same order
+        """
+        pass
+
+    @abstractmethod
+    async def upsert_embeddings(self, documents: List[Document],
+                                embeddings: List[Embedding]) -> None:
+        """
+        Inserts or replaces many documents and their embeddings in bulk.
+
+        Args:
+            documents: Documents to insert or replace
+            embeddings: Embedding for each document, in the same order
+        """
+        pass
+
     @abstractmethod
     async def search_similar(
         self,
@@ -31,6 +55,26 @@ class VectorDBPort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def search_similar_batch(
+        self,
+        embeddings: List[Embedding],
+        limit: int = 3,
+        score_threshold: Optional[float] = None
+    ) -> List[List[Document]]:
+        """
+        Searches for similar documents for several queries at once.
+
+        Args:
+            embeddings: Query embeddings to search with
+            limit: Maximum number of results to return per query
+            score_threshold: Minimum similarity score threshold
+
+        Returns:
+            List[List[Document]]: Results for each query, in input order
+        """
+        pass
+
     @abstractmethod
     async def delete_document(self, document_id: str) -> None:
         """Deletes a document and its embeddings from the database"""
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import AsyncIterator, List, Optional, Tuple, Union
 from src.domain.entities import Message, ChatSession
 from src.domain.value_objects.message_type import MessageType
 from src.application.interfaces.llm_port import LLMPort
@@ -17,19 +17,22 @@ class ChatCompletionUseCase:
         llm: LLMPort,
         vector_db: VectorDBPort,
         chat_repository: ChatRepositoryPort,
-        prompt_service: PromptService
+        prompt_service: PromptService,
+        context_window: int = 10
     ):
         self.llm = llm
         self.vector_db = vector_db
         self.chat_repository = chat_repository
         self.prompt_service = prompt_service
+        self.context_window = context_window
 
     async def execute(
         self,
         session_id: str,
         user_input: str,
         temperature: float = 0.7,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        skip_rag: bool = False
     ) -> Message:
         """
         Executes the chat completion flow:
@@ -39,9 +42,90 @@ class ChatCompletionUseCase:
         4. Constructs prompt with context
         5. Generates response using LLM
         6. Saves the updated session
+
+        Steps 2-3 are skipped when skip_rag is set.
+        """
+        # Turns on one session run one at a time so none loses messages
+        async with self.chat_repository.lock_session(session_id):
+            session, prompt_messages = await self._prepare_turn(
+                session_id, user_input, skip_rag)
+
+            # Generate response
+            response = await self.llm.generate_response(
+                messages=prompt_messages,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+
+            # Save updated session
+            session.add_message(response)
+            await self.chat_repository.save_session(session)
+
+        return response
+
+    async def execute_stream(
+        self,
+        session_id: str,
+        user_input: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        skip_rag: bool = False
+    ) -> AsyncIterator[Union[str, Message]]:
         """
-        # Get or create chat session
-        session = await self.chat_repository.get_session(session_id)
+        Executes the chat completion flow like execute, streaming the
+        response as the LLM produces it.
+        The session is saved once the stream has ended; a stream closed
+        early, e.g. on client disconnect, cancels generation and saves
+        nothing.
+
+        Yields:
+            Union[str, Message]: Response content deltas, then the
+            assembled response Message once it has been saved
+        """
+        async with self.chat_repository.lock_session(session_id):
+            session, prompt_messages = await self._prepare_turn(
+                session_id, user_input, skip_rag)
+
+            deltas = []
+            stream = self.llm.stream_response(
+                messages=prompt_messages,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+            try:
+                async for delta in stream:
+                    deltas.append(delta)
+                    yield delta
+            finally:
+                # Stops generation if the consumer went away mid-stream
+                await stream.aclose()
+
+            # Save updated session with the assembled response
+            response = Message(
+                content="".join(deltas),
+                role="assistant",
+                type=MessageType.TEXT,
+                metadata={"streamed": "true"}
+            )
+            session.add_message(response)
+            await self.chat_repository.save_session(session)
+
+        yield response
+
+    async def _prepare_turn(
+        self,
+        session_id: str,
+        user_input: str,
+        skip_rag: bool
+    ) -> Tuple[ChatSession, List[Message]]:
+        """
+        Loads the session, records the user message and builds the
+        messages to send to the LLM.
+        """
+        # Get or create chat session, loading only the recent messages
+        # the context window needs
+        session = await self.chat_repository.get_session_window(
+            session_id, window_size=self.context_window)
         if not session:
             session = ChatSession(id=session_id)
 
@@ -53,6 +137,10 @@ class ChatCompletionUseCase:
         )
         session.add_message(user_message)
 
+        if skip_rag:
+            return session, session.get_context_window(
+                window_size=self.context_window)
+
         # Generate embedding for user input
         input_embedding = await self.llm.generate_embedding(user_input)
 
@@ -69,22 +157,11 @@ class ChatCompletionUseCase:
                 user_input=user_input,
                 relevant_docs=relevant_docs)
 
-        # Generate response
-        response = await self.llm.generate_response(
-            messages=[
-                *session.get_context_window(window_size=10),
-                Message(
-                    content=context_enhanced_prompt,
-                    role="user",
-                    type=MessageType.TEXT
-                )
-            ],
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
-
-        # Save updated session
-        session.add_message(response)
-        await self.chat_repository.save_session(session)
-
-        return response
+        return session, [
+            *session.get_context_window(window_size=self.context_window),
+            Message(
+                content=context_enhanced_prompt,
+                role="user",
+                type=MessageType.TEXT
+            )
+        ]
@@ -1,5 +1,16 @@
-from typing import List, Optional
-from src.domain.entities import Document
+import asyncio
+from collections.abc import AsyncIterable as AsyncIterableABC
+from dataclasses import replace
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Union
+)
+from src.domain.entities import Document, IngestionProgress
 from src.application.interfaces.llm_port import LLMPort
 from src.application.interfaces.vector_db_port import VectorDBPort
 
@@ -8,39 +19,272 @@ class DocumentIngestionUseCase:
     """
     Use case for ingesting documents into the RAG system.
     Handles document processing, embedding generation, and storage.
+
+    Ingestion runs as a staged pipeline connected by bounded queues:
+    chunking feeds batched embedding, which feeds batched vector writes.
+    Embedding and storage run concurrently, and full queues apply
+    backpressure to the stages upstream of them.
+
+    Documents may be a list or an async iterable; an async iterable is
+    consumed as the chunking stage has room, so a streamed upload is
+    never held in memory whole.
+
+    An optional progress callback receives an IngestionProgress snapshot
+    after every embedded batch and every vector write, and an optional
+    stored callback receives each batch of chunks once it is written.
+    Without a failed callback the first failing batch aborts the run;
+    with one, failing batches are reported to it and the run goes on.
     """
-    def __init__(self, llm: LLMPort, vector_db: VectorDBPort):
+    def __init__(
+        self,
+        llm: LLMPort,
+        vector_db: VectorDBPort,
+        embedding_batch_size: int = 128,
+        embedding_concurrency: int = 4,
+        storage_batch_size: int = 500,
+        storage_concurrency: int = 2,
+        queue_size: int = 8
+    ):
+        """
+        Args:
+            llm: LLM port used to generate embeddings
+            vector_db: Vector database port used to store chunks
+            embedding_batch_size: Number of chunks per embedding request
+            embedding_concurrency: Number of concurrent embedding workers
+            storage_batch_size: Number of chunks per vector database write
+            storage_concurrency: Number of concurrent storage workers
+            queue_size: Maximum number of batches waiting between stages
+        """
         self.llm = llm
         self.vector_db = vector_db
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_concurrency = embedding_concurrency
+        self.storage_batch_size = storage_batch_size
+        self.storage_concurrency = storage_concurrency
+        self.queue_size = queue_size
 
     async def execute(
         self,
-        documents: List[Document],
-        chunk_size: Optional[int] = None
-    ) -> None:
+        documents: Union[Iterable[Document], AsyncIterable[Document]],
+        chunk_size: Optional[int] = None,
+        progress_callback: Optional[
+            Callable[[IngestionProgress], None]] = None,
+        stored_callback: Optional[
+            Callable[[List[Document]], None]] = None,
+        failed_callback: Optional[
+            Callable[[List[Document], Exception], None]] = None
+    ) -> IngestionProgress:
         """
         Processes and stores documents with their embeddings.
         Optionally chunks documents for better retrieval.
 
         Args:
-            documents: List of documents to process
+            documents: Documents to process, as a list or async iterable
             chunk_size: Optional size for document chunking
+            progress_callback: Optional callable receiving progress
+                snapshots as batches are embedded and stored
+            stored_callback: Optional callable receiving each batch of
+                chunks written to the vector database
+            failed_callback: Optional callable receiving each batch of
+                chunks that failed to embed or store, with the error
+
+        Returns:
+            IngestionProgress: The final chunk counts of the run
         """
-        for document in documents:
+        embedding_queue = asyncio.Queue(maxsize=self.queue_size)
+        storage_queue = asyncio.Queue(maxsize=self.queue_size)
+        active_embedders = [self.embedding_concurrency]
+        # Streamed documents are counted as they are chunked
+        streamed = isinstance(documents, AsyncIterableABC)
+        progress = IngestionProgress()
+        if not streamed:
+            documents = list(documents)
+            progress.total_chunks = sum(
+                self.count_chunks(document, chunk_size)
+                for document in documents
+            )
+
+        def report() -> None:
+            if progress_callback is not None:
+                progress_callback(replace(progress))
+
+        report()
+        tasks = [
+            asyncio.ensure_future(self._chunking_stage(
+                self._iterate(documents), chunk_size, embedding_queue,
+                progress if streamed else None)),
+            *[
+                asyncio.ensure_future(self._embedding_stage(
+                    embedding_queue, storage_queue, active_embedders,
+                    progress, report, failed_callback))
+                for _ in range(self.embedding_concurrency)
+            ],
+            *[
+                asyncio.ensure_future(self._storage_stage(
+                    storage_queue, progress, report, stored_callback,
+                    failed_callback))
+                for _ in range(self.storage_concurrency)
+            ]
+        ]
+
+        try:
+            # Stop at the first failure so blocked stages cannot deadlock
+            done, _ = await asyncio.wait(
+                tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return progress
+
+    @staticmethod
+    async def _iterate(
+        documents: Union[Iterable[Document], AsyncIterable[Document]]
+    ) -> AsyncIterator[Document]:
+        """Helper method to iterate a list or async iterable alike"""
+        if isinstance(documents, AsyncIterableABC):
+            async for document in documents:
+                yield document
+        else:
+            for document in documents:
+                yield document
+
+    async def _chunking_stage(
+        self,
+        documents: AsyncIterator[Document],
+        chunk_size: Optional[int],
+        embedding_queue: asyncio.Queue,
+        progress: Optional[IngestionProgress] = None
+    ) -> None:
+        """
+        Splits documents and queues chunks in embedding-sized batches,
+        adding to progress.total_chunks when given.
+        """
+        batch = []
+
+        async for document in documents:
             # Optionally chunk the document
             if chunk_size:
                 chunks = self._chunk_document(document, chunk_size)
             else:
                 chunks = [document]
+            if progress is not None:
+                progress.total_chunks += len(chunks)
 
-            # Process each chunk
             for chunk in chunks:
-                # Generate embedding
-                embedding = await self.llm.generate_embedding(chunk.content)
+                batch.append(chunk)
+                if len(batch) >= self.embedding_batch_size:
+                    await embedding_queue.put(batch)
+                    batch = []
+
+        if batch:
+            await embedding_queue.put(batch)
+
+        # One end-of-stream marker per embedding worker
+        for _ in range(self.embedding_concurrency):
+            await embedding_queue.put(None)
+
+    async def _embedding_stage(
+        self,
+        embedding_queue: asyncio.Queue,
+        storage_queue: asyncio.Queue,
+        active_embedders: List[int],
+        progress: IngestionProgress,
+        report: Callable[[], None],
+        failed_callback: Optional[
+            Callable[[List[Document], Exception], None]]
+    ) -> None:
+        """Generates embeddings for queued chunk batches"""
+        while True:
+            chunks = await embedding_queue.get()
+            if chunks is None:
+                break
+
+            try:
+                embeddings = await self.llm.generate_embeddings(
+                    [chunk.content for chunk in chunks]
+                )
+            except Exception as e:
+                if failed_callback is None:
+                    raise
+                failed_callback(chunks, e)
+                continue
+            for chunk, embedding in zip(chunks, embeddings):
                 chunk.add_embedding(embedding)
+            progress.embedded_chunks += len(chunks)
+            report()
+
+            await storage_queue.put((chunks, embeddings))
+
+        # The last embedding worker to finish closes the storage stage
+        active_embedders[0] -= 1
+        if active_embedders[0] == 0:
+            for _ in range(self.storage_concurrency):
+                await storage_queue.put(None)
+
+    async def _storage_stage(
+        self,
+        storage_queue: asyncio.Queue,
+        progress: IngestionProgress,
+        report: Callable[[], None],
+        stored_callback: Optional[Callable[[List[Document]], None]],
+        failed_callback: Optional[
+            Callable[[List[Document], Exception], None]]
+    ) -> None:
+        """
+        Writes embedded chunks to the vector database in batches. Writes
+        are upserts, so rerunning an interrupted ingestion is idempotent.
+        """
+        chunks = []
+        embeddings = []
+
+        async def store() -> None:
+            try:
+                await self.vector_db.upsert_embeddings(chunks, embeddings)
+            except Exception as e:
+                if failed_callback is None:
+                    raise
+                failed_callback(chunks, e)
+                return
+            progress.stored_chunks += len(chunks)
+            report()
+            if stored_callback is not None:
+                stored_callback(chunks)
+
+        while True:
+            item = await storage_queue.get()
+            if item is None:
+                break
+
+            chunks.extend(item[0])
+            embeddings.extend(item[1])
+            if len(chunks) >= self.storage_batch_size:
+                await store()
+                chunks = []
+                embeddings = []
+
+        if chunks:
+            await store()
 
-                # Store in vector database
-                await self.vector_db.store_embedding(chunk, embedding)
+    def count_chunks(
+        self,
+        document: Document,
+        chunk_size: Optional[int],
+        overlap: int = 100
+    ) -> int:
+        """
+        Counts the chunks _chunk_document produces for a document without
+        building them: chunks start every chunk_size - overlap characters
+        and the ones shorter than half a chunk are skipped.
+        """
+        if not chunk_size:
+            return 1
+        length = len(document.content)
+        last_start = min(length, length - chunk_size // 2 + 1)
+        return len(range(0, max(last_start, 0), chunk_size - overlap))
 
     def _chunk_document(
         self,
@@ -50,7 +294,9 @@ class DocumentIngestionUseCase:
     ) -> List[Document]:
         """
         Splits a document into smaller chunks with overlap.
-        Preserves document metadata while creating new IDs for chunks.
+        Preserves document metadata. Chunk IDs derive from the document
+        ID and chunk index, so ingesting a document again replaces its
+        chunks instead of duplicating them.
         """
         content = document.content
         chunks = []
@@ -62,6 +308,7 @@ class DocumentIngestionUseCase:
                 continue
 
             chunk = Document(
+                id=f"{document.id}:{len(chunks)}",
                 content=chunk_content,
                 source=document.source,
                 metadata={
@@ -0,0 +1,171 @@
+import asyncio
+import logging
+from typing import List, Optional
+from src.domain.entities import Document, IngestionJob
+from src.application.interfaces.ingestion_job_store_port import IngestionJobStorePort
+from .document_ingestion import DocumentIngestionUseCase
+
+logger = logging.getLogger(__name__)
+
+
+class IngestionJobUseCase:
+    """
+    Use case for ingesting documents through a durable job queue.
+    submit() stores a job and returns at once; a pool of worker tasks
+    claims queued jobs, runs them through DocumentIngestionUseCase and
+    saves their progress while they run.
+
+    Claims are leases renewed with every progress save. Jobs left
+    running by a crashed process are claimed again once their lease
+    expires, so accepted jobs survive restarts, and several processes
+    can share one job store. A job that is run again starts over; its
+    chunks have stable IDs and are upserted, so nothing is duplicated.
+    """
+    def __init__(
+        self,
+        document_ingestion: DocumentIngestionUseCase,
+        job_store: IngestionJobStorePort,
+        workers: int = 2,
+        max_attempts: int = 3,
+        poll_interval: float = 1.0,
+        progress_interval: float = 1.0,
+        lease_timeout: float = 60.0
+    ):
+        """
+        Args:
+            document_ingestion: Use case that ingests a job's documents
+            job_store: Durable queue of jobs
+            workers: Number of jobs run concurrently
+            max_attempts: Starts of a job, counting restarts, before it
+                is failed instead of run again
+            poll_interval: Seconds an idle worker waits between checks of
+                the queue
+            progress_interval: Seconds between saves of a job's progress,
+                which also renew its lease
+            lease_timeout: Seconds without a progress save after which a
+                running job is taken to be abandoned; must be well above
+                progress_interval
+        """
+        self.document_ingestion = document_ingestion
+        self.job_store = job_store
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.progress_interval = progress_interval
+        self.lease_timeout = lease_timeout
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def submit(
+        self,
+        documents: List[Document],
+        chunk_size: Optional[int] = None
+    ) -> IngestionJob:
+        """
+        Queues documents for background ingestion.
+
+        Args:
+            documents: List of documents to process
+            chunk_size: Optional size for document chunking
+
+        Returns:
+            IngestionJob: The queued job
+        """
+        job = IngestionJob(documents=documents, chunk_size=chunk_size)
+        await self.job_store.enqueue_job(job)
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return job
+
+    async def get_job(self, job_id: str) -> Optional[IngestionJob]:
+        """Retrieves a job's status and progress by ID"""
+        return await self.job_store.get_job(job_id)
+
+    async def start(self) -> None:
+        """Starts the workers"""
+        if self._tasks:
+            return
+        self._wakeup = asyncio.Event()
+        self._tasks = [
+            asyncio.ensure_future(self._worker())
+            for _ in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """
+        Stops the workers. Jobs they were running are put back in the
+        queue, or claimed again once their lease expires if that fails.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _worker(self) -> None:
+        """Runs queued jobs until cancelled"""
+        while True:
+            try:
+                # Cleared before claiming, so a submit made meanwhile
+                # still wakes this worker
+                self._wakeup.clear()
+                job = await self.job_store.claim_job(self.lease_timeout)
+                if job is None:
+                    # Not wait_for, which can swallow a cancellation
+                    # that arrives as the wakeup fires
+                    wakeup = asyncio.ensure_future(self._wakeup.wait())
+                    try:
+                        await asyncio.wait([wakeup],
+                                           timeout=self.poll_interval)
+                    finally:
+                        wakeup.cancel()
+                    continue
+
+                await self._run_job(job)
+
+            except Exception as e:
+                logger.error(f"Ingestion worker error: {str(e)}")
+                await asyncio.sleep(self.poll_interval)
+
+    async def _run_job(self, job: IngestionJob) -> None:
+        """Ingests a claimed job's documents and saves the outcome"""
+        if job.attempts > self.max_attempts:
+            job.fail(f"Interrupted {self.max_attempts} times; not retried")
+            await self.job_store.update_job(job)
+            return
+
+        def on_progress(progress):
+            job.progress = progress
+
+        reporter = asyncio.ensure_future(self._report_progress(job))
+        try:
+            job.progress = await self.document_ingestion.execute(
+                documents=job.documents,
+                chunk_size=job.chunk_size,
+                progress_callback=on_progress
+            )
+            job.succeed()
+        except asyncio.CancelledError:
+            # Hand the job back at once rather than waiting for its
+            # lease to expire
+            job.requeue()
+            await self.job_store.update_job(job)
+            raise
+        except Exception as e:
+            logger.error(f"Ingestion job {job.id} failed: {str(e)}")
+            job.fail(str(e))
+        finally:
+            reporter.cancel()
+            await asyncio.gather(reporter, return_exceptions=True)
+
+        if not await self.job_store.update_job(job):
+            logger.warning(f"Ingestion job {job.id} was claimed by another "
+                           f"worker; discarding this attempt's outcome")
+
+    async def _report_progress(self, job: IngestionJob) -> None:
+        """Saves a running job's progress and renews its lease
+        periodically, stopping if the lease was lost"""
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            if not await self.job_store.update_job(job):
+                logger.warning(f"Lost the lease on ingestion job {job.id}")
+                return
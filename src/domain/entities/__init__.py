@@ -2,6 +2,9 @@ from .message import Message
 from .embedding import Embedding
 from .document import Document
 from .chat_session import ChatSession
+from .session_summary import SessionSummary, SessionPage
+from .ingestion_progress import IngestionProgress
+from .ingestion_job import IngestionJob
 from .exceptions import (
     DomainException,
     InvalidMessageError,
@@ -14,6 +17,10 @@ __all__ = [
     'Embedding',
     'Document',
     'ChatSession',
+    'SessionSummary',
+    'SessionPage',
+    'IngestionProgress',
+    'IngestionJob',
     'DomainException',
     'InvalidMessageError',
     'InvalidEmbeddingError',
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import List, Dict, Optional
 from datetime import datetime
 from uuid import uuid4
@@ -16,6 +16,13 @@ class ChatSession:
     metadata: Dict[str, str] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.utcnow)
     last_activity: datetime = field(default_factory=datetime.utcnow)
+    # Number of messages already written by the repository; lets
+    # repositories append only the messages added since the last save
+    persisted_message_count: int = field(default=0, compare=False,
+                                         repr=False)
+    # Number of earlier messages left in storage when only a window of
+    # the history was loaded; messages holds the most recent ones
+    history_offset: int = field(default=0, compare=False, repr=False)
 
     def add_message(self, message: Message) -> None:
         """
@@ -39,7 +46,24 @@ class ChatSession:
         """
         return self.get_history(limit=window_size)
 
+    def get_unsaved_messages(self) -> List[Message]:
+        """Returns messages added since the session was last persisted"""
+        return self.messages[
+            max(self.persisted_message_count - self.history_offset, 0):]
+
+    def mark_persisted(self) -> None:
+        """Records that every current message has been persisted"""
+        self.persisted_message_count = self.message_count
+
+    def copy(self) -> "ChatSession":
+        """
+        Returns a copy whose message list and metadata can be changed
+        without affecting this session.
+        """
+        return replace(self, messages=list(self.messages),
+                       metadata=dict(self.metadata))
+
     @property
     def message_count(self) -> int:
         """Returns the total number of messages in the session"""
-        return len(self.messages)
+        return self.history_offset + len(self.messages)
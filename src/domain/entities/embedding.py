@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import Dict
 from uuid import uuid4
+import numpy as np
 
 
 @dataclass
@@ -8,14 +9,25 @@ class Embedding:
     """
     Represents a vector embedding of text content.
     Includes metadata for tracking embedding properties and source information.
+    The vector is held as a contiguous float32 NumPy array; adapters
+    convert to and from plain lists only at their external boundaries.
     """
-    vector: List[float]
+    vector: np.ndarray = field(compare=False)
     model: str
     id: str = field(default_factory=lambda: str(uuid4()))
     metadata: Dict[str, str] = field(default_factory=dict)
 
     def __post_init__(self):
         """Validates the embedding vector"""
-        if not isinstance(self.vector, list) or \
-           not all(isinstance(x, float) for x in self.vector):
-            raise ValueError("Vector must be a list of float values")
+        try:
+            self.vector = np.ascontiguousarray(self.vector, dtype=np.float32)
+        except (TypeError, ValueError):
+            raise ValueError("Vector must be a sequence of float values")
+
+        if self.vector.ndim != 1:
+            raise ValueError("Vector must be one-dimensional")
+
+    @property
+    def dimension(self) -> int:
+        """Returns the number of components in the vector"""
+        return self.vector.shape[0]
@@ -0,0 +1,50 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+from datetime import datetime
+from uuid import uuid4
+from .document import Document
+from .ingestion_progress import IngestionProgress
+from ..value_objects.job_status import JobStatus
+
+
+@dataclass
+class IngestionJob:
+    """
+    Represents a queued request to ingest documents in the background.
+    Tracks the job's status, chunk progress and any error.
+    """
+    documents: List[Document] = field(default_factory=list)
+    chunk_size: Optional[int] = None
+    id: str = field(default_factory=lambda: str(uuid4()))
+    status: JobStatus = JobStatus.QUEUED
+    progress: IngestionProgress = field(default_factory=IngestionProgress)
+    error: Optional[str] = None
+    # Number of times a worker has started the job
+    attempts: int = 0
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    def requeue(self) -> None:
+        """Returns an interrupted job to the queue"""
+        self.status = JobStatus.QUEUED
+
+    def succeed(self) -> None:
+        """Marks the job as finished successfully"""
+        self.status = JobStatus.SUCCEEDED
+        self.finished_at = datetime.utcnow()
+
+    def fail(self, error: str) -> None:
+        """Marks the job as failed with the given error"""
+        self.status = JobStatus.FAILED
+        self.error = error
+        self.finished_at = datetime.utcnow()
+
+    @property
+    def throughput(self) -> float:
+        """Chunks stored per second since the job started"""
+        if self.started_at is None:
+            return 0.0
+        elapsed = ((self.finished_at or datetime.utcnow()) -
+                   self.started_at).total_seconds()
+        return self.progress.stored_chunks / elapsed if elapsed > 0 else 0.0
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class IngestionProgress:
+    """
+    Progress of one document ingestion run, counted in chunks.
+    total_chunks is known before the first chunk is embedded, so a run
+    can be shown as a fraction from its start.
+    """
+    total_chunks: int = 0
+    embedded_chunks: int = 0
+    stored_chunks: int = 0
+
+    @property
+    def fraction(self) -> float:
+        """
+        Share of the chunks that have been stored, from 0.0 to 1.0.
+        0.0 while the chunk total is not yet known.
+        """
+        if not self.total_chunks:
+            return 0.0
+        return min(self.stored_chunks / self.total_chunks, 1.0)
+
+    @property
+    def done(self) -> bool:
+        """Whether every chunk has been stored"""
+        return self.stored_chunks >= self.total_chunks
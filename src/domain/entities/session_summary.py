@@ -0,0 +1,26 @@
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional
+from datetime import datetime
+
+
+@dataclass
+class SessionSummary:
+    """
+    Lightweight view of a chat session for listings.
+    Carries the session's metadata and message count but no messages.
+    """
+    id: str
+    message_count: int
+    created_at: datetime
+    last_activity: datetime
+    metadata: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class SessionPage:
+    """
+    One page of session summaries, most recently active first.
+    next_cursor fetches the following page and is None on the last one.
+    """
+    sessions: List[SessionSummary] = field(default_factory=list)
+    next_cursor: Optional[str] = None
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class JobStatus(Enum):
+    """
+    Value object representing the lifecycle of a background job.
+    Jobs move from QUEUED to RUNNING and end as SUCCEEDED or FAILED.
+    """
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
@@ -0,0 +1,125 @@
+from typing import AsyncIterator, List, Optional
+
+from src.domain.entities import Message, Embedding
+from src.application.interfaces.llm_port import LLMPort
+from src.infrastructure.cache.embedding_cache import EmbeddingCache
+
+
+class CachedLLMAdapter(LLMPort):
+    """
+    Caching decorator around another LLMPort implementation.
+    Serves embeddings for previously seen texts from an EmbeddingCache
+    and only sends cache misses to the wrapped adapter.
+    Chat completions are passed through unchanged.
+    """
+    def __init__(self, llm: LLMPort, cache: EmbeddingCache,
+                 embedding_model: str):
+        """
+        Initialize the caching decorator.
+
+        Args:
+            llm: Adapter that generates responses and embeddings
+            cache: Two-tier cache for embedding vectors
+            embedding_model: Model used by the wrapped adapter. Part of
+                the cache key, so changing it never returns stale vectors.
+        """
+        self.llm = llm
+        self.cache = cache
+        self.embedding_model = embedding_model
+
+    async def generate_response(
+        self,
+        messages: List[Message],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> Message:
+        """Delegates response generation to the wrapped adapter"""
+        return await self.llm.generate_response(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+
+    def stream_response(
+        self,
+        messages: List[Message],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """
+        Delegates response streaming to the wrapped adapter.
+        Its iterator is returned as is, so closing it closes the upstream
+        stream directly.
+        """
+        return self.llm.stream_response(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+
+    async def generate_embedding(self, text: str) -> Embedding:
+        """
+        Returns the cached embedding for a text, generating it on a miss.
+
+        Args:
+            text: Text to generate embedding for
+
+        Returns:
+            Embedding: The cached or newly generated embedding vector
+        """
+        embeddings = await self.generate_embeddings([text])
+        return embeddings[0]
+
+    async def generate_embeddings(self, texts: List[str]) -> List[Embedding]:
+        """
+        Returns embeddings for several texts.
+        Only texts missing from the cache reach the wrapped adapter,
+        in a single batched call.
+
+        Args:
+            texts: Texts to generate embeddings for
+
+        Returns:
+            List[Embedding]: One embedding per input text, in input order
+        """
+        cached = await self.cache.get_many(self.embedding_model, texts)
+
+        missing = list(dict.fromkeys(
+            text for text in texts if text not in cached))
+        generated = {}
+        if missing:
+            embeddings = await self.llm.generate_embeddings(missing)
+            generated = dict(zip(missing, embeddings))
+            await self.cache.put_many(
+                self.embedding_model,
+                {text: emb.vector for text, emb in generated.items()}
+            )
+
+        results = []
+        for text in texts:
+            if text in generated:
+                results.append(generated[text])
+            else:
+                # Cached arrays are read-only, so they are shared safely
+                results.append(Embedding(
+                    vector=cached[text],
+                    model=self.embedding_model,
+                    metadata={
+                        "text_length": len(text),
+                        "cached": "true"
+                    }
+                ))
+        return results
+
+    async def warmup(self) -> None:
+        """
+        Drops vectors cached for other embedding models, then warms up
+        the wrapped adapter.
+        """
+        await self.cache.invalidate(keep_model=self.embedding_model)
+        await self.llm.warmup()
+
+    async def close(self) -> None:
+        """Closes the wrapped adapter and the persistent cache"""
+        await self.llm.close()
+        self.cache.close()
@@ -1,5 +1,9 @@
+import base64
+import httpx
+import logging
+import numpy as np
 import openai
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from datetime import datetime
 
 from src.domain.entities import Message, Embedding
@@ -7,13 +11,32 @@ from src.domain.value_objects.message_type import MessageType
 from src.application.interfaces.llm_port import LLMPort
 from src.application.exceptions import LLMException
 
+logger = logging.getLogger(__name__)
+
 
 class OpenAIAdapter(LLMPort):
     """
     Adapter for OpenAI's API implementing the LLMPort interface.
     Handles both chat completions and embeddings generation.
+
+    Uses the async OpenAI client over a single shared keep-alive
+    connection pool, so concurrent requests run in parallel on the
+    event loop instead of blocking it.
     """
-    def __init__(self, api_key: str, model: str, embedding_model: str):
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        embedding_model: str,
+        embedding_batch_size: int = 512,
+        embedding_batch_max_tokens: int = 250_000,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        connect_timeout: float = 5.0,
+        completion_timeout: float = 60.0,
+        embedding_timeout: float = 30.0
+    ):
         """
         Initialize the OpenAI adapter with necessary configuration.
 
@@ -21,10 +44,37 @@ class OpenAIAdapter(LLMPort):
             api_key: OpenAI API key
             model: Model to use for chat completions
             embedding_model: Model to use for embeddings
+            embedding_batch_size: Maximum number of inputs per embeddings call
+            embedding_batch_max_tokens: Approximate token budget per
+                embeddings call
+            max_connections: Maximum number of open HTTP connections
+            max_keepalive_connections: Maximum number of idle connections
+                kept alive for reuse
+            keepalive_expiry: Seconds an idle connection is kept alive
+            connect_timeout: Seconds allowed to establish a connection
+            completion_timeout: Seconds allowed per chat completion call
+            embedding_timeout: Seconds allowed per embeddings call
         """
-        self.client = openai.OpenAI(api_key=api_key)
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            ),
+            timeout=httpx.Timeout(completion_timeout,
+                                  connect=connect_timeout)
+        )
+        self.client = openai.AsyncOpenAI(
+            api_key=api_key,
+            http_client=self.http_client
+        )
+        self.connect_timeout = connect_timeout
+        self.completion_timeout = completion_timeout
+        self.embedding_timeout = embedding_timeout
         self.model = model
         self.embedding_model = embedding_model
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_batch_max_tokens = embedding_batch_max_tokens
 
     async def generate_response(
         self,
@@ -60,7 +110,8 @@ class OpenAIAdapter(LLMPort):
                 temperature=temperature,
                 max_tokens=max_tokens,
                 n=1,
-                stream=False
+                stream=False,
+                timeout=self._timeout(self.completion_timeout)
             )
 
             # Convert response to our domain Message
@@ -77,6 +128,51 @@ class OpenAIAdapter(LLMPort):
         except Exception as e:
             raise LLMException(f"Error generating response: {str(e)}")
 
+    async def stream_response(
+        self,
+        messages: List[Message],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """
+        Streams a response from OpenAI's chat completion API.
+        Closing the iterator before the end closes the upstream HTTP
+        stream, so the provider stops generating.
+
+        Args:
+            messages: List of conversation messages
+            temperature: Controls randomness in the response
+            max_tokens: Maximum length of the generated response
+
+        Yields:
+            str: Content deltas as they arrive
+        """
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": msg.role, "content": msg.content}
+                    for msg in messages
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                n=1,
+                stream=True,
+                timeout=self._timeout(self.completion_timeout)
+            )
+        except Exception as e:
+            raise LLMException(f"Error generating response: {str(e)}")
+
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            raise LLMException(f"Error streaming response: {str(e)}")
+        finally:
+            await stream.close()
+
     async def generate_embedding(self, text: str) -> Embedding:
         """
         Generates embeddings using OpenAI's embedding API.
@@ -90,11 +186,13 @@ class OpenAIAdapter(LLMPort):
         try:
             response = await self.client.embeddings.create(
                 model=self.embedding_model,
-                input=text
+                input=text,
+                encoding_format="base64",
+                timeout=self._timeout(self.embedding_timeout)
             )
 
             return Embedding(
-                vector=response.data[0].embedding,
+                vector=self._decode_vector(response.data[0].embedding),
                 model=self.embedding_model,
                 metadata={
                     "text_length": len(text),
@@ -104,3 +202,112 @@ class OpenAIAdapter(LLMPort):
 
         except Exception as e:
             raise LLMException(f"Error generating embedding: {str(e)}")
+
+    async def generate_embeddings(self, texts: List[str]) -> List[Embedding]:
+        """
+        Generates embeddings for several texts using batched API calls.
+        Inputs are split by count and by estimated token budget.
+
+        Args:
+            texts: Texts to generate embeddings for
+
+        Returns:
+            List[Embedding]: One embedding per input text, in input order
+        """
+        embeddings = []
+
+        try:
+            for batch in self._split_batches(texts):
+                response = await self.client.embeddings.create(
+                    model=self.embedding_model,
+                    input=batch,
+                    encoding_format="base64",
+                    timeout=self._timeout(self.embedding_timeout)
+                )
+
+                # The API reports each vector's position in the batch
+                vectors = sorted(response.data, key=lambda item: item.index)
+                timestamp = datetime.utcnow().isoformat()
+                embeddings.extend(
+                    Embedding(
+                        vector=self._decode_vector(item.embedding),
+                        model=self.embedding_model,
+                        metadata={
+                            "text_length": len(text),
+                            "timestamp": timestamp
+                        }
+                    )
+                    for item, text in zip(vectors, batch)
+                )
+
+            return embeddings
+
+        except Exception as e:
+            raise LLMException(f"Error generating embeddings: {str(e)}")
+
+    async def warmup(self) -> None:
+        """
+        Opens a pooled connection to the OpenAI API ahead of the first
+        request by retrieving the configured chat model. Failures are
+        logged rather than raised so startup is not blocked.
+        """
+        try:
+            await self.client.models.retrieve(
+                self.model,
+                timeout=self._timeout(self.completion_timeout)
+            )
+
+        except Exception as e:
+            logger.warning(f"OpenAI connection warm-up failed: {str(e)}")
+
+    async def close(self) -> None:
+        """Closes the shared HTTP connection pool"""
+        await self.client.close()
+
+    def _timeout(self, seconds: float) -> httpx.Timeout:
+        """Helper method to build a per-call timeout"""
+        return httpx.Timeout(seconds, connect=self.connect_timeout)
+
+    def _split_batches(self, texts: List[str]) -> List[List[str]]:
+        """Helper method to group texts into request-sized batches"""
+        batches = []
+        current = []
+        current_tokens = 0
+
+        for text in texts:
+            tokens = self._estimate_tokens(text)
+            if current and (
+                len(current) >= self.embedding_batch_size or
+                current_tokens + tokens > self.embedding_batch_max_tokens
+            ):
+                batches.append(current)
+                current = []
+                current_tokens = 0
+
+            current.append(text)
+            current_tokens += tokens
+
+        if current:
+            batches.append(current)
+
+        return batches
+
+    @staticmethod
+    def _decode_vector(data) -> np.ndarray:
+        """
+        Helper method to turn an API vector into a float32 array.
+        Base64 payloads are decoded straight into the array without
+        building an intermediate list of Python floats.
+        """
+        if isinstance(data, str):
+            return np.frombuffer(base64.b64decode(data), dtype=np.float32)
+        return np.asarray(data, dtype=np.float32)
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """
+        Helper method to estimate the token count of a text.
+        Deliberately pessimistic (about 3 characters per token) so that
+        batches stay under the provider limit without a tokenizer.
+        """
+        return len(text) // 3 + 1
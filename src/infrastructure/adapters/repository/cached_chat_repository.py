@@ -0,0 +1,216 @@
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Tuple
+
+from src.domain.entities import ChatSession, Message, SessionPage
+from src.application.interfaces.chat_repository_port import ChatRepositoryPort
+
+
+class CachedChatRepository(ChatRepositoryPort):
+    """
+    Caching decorator around another ChatRepositoryPort.
+    Keeps recently used sessions in a size- and TTL-bounded LRU so
+    consecutive turns of a conversation skip the storage round trip.
+    Saves are written through to the wrapped repository; wrap this
+    repository in WriteBehindChatRepository to take them off the
+    response path.
+
+    Cached sessions keep only their most recent messages, so a cache
+    hit costs the same however long the conversation grows.
+
+    The cache is per process. The TTL bounds how long a session updated
+    by another process can be served stale.
+    """
+    def __init__(
+        self,
+        repository: ChatRepositoryPort,
+        max_sessions: int = 1000,
+        ttl: float = 300.0,
+        max_messages: int = 50
+    ):
+        """
+        Initialize the caching decorator.
+
+        Args:
+            repository: Repository that stores sessions
+            max_sessions: Capacity of the cache; 0 disables caching
+            ttl: Seconds a cached session is served without a reload
+            max_messages: Most recent messages kept per cached session;
+                larger requested windows are kept whole
+        """
+        self.repository = repository
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.max_messages = max_messages
+        self.sessions: "OrderedDict[str, Tuple[ChatSession, float]]" = \
+            OrderedDict()
+        # Per-session locks with the number of turns holding or awaiting
+        self.locks: Dict[str, Tuple[asyncio.Lock, int]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    async def save_session(self, session: ChatSession) -> None:
+        """Writes the session through and caches the saved state"""
+        await self.repository.save_session(session)
+        self._remember(session)
+
+    async def get_session(self, session_id: str) -> Optional[ChatSession]:
+        """
+        Retrieves a chat session, from the cache when it holds the full
+        history.
+        """
+        cached = self._lookup(session_id)
+        if cached is not None and cached.history_offset == 0:
+            self.hits += 1
+            return cached.copy()
+
+        self.misses += 1
+        session = await self.repository.get_session(session_id)
+        if session is not None:
+            self._remember(session)
+        return session
+
+    async def get_session_window(
+        self,
+        session_id: str,
+        window_size: int
+    ) -> Optional[ChatSession]:
+        """
+        Retrieves a windowed chat session, from the cache when it holds at
+        least the requested window.
+        """
+        cached = self._lookup(session_id)
+        if cached is not None and (cached.history_offset == 0 or
+                                   len(cached.messages) >= window_size):
+            self.hits += 1
+            return self._window(cached, window_size)
+
+        self.misses += 1
+        session = await self.repository.get_session_window(session_id,
+                                                           window_size)
+        if session is not None:
+            self._remember(session, max(window_size, self.max_messages))
+        return session
+
+    async def get_messages(
+        self,
+        session_id: str,
+        offset: int,
+        limit: int
+    ) -> List[Message]:
+        """
+        Retrieves a range of messages, from the cache when the cached
+        session holds the whole range.
+        """
+        cached = self._lookup(session_id)
+        if cached is not None and offset >= cached.history_offset:
+            start = offset - cached.history_offset
+            return cached.messages[start:start + limit]
+        return await self.repository.get_messages(session_id, offset, limit)
+
+    async def delete_session(self, session_id: str) -> None:
+        """Deletes a chat session and drops it from the cache"""
+        self.sessions.pop(session_id, None)
+        await self.repository.delete_session(session_id)
+
+    async def list_sessions(
+        self,
+        limit: int = 10,
+        offset: int = 0
+    ) -> List[ChatSession]:
+        """Lists chat sessions from the wrapped repository"""
+        return await self.repository.list_sessions(limit=limit,
+                                                   offset=offset)
+
+    async def list_session_summaries(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None
+    ) -> SessionPage:
+        """Lists session summaries from the wrapped repository"""
+        return await self.repository.list_session_summaries(limit=limit,
+                                                            cursor=cursor)
+
+    async def initialize(self) -> None:
+        """Prepares the wrapped repository"""
+        await self.repository.initialize()
+
+    @asynccontextmanager
+    async def lock_session(self, session_id: str):
+        """
+        Holds a per-session lock, so concurrent turns on one session run
+        one after another instead of overwriting each other's messages.
+        """
+        lock, users = self.locks.get(session_id, (asyncio.Lock(), 0))
+        self.locks[session_id] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self.locks[session_id]
+            if users == 1:
+                del self.locks[session_id]
+            else:
+                self.locks[session_id] = (lock, users - 1)
+
+    def stats(self) -> Dict[str, float]:
+        """Returns hit, miss, eviction and expiration counters"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": len(self.sessions)
+        }
+
+    async def close(self) -> None:
+        """Drops cached sessions and closes the wrapped repository"""
+        self.sessions.clear()
+        await self.repository.close()
+
+    def _lookup(self, session_id: str) -> Optional[ChatSession]:
+        """Helper method to return a live cache entry, dropping it if
+        expired"""
+        entry = self.sessions.get(session_id)
+        if entry is None:
+            return None
+
+        session, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self.sessions[session_id]
+            self.expirations += 1
+            return None
+
+        self.sessions.move_to_end(session_id)
+        return session
+
+    def _remember(self, session: ChatSession,
+                  max_messages: Optional[int] = None) -> None:
+        """Helper method to cache the recent messages of a session,
+        evicting if full"""
+        if self.max_sessions <= 0:
+            return
+
+        window = self._window(session, max_messages or self.max_messages)
+        self.sessions[session.id] = (window, time.monotonic() + self.ttl)
+        self.sessions.move_to_end(session.id)
+        while len(self.sessions) > self.max_sessions:
+            self.sessions.popitem(last=False)
+            self.evictions += 1
+
+    @staticmethod
+    def _window(session: ChatSession, window_size: int) -> ChatSession:
+        """Helper method to copy a session with only its last
+        window_size messages"""
+        window = session.copy()
+        dropped = max(len(window.messages) - window_size, 0)
+        if dropped:
+            window.messages = window.messages[dropped:]
+            window.history_offset += dropped
+        return window
@@ -0,0 +1,286 @@
+from typing import Optional, List
+from datetime import datetime
+from pymongo import ASCENDING, DESCENDING, ReturnDocument, UpdateOne
+
+from src.domain.entities import ChatSession, Message
+from src.application.exceptions import ChatRepositoryException
+from .mongodb_chat_repository import MongoDBChatRepository
+
+
+class MongoDBBucketedChatRepository(MongoDBChatRepository):
+    """
+    MongoDB chat repository that stores messages in fixed-size buckets.
+    Each session has a small header document holding its metadata and
+    message count; its messages live in bucket documents keyed by
+    (session_id, bucket_no), bucket_size messages each. Appends touch
+    only the tail bucket, windowed reads fetch only the last buckets,
+    and no document grows with the length of a conversation.
+
+    Each stored message carries its position in the session as seq.
+    Buckets are kept sorted by seq, so concurrent appends that land out
+    of order still read back in order. Reads locate messages by seq
+    rather than by array index, so positions reserved by a writer that
+    never stored them are skipped instead of shifting later messages.
+    """
+    def __init__(self, uri: str, database: str, bucket_size: int = 100):
+        """
+        Initialize MongoDB connection.
+
+        Args:
+            uri: MongoDB connection URI
+            database: Database name to use
+            bucket_size: Number of messages stored per bucket document
+        """
+        super().__init__(uri, database)
+        self.bucket_size = bucket_size
+        self.sessions = self.db.chat_session_headers
+        self.buckets = self.db.chat_message_buckets
+
+    async def initialize(self) -> None:
+        """Creates the listing index and the bucket key index"""
+        await super().initialize()
+        try:
+            await self.buckets.create_index(
+                [("session_id", ASCENDING), ("bucket_no", ASCENDING)],
+                name="session_bucket",
+                unique=True
+            )
+
+        except Exception as e:
+            raise ChatRepositoryException(
+                f"Error creating indexes: {str(e)}")
+
+    async def save_session(self, session: ChatSession) -> None:
+        """
+        Saves a chat session by appending its unsaved messages to the
+        tail buckets and updating its header.
+
+        Args:
+            session: ChatSession entity to save
+        """
+        try:
+            unsaved = session.get_unsaved_messages()
+
+            # Reserve positions for the new messages; appends from another
+            # writer land after them instead of overwriting them
+            header = await self.sessions.find_one_and_update(
+                {"_id": session.id},
+                {
+                    "$inc": {"message_count": len(unsaved)},
+                    "$set": {
+                        "metadata": session.metadata,
+                        "last_activity": datetime.utcnow()
+                    },
+                    "$setOnInsert": {"created_at": session.created_at}
+                },
+                projection={"message_count": 1},
+                upsert=True,
+                return_document=ReturnDocument.BEFORE
+            )
+            start = header["message_count"] if header else 0
+
+            operations = []
+            for bucket_no, messages in self._group_by_bucket(start, unsaved):
+                operations.append(UpdateOne(
+                    {"session_id": session.id, "bucket_no": bucket_no},
+                    {"$push": {"messages": {
+                        "$each": messages,
+                        "$sort": {"seq": ASCENDING}
+                    }}},
+                    upsert=True
+                ))
+            if operations:
+                await self.buckets.bulk_write(operations, ordered=False)
+
+            session.mark_persisted()
+
+        except Exception as e:
+            raise ChatRepositoryException(f"Error saving session: {str(e)}")
+
+    async def get_session(self, session_id: str) -> Optional[ChatSession]:
+        """
+        Retrieves a chat session with every message.
+
+        Args:
+            session_id: ID of the session to retrieve
+
+        Returns:
+            Optional[ChatSession]: The retrieved session or None if not found
+        """
+        try:
+            header = await self.sessions.find_one({"_id": session_id})
+            if not header:
+                return None
+
+            buckets = self.buckets.find({"session_id": session_id})
+            buckets.sort("bucket_no", ASCENDING)
+            messages = []
+            async for bucket in buckets:
+                messages.extend(self._ordered(bucket["messages"]))
+
+            return self._header_to_session(header, messages)
+
+        except Exception as e:
+            raise ChatRepositoryException(
+                f"Error retrieving session: {str(e)}")
+
+    async def get_session_window(
+        self,
+        session_id: str,
+        window_size: int
+    ) -> Optional[ChatSession]:
+        """
+        Retrieves a chat session with only its most recent messages,
+        reading buckets from the tail until the window is filled.
+
+        Args:
+            session_id: ID of the session to retrieve
+            window_size: Number of most recent messages to load
+
+        Returns:
+            Optional[ChatSession]: The retrieved session or None if not found
+        """
+        try:
+            header = await self.sessions.find_one({"_id": session_id})
+            if not header:
+                return None
+
+            buckets = self.buckets.find({"session_id": session_id})
+            buckets.sort("bucket_no", DESCENDING)
+            # Full buckets cover any window within this many buckets
+            buckets.limit(window_size // self.bucket_size + 2)
+            messages = []
+            async for bucket in buckets:
+                messages[:0] = self._ordered(bucket["messages"])
+                if len(messages) >= window_size:
+                    break
+
+            return self._header_to_session(header,
+                                           messages[-window_size:])
+
+        except Exception as e:
+            raise ChatRepositoryException(
+                f"Error retrieving session: {str(e)}")
+
+    async def get_messages(
+        self,
+        session_id: str,
+        offset: int,
+        limit: int
+    ) -> List[Message]:
+        """
+        Retrieves a range of a session's messages from the buckets that
+        hold it.
+
+        Args:
+            session_id: ID of the session
+            offset: Position of the first message to return
+            limit: Maximum number of messages to return
+
+        Returns:
+            List[Message]: The messages in the range, oldest first
+        """
+        try:
+            if limit <= 0:
+                return []
+            first_bucket = offset // self.bucket_size
+            last_bucket = (offset + limit - 1) // self.bucket_size
+            buckets = self.buckets.find({
+                "session_id": session_id,
+                "bucket_no": {"$gte": first_bucket, "$lte": last_bucket}
+            })
+            buckets.sort("bucket_no", ASCENDING)
+
+            messages = []
+            async for bucket in buckets:
+                messages.extend(
+                    msg for msg in self._ordered(bucket["messages"])
+                    if offset <= msg["seq"] < offset + limit
+                )
+            return [self._dict_to_message(msg) for msg in messages]
+
+        except Exception as e:
+            raise ChatRepositoryException(
+                f"Error retrieving messages: {str(e)}")
+
+    async def delete_session(self, session_id: str) -> None:
+        """
+        Deletes a chat session header and all of its buckets.
+
+        Args:
+            session_id: ID of the session to delete
+        """
+        try:
+            await self.sessions.delete_one({"_id": session_id})
+            await self.buckets.delete_many({"session_id": session_id})
+
+        except Exception as e:
+            raise ChatRepositoryException(f"Error deleting session: {str(e)}")
+
+    async def list_sessions(
+        self,
+        limit: int = 10,
+        offset: int = 0
+    ) -> List[ChatSession]:
+        """
+        Lists chat sessions with pagination, most recently active first.
+
+        Args:
+            limit: Maximum number of sessions to return
+            offset: Number of sessions to skip
+
+        Returns:
+            List[ChatSession]: List of chat sessions
+        """
+        try:
+            cursor = self.sessions.find({}, {"_id": 1})
+            cursor.sort(self.RECENT_FIRST).skip(offset).limit(limit)
+            sessions = []
+
+            async for header in cursor:
+                session = await self.get_session(header["_id"])
+                if session is not None:
+                    sessions.append(session)
+
+            return sessions
+
+        except Exception as e:
+            raise ChatRepositoryException(f"Error listing sessions: {str(e)}")
+
+    def _group_by_bucket(self, start: int, messages: list) -> list:
+        """
+        Helper method to convert messages stored from position start
+        onwards to their stored form, split into (bucket_no, messages)
+        runs.
+        """
+        groups = []
+        for position, message in enumerate(messages, start):
+            bucket_no = position // self.bucket_size
+            stored = {**self._message_to_dict(message), "seq": position}
+            if groups and groups[-1][0] == bucket_no:
+                groups[-1][1].append(stored)
+            else:
+                groups.append((bucket_no, [stored]))
+        return groups
+
+    @staticmethod
+    def _ordered(messages: List[dict]) -> List[dict]:
+        """Helper method to order a bucket's messages by position"""
+        return sorted(messages, key=lambda msg: msg["seq"])
+
+    def _header_to_session(self, header: dict,
+                           messages: List[dict]) -> ChatSession:
+        """Helper method to build a ChatSession from a header and the
+        stored form of its most recent messages"""
+        session = ChatSession(
+            id=str(header["_id"]),
+            messages=[self._dict_to_message(msg) for msg in messages],
+            metadata=header["metadata"],
+            created_at=header["created_at"],
+            last_activity=header["last_activity"]
+        )
+        # Positions before the first loaded message stay in storage
+        session.history_offset = messages[0]["seq"] if messages \
+            else header["message_count"]
+        session.mark_persisted()
+        return session
@@ -1,9 +1,12 @@
-from typing import Optional, List
+import base64
+import json
+from typing import Optional, List, Tuple, Union
 from datetime import datetime
 import motor.motor_asyncio
 from bson import ObjectId
+from pymongo import DESCENDING
 
-from src.domain.entities import ChatSession, Message
+from src.domain.entities import ChatSession, Message, SessionSummary, SessionPage
 from src.domain.value_objects.message_type import MessageType
 from src.application.interfaces.chat_repository_port import ChatRepositoryPort
 from src.application.exceptions import ChatRepositoryException
@@ -14,6 +17,9 @@ class MongoDBChatRepository(ChatRepositoryPort):
     MongoDB implementation of the ChatRepositoryPort.
     Uses Motor for async MongoDB operations.
     """
+    # Sort order of session listings, backed by the last_activity_id index
+    RECENT_FIRST = [("last_activity", DESCENDING), ("_id", DESCENDING)]
+
     def __init__(self, uri: str, database: str):
         """
         Initialize MongoDB connection.
@@ -31,33 +37,96 @@ class MongoDBChatRepository(ChatRepositoryPort):
             raise ChatRepositoryException(
                 f"Error connecting to MongoDB: {str(e)}")
 
+    async def initialize(self) -> None:
+        """Creates the index that session listings sort and page on"""
+        try:
+            await self.sessions.create_index(
+                [("last_activity", DESCENDING), ("_id", DESCENDING)],
+                name="last_activity_id"
+            )
+
+        except Exception as e:
+            raise ChatRepositoryException(
+                f"Error creating indexes: {str(e)}")
+
     async def save_session(self, session: ChatSession) -> None:
         """
         Saves or updates a chat session in MongoDB.
+        Sessions that were saved or loaded before only $push the
+        messages added since then; new sessions are written in full.
 
         Args:
             session: ChatSession entity to save
         """
         try:
-            # Convert session to dictionary
-            session_dict = {
-                "messages": [self._message_to_dict(msg)
-                             for msg in session.messages],
-                "metadata": session.metadata,
-                "created_at": session.created_at,
-                "last_activity": datetime.utcnow()
-            }
+            saved = False
+            if session.persisted_message_count:
+                saved = await self._append_messages(session)
+            if not saved and session.history_offset:
+                # A windowed session cannot be rewritten without losing
+                # the history it never loaded, so append unconditionally
+                saved = await self._append_messages(session, guarded=False)
 
-            # Update or insert session
-            await self.sessions.update_one(
-                {"_id": ObjectId(session.id)},
-                {"$set": session_dict},
-                upsert=True
-            )
+            if not saved:
+                # The stored session now holds exactly these messages
+                session.history_offset = 0
+
+                # Convert session to dictionary
+                session_dict = {
+                    "messages": [self._message_to_dict(msg)
+                                 for msg in session.messages],
+                    "message_count": len(session.messages),
+                    "metadata": session.metadata,
+                    "created_at": session.created_at,
+                    "last_activity": datetime.utcnow()
+                }
+
+                # Update or insert session
+                await self.sessions.update_one(
+                    {"_id": self._session_key(session.id)},
+                    {"$set": session_dict},
+                    upsert=True
+                )
+
+            session.mark_persisted()
 
         except Exception as e:
             raise ChatRepositoryException(f"Error saving session: {str(e)}")
 
+    async def _append_messages(
+        self,
+        session: ChatSession,
+        guarded: bool = True
+    ) -> bool:
+        """
+        Helper method to $push unsaved messages onto a stored session.
+        When guarded, only matches if the stored message count is the one
+        this session last saw, so messages are never appended at the
+        wrong position. On a mismatch the caller falls back.
+
+        Returns:
+            bool: False if the stored session did not match
+        """
+        query = {"_id": self._session_key(session.id)}
+        if guarded:
+            query["message_count"] = session.persisted_message_count
+
+        unsaved = session.get_unsaved_messages()
+        result = await self.sessions.update_one(
+            query,
+            {
+                "$push": {"messages": {"$each": [
+                    self._message_to_dict(msg) for msg in unsaved
+                ]}},
+                "$inc": {"message_count": len(unsaved)},
+                "$set": {
+                    "metadata": session.metadata,
+                    "last_activity": datetime.utcnow()
+                }
+            }
+        )
+        return result.matched_count == 1
+
     async def get_session(self, session_id: str) -> Optional[ChatSession]:
         """
         Retrieves a chat session by ID.
@@ -70,7 +139,7 @@ class MongoDBChatRepository(ChatRepositoryPort):
         """
         try:
             session_dict = await self.sessions.find_one(
-                {"_id": ObjectId(session_id)}
+                {"_id": self._session_key(session_id)}
             )
 
             if not session_dict:
@@ -82,6 +151,75 @@ class MongoDBChatRepository(ChatRepositoryPort):
             raise ChatRepositoryException(
                 f"Error retrieving session: {str(e)}")
 
+    async def get_session_window(
+        self,
+        session_id: str,
+        window_size: int
+    ) -> Optional[ChatSession]:
+        """
+        Retrieves a chat session with only its last window_size messages,
+        trimmed server-side with a $slice projection.
+
+        Args:
+            session_id: ID of the session to retrieve
+            window_size: Number of most recent messages to load
+
+        Returns:
+            Optional[ChatSession]: The retrieved session or None if not found
+        """
+        try:
+            session_dict = await self.sessions.find_one(
+                {"_id": self._session_key(session_id)},
+                {"messages": {"$slice": -window_size}}
+            )
+
+            if not session_dict:
+                return None
+
+            if "message_count" not in session_dict:
+                # Without a stored count the offset is unknown; load the
+                # full session so its next save rewrites it with one
+                return await self.get_session(session_id)
+
+            return self._dict_to_session(session_dict)
+
+        except Exception as e:
+            raise ChatRepositoryException(
+                f"Error retrieving session: {str(e)}")
+
+    async def get_messages(
+        self,
+        session_id: str,
+        offset: int,
+        limit: int
+    ) -> List[Message]:
+        """
+        Retrieves a range of a session's messages, sliced server-side.
+
+        Args:
+            session_id: ID of the session
+            offset: Position of the first message to return
+            limit: Maximum number of messages to return
+
+        Returns:
+            List[Message]: The messages in the range, oldest first
+        """
+        try:
+            session_dict = await self.sessions.find_one(
+                {"_id": self._session_key(session_id)},
+                {"messages": {"$slice": [offset, limit]}}
+            )
+
+            if not session_dict:
+                return []
+
+            return [self._dict_to_message(msg)
+                    for msg in session_dict["messages"]]
+
+        except Exception as e:
+            raise ChatRepositoryException(
+                f"Error retrieving messages: {str(e)}")
+
     async def delete_session(self, session_id: str) -> None:
         """
         Deletes a chat session.
@@ -90,7 +228,7 @@ class MongoDBChatRepository(ChatRepositoryPort):
             session_id: ID of the session to delete
         """
         try:
-            await self.sessions.delete_one({"_id": ObjectId(session_id)})
+            await self.sessions.delete_one({"_id": self._session_key(session_id)})
 
         except Exception as e:
             raise ChatRepositoryException(f"Error deleting session: {str(e)}")
@@ -112,7 +250,7 @@ class MongoDBChatRepository(ChatRepositoryPort):
         """
         try:
             cursor = self.sessions.find()
-            cursor.skip(offset).limit(limit)
+            cursor.sort(self.RECENT_FIRST).skip(offset).limit(limit)
             sessions = []
 
             async for session_dict in cursor:
@@ -123,6 +261,97 @@ class MongoDBChatRepository(ChatRepositoryPort):
         except Exception as e:
             raise ChatRepositoryException(f"Error listing sessions: {str(e)}")
 
+    async def list_session_summaries(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None
+    ) -> SessionPage:
+        """
+        Lists session summaries, most recently active first.
+        Pages by keyset on the indexed (last_activity, _id) pair, so deep
+        pages cost the same as the first, and never loads messages.
+
+        Args:
+            limit: Maximum number of sessions to return
+            cursor: next_cursor of the previous page, if any
+
+        Returns:
+            SessionPage: Summaries and the cursor of the next page
+        """
+        try:
+            query = {}
+            if cursor:
+                last_activity, last_id = self._decode_cursor(cursor)
+                query = {"$or": [
+                    {"last_activity": {"$lt": last_activity}},
+                    {"last_activity": last_activity, "_id": {"$lt": last_id}}
+                ]}
+
+            documents = self.sessions.find(query, {
+                # Sessions written before message_count existed are
+                # counted server-side
+                "message_count": {"$ifNull": [
+                    "$message_count",
+                    {"$size": {"$ifNull": ["$messages", []]}}
+                ]},
+                "metadata": 1,
+                "created_at": 1,
+                "last_activity": 1
+            })
+            # One extra row tells whether another page follows
+            documents.sort(self.RECENT_FIRST).limit(limit + 1)
+
+            rows = [row async for row in documents]
+            page = SessionPage(sessions=[
+                SessionSummary(
+                    id=str(row["_id"]),
+                    message_count=row["message_count"],
+                    created_at=row["created_at"],
+                    last_activity=row["last_activity"],
+                    metadata=row["metadata"]
+                )
+                for row in rows[:limit]
+            ])
+            if len(rows) > limit:
+                last = rows[limit - 1]
+                page.next_cursor = self._encode_cursor(
+                    last["last_activity"], last["_id"])
+            return page
+
+        except Exception as e:
+            raise ChatRepositoryException(f"Error listing sessions: {str(e)}")
+
+    async def close(self) -> None:
+        """Closes the MongoDB client"""
+        self.client.close()
+
+    def _session_key(self, session_id: str) -> Union[ObjectId, str]:
+        """Helper method to map a session ID to its _id; IDs that are not
+        ObjectIds, such as UUIDs, are stored as strings"""
+        return ObjectId(session_id) if ObjectId.is_valid(session_id) \
+            else session_id
+
+    def _encode_cursor(self, last_activity: datetime,
+                       session_id: Union[ObjectId, str]) -> str:
+        """Helper method to encode a page position as an opaque cursor"""
+        position = [last_activity.isoformat(), str(session_id),
+                    isinstance(session_id, ObjectId)]
+        return base64.urlsafe_b64encode(
+            json.dumps(position).encode()).decode()
+
+    def _decode_cursor(
+        self,
+        cursor: str
+    ) -> Tuple[datetime, Union[ObjectId, str]]:
+        """Helper method to decode a cursor made by _encode_cursor"""
+        try:
+            last_activity, session_id, is_object_id = json.loads(
+                base64.urlsafe_b64decode(cursor.encode()))
+            return (datetime.fromisoformat(last_activity),
+                    ObjectId(session_id) if is_object_id else session_id)
+        except Exception:
+            raise ValueError(f"Invalid cursor: {cursor}")
+
     def _message_to_dict(self, message: Message) -> dict:
         """Helper method to convert Message entity to dictionary"""
         return {
@@ -147,7 +376,7 @@ class MongoDBChatRepository(ChatRepositoryPort):
 
     def _dict_to_session(self, session_dict: dict) -> ChatSession:
         """Helper method to convert dictionary to ChatSession entity"""
-        return ChatSession(
+        session = ChatSession(
             id=str(session_dict["_id"]),
             messages=[
                 self._dict_to_message(msg)
@@ -157,3 +386,10 @@ class MongoDBChatRepository(ChatRepositoryPort):
             created_at=session_dict["created_at"],
             last_activity=session_dict["last_activity"]
         )
+        # Sessions written before message_count existed are rewritten
+        # in full on their next save
+        if "message_count" in session_dict:
+            session.history_offset = \
+                session_dict["message_count"] - len(session.messages)
+            session.mark_persisted()
+        return session
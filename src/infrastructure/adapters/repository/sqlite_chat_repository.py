@@ -0,0 +1,472 @@
+import asyncio
+import base64
+import json
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Optional, List, Tuple
+
+from src.domain.entities import ChatSession, Message, SessionSummary, SessionPage
+from src.domain.value_objects.message_type import MessageType
+from src.application.interfaces.chat_repository_port import ChatRepositoryPort
+from src.application.exceptions import ChatRepositoryException
+
+
+class SQLiteChatRepository(ChatRepositoryPort):
+    """
+    Embedded SQLite implementation of the ChatRepositoryPort for
+    single-node deployments.
+    Sessions and their messages live in separate tables, messages keyed
+    by (session_id, seq). The database runs in WAL mode: reads use a
+    pool of reader threads while every write goes through one writer
+    thread, which commits all writes queued meanwhile in one transaction.
+    """
+    def __init__(self, path: str, read_workers: int = 4):
+        """
+        Open (or create) the database.
+
+        Args:
+            path: SQLite database file
+            read_workers: Number of reader threads
+        """
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.path = path
+
+            self.writer = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="chat-db-writer"
+            )
+            self.readers = ThreadPoolExecutor(
+                max_workers=read_workers,
+                thread_name_prefix="chat-db-reader"
+            )
+            self.write_connection = self.writer.submit(
+                self._connect_writer).result()
+            self.local = threading.local()
+            self.read_connections: List[sqlite3.Connection] = []
+
+            # Writes waiting for the writer thread's next transaction
+            self.pending_writes: List[tuple] = []
+            self.flushing = False
+
+        except Exception as e:
+            raise ChatRepositoryException(
+                f"Error opening SQLite database: {str(e)}")
+
+    async def save_session(self, session: ChatSession) -> None:
+        """
+        Saves a chat session by appending its unsaved messages.
+        Returns once the transaction holding the write is committed.
+
+        Args:
+            session: ChatSession entity to save
+        """
+        try:
+            messages = [
+                (msg.id, msg.content, msg.role, msg.type.value,
+                 msg.timestamp.isoformat(), json.dumps(msg.metadata))
+                for msg in session.get_unsaved_messages()
+            ]
+            await self._write(
+                self._save, session.id, json.dumps(session.metadata),
+                session.created_at.isoformat(),
+                datetime.utcnow().isoformat(), messages)
+            session.mark_persisted()
+
+        except Exception as e:
+            raise ChatRepositoryException(f"Error saving session: {str(e)}")
+
+    async def get_session(self, session_id: str) -> Optional[ChatSession]:
+        """
+        Retrieves a chat session by ID.
+
+        Args:
+            session_id: ID of the session to retrieve
+
+        Returns:
+            Optional[ChatSession]: The retrieved session or None if not found
+        """
+        try:
+            return await self._read(self._load, session_id, None)
+
+        except Exception as e:
+            raise ChatRepositoryException(
+                f"Error retrieving session: {str(e)}")
+
+    async def get_session_window(
+        self,
+        session_id: str,
+        window_size: int
+    ) -> Optional[ChatSession]:
+        """
+        Retrieves a chat session with only its last window_size messages.
+
+        Args:
+            session_id: ID of the session to retrieve
+            window_size: Number of most recent messages to load
+
+        Returns:
+            Optional[ChatSession]: The retrieved session or None if not found
+        """
+        try:
+            return await self._read(self._load, session_id, window_size)
+
+        except Exception as e:
+            raise ChatRepositoryException(
+                f"Error retrieving session: {str(e)}")
+
+    async def get_messages(
+        self,
+        session_id: str,
+        offset: int,
+        limit: int
+    ) -> List[Message]:
+        """
+        Retrieves a range of a session's messages by sequence number.
+
+        Args:
+            session_id: ID of the session
+            offset: Position of the first message to return
+            limit: Maximum number of messages to return
+
+        Returns:
+            List[Message]: The messages in the range, oldest first
+        """
+        try:
+            return await self._read(self._load_range, session_id, offset,
+                                    limit)
+
+        except Exception as e:
+            raise ChatRepositoryException(
+                f"Error retrieving messages: {str(e)}")
+
+    async def delete_session(self, session_id: str) -> None:
+        """
+        Deletes a chat session and its messages.
+
+        Args:
+            session_id: ID of the session to delete
+        """
+        try:
+            await self._write(self._delete, session_id)
+
+        except Exception as e:
+            raise ChatRepositoryException(f"Error deleting session: {str(e)}")
+
+    async def list_sessions(
+        self,
+        limit: int = 10,
+        offset: int = 0
+    ) -> List[ChatSession]:
+        """
+        Lists chat sessions with pagination, most recently active first.
+
+        Args:
+            limit: Maximum number of sessions to return
+            offset: Number of sessions to skip
+
+        Returns:
+            List[ChatSession]: List of chat sessions
+        """
+        try:
+            return await self._read(self._list, limit, offset)
+
+        except Exception as e:
+            raise ChatRepositoryException(f"Error listing sessions: {str(e)}")
+
+    async def list_session_summaries(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None
+    ) -> SessionPage:
+        """
+        Lists session summaries, most recently active first, paging by
+        keyset on the indexed (last_activity, id) pair.
+
+        Args:
+            limit: Maximum number of sessions to return
+            cursor: next_cursor of the previous page, if any
+
+        Returns:
+            SessionPage: Summaries and the cursor of the next page
+        """
+        try:
+            position = self._decode_cursor(cursor) if cursor else None
+            return await self._read(self._summaries, limit, position)
+
+        except Exception as e:
+            raise ChatRepositoryException(f"Error listing sessions: {str(e)}")
+
+    async def close(self) -> None:
+        """Waits for queued writes, then closes every connection"""
+        while self.pending_writes or self.flushing:
+            await asyncio.sleep(0.01)
+        self.writer.submit(self.write_connection.close).result()
+        self.writer.shutdown(wait=True)
+        self.readers.shutdown(wait=True)
+        for connection in self.read_connections:
+            connection.close()
+
+    def _connect_writer(self) -> sqlite3.Connection:
+        """Opens the writer connection and creates the schema"""
+        # Transactions are managed explicitly, one per write batch
+        connection = sqlite3.connect(self.path, isolation_level=None,
+                                     check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            " id TEXT PRIMARY KEY,"
+            " metadata TEXT NOT NULL,"
+            " created_at TEXT NOT NULL,"
+            " last_activity TEXT NOT NULL,"
+            " message_count INTEGER NOT NULL DEFAULT 0);"
+            "CREATE INDEX IF NOT EXISTS sessions_last_activity"
+            " ON sessions (last_activity DESC, id DESC);"
+            "CREATE TABLE IF NOT EXISTS messages ("
+            " session_id TEXT NOT NULL,"
+            " seq INTEGER NOT NULL,"
+            " id TEXT NOT NULL,"
+            " content TEXT NOT NULL,"
+            " role TEXT NOT NULL,"
+            " type TEXT NOT NULL,"
+            " timestamp TEXT NOT NULL,"
+            " metadata TEXT NOT NULL,"
+            " PRIMARY KEY (session_id, seq)) WITHOUT ROWID;"
+        )
+        return connection
+
+    def _reader(self) -> sqlite3.Connection:
+        """Returns the calling reader thread's connection"""
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            self.local.connection = connection
+            self.read_connections.append(connection)
+        return connection
+
+    async def _read(self, func, *args):
+        """Helper method to run a query on the reader pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.readers, partial(func, *args))
+
+    async def _write(self, func, *args) -> None:
+        """
+        Helper method to queue a write for the writer thread and wait for
+        the transaction that commits it.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.pending_writes.append((func, args, future))
+        if not self.flushing:
+            self.flushing = True
+            asyncio.ensure_future(self._flush_writes())
+        await future
+
+    async def _flush_writes(self) -> None:
+        """Commits queued writes in batches until the queue is empty"""
+        loop = asyncio.get_running_loop()
+        try:
+            while self.pending_writes:
+                batch, self.pending_writes = self.pending_writes, []
+                try:
+                    errors = await loop.run_in_executor(
+                        self.writer, self._commit_batch, batch)
+                except Exception as e:
+                    errors = [e] * len(batch)
+                for (_, _, future), error in zip(batch, errors):
+                    if future.done():
+                        continue
+                    if error is None:
+                        future.set_result(None)
+                    else:
+                        future.set_exception(error)
+        finally:
+            self.flushing = False
+
+    def _commit_batch(self, batch: List[tuple]) -> List[Optional[Exception]]:
+        """
+        Applies a batch of writes in one transaction. Each write runs in
+        its own savepoint, so a failing write is rolled back alone.
+        """
+        connection = self.write_connection
+        errors = []
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for func, args, _ in batch:
+                connection.execute("SAVEPOINT write")
+                try:
+                    func(connection, *args)
+                    errors.append(None)
+                except Exception as e:
+                    connection.execute("ROLLBACK TO write")
+                    errors.append(e)
+                connection.execute("RELEASE write")
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        return errors
+
+    def _save(
+        self,
+        connection: sqlite3.Connection,
+        session_id: str,
+        metadata: str,
+        created_at: str,
+        last_activity: str,
+        messages: List[tuple]
+    ) -> None:
+        """Appends messages after the stored ones and updates the session"""
+        row = connection.execute(
+            "SELECT message_count FROM sessions WHERE id = ?",
+            (session_id,)).fetchone()
+        start = row[0] if row else 0
+
+        connection.executemany(
+            "INSERT INTO messages (session_id, seq, id, content, role,"
+            " type, timestamp, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(session_id, seq, *message)
+             for seq, message in enumerate(messages, start)]
+        )
+        connection.execute(
+            "INSERT INTO sessions (id, metadata, created_at, last_activity,"
+            " message_count) VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT (id) DO UPDATE SET"
+            " metadata = excluded.metadata,"
+            " last_activity = excluded.last_activity,"
+            " message_count = message_count + ?",
+            (session_id, metadata, created_at, last_activity,
+             len(messages), len(messages))
+        )
+
+    def _delete(self, connection: sqlite3.Connection,
+                session_id: str) -> None:
+        """Removes a session and its messages"""
+        connection.execute("DELETE FROM messages WHERE session_id = ?",
+                           (session_id,))
+        connection.execute("DELETE FROM sessions WHERE id = ?",
+                           (session_id,))
+
+    def _load(self, session_id: str,
+              window_size: Optional[int]) -> Optional[ChatSession]:
+        """Loads a session with all messages or only the last few"""
+        connection = self._reader()
+        # Read the header and the messages from one snapshot, so a commit
+        # in between cannot skew history_offset
+        connection.execute("BEGIN")
+        try:
+            return self._load_snapshot(connection, session_id, window_size)
+        finally:
+            connection.commit()
+
+    def _load_snapshot(self, connection: sqlite3.Connection,
+                       session_id: str,
+                       window_size: Optional[int]) -> Optional[ChatSession]:
+        """Helper method to load a session inside a read transaction"""
+        header = connection.execute(
+            "SELECT id, metadata, created_at, last_activity, message_count"
+            " FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        if header is None:
+            return None
+
+        columns = "id, content, role, type, timestamp, metadata"
+        if window_size is None:
+            rows = connection.execute(
+                f"SELECT {columns} FROM messages WHERE session_id = ?"
+                " ORDER BY seq", (session_id,)).fetchall()
+        else:
+            rows = connection.execute(
+                f"SELECT {columns} FROM messages WHERE session_id = ?"
+                " ORDER BY seq DESC LIMIT ?",
+                (session_id, window_size)).fetchall()
+            rows.reverse()
+
+        _, metadata, created_at, last_activity, message_count = header
+        session = ChatSession(
+            id=session_id,
+            messages=[self._row_to_message(row) for row in rows],
+            metadata=json.loads(metadata),
+            created_at=datetime.fromisoformat(created_at),
+            last_activity=datetime.fromisoformat(last_activity)
+        )
+        session.history_offset = message_count - len(session.messages)
+        session.mark_persisted()
+        return session
+
+    def _load_range(self, session_id: str, offset: int,
+                    limit: int) -> List[Message]:
+        """Loads the messages in a range of sequence numbers"""
+        rows = self._reader().execute(
+            "SELECT id, content, role, type, timestamp, metadata"
+            " FROM messages WHERE session_id = ? AND seq >= ?"
+            " ORDER BY seq LIMIT ?", (session_id, offset, limit)).fetchall()
+        return [self._row_to_message(row) for row in rows]
+
+    def _list(self, limit: int, offset: int) -> List[ChatSession]:
+        """Loads a page of full sessions, most recently active first"""
+        ids = self._reader().execute(
+            "SELECT id FROM sessions ORDER BY last_activity DESC, id DESC"
+            " LIMIT ? OFFSET ?", (limit, offset)).fetchall()
+        return [self._load(session_id, None) for session_id, in ids]
+
+    def _summaries(self, limit: int,
+                   position: Optional[Tuple[str, str]]) -> SessionPage:
+        """Loads a page of session summaries after a keyset position"""
+        query = ("SELECT id, message_count, created_at, last_activity,"
+                 " metadata FROM sessions")
+        params: tuple = ()
+        if position:
+            query += " WHERE (last_activity, id) < (?, ?)"
+            params = position
+        query += " ORDER BY last_activity DESC, id DESC LIMIT ?"
+
+        # One extra row tells whether another page follows
+        rows = self._reader().execute(query, (*params, limit + 1)).fetchall()
+        page = SessionPage(sessions=[
+            SessionSummary(
+                id=session_id,
+                message_count=message_count,
+                created_at=datetime.fromisoformat(created_at),
+                last_activity=datetime.fromisoformat(last_activity),
+                metadata=json.loads(metadata)
+            )
+            for session_id, message_count, created_at, last_activity,
+            metadata in rows[:limit]
+        ])
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            page.next_cursor = self._encode_cursor(last[3], last[0])
+        return page
+
+    def _encode_cursor(self, last_activity: str, session_id: str) -> str:
+        """Helper method to encode a page position as an opaque cursor"""
+        return base64.urlsafe_b64encode(
+            json.dumps([last_activity, session_id]).encode()).decode()
+
+    def _decode_cursor(self, cursor: str) -> Tuple[str, str]:
+        """Helper method to decode a cursor made by _encode_cursor"""
+        try:
+            last_activity, session_id = json.loads(
+                base64.urlsafe_b64decode(cursor.encode()))
+            return last_activity, session_id
+        except Exception:
+            raise ValueError(f"Invalid cursor: {cursor}")
+
+    def _row_to_message(self, row: tuple) -> Message:
+        """Helper method to convert a messages row to a Message entity"""
+        message_id, content, role, message_type, timestamp, metadata = row
+        return Message(
+            id=message_id,
+            content=content,
+            role=role,
+            type=MessageType(message_type),
+            timestamp=datetime.fromisoformat(timestamp),
+            metadata=json.loads(metadata)
+        )
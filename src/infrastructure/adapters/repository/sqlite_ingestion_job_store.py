@@ -0,0 +1,252 @@
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Optional
+
+from src.domain.entities import Document, IngestionJob, IngestionProgress
+from src.domain.value_objects.job_status import JobStatus
+from src.application.interfaces.ingestion_job_store_port import IngestionJobStorePort
+from src.application.exceptions import IngestionJobException
+
+
+class SQLiteIngestionJobStore(IngestionJobStorePort):
+    """
+    Durable ingestion job queue in a local SQLite file.
+    Each job is one row holding its documents and progress, so queued
+    and interrupted jobs survive a restart. Claiming a job is a single
+    UPDATE ... RETURNING, so processes sharing the file never claim the
+    same job while its lease is live. A running job's heartbeat_at is
+    renewed by every update, and updates from an attempt whose job was
+    claimed again are ignored. The documents of a succeeded job are
+    dropped.
+    """
+    # Columns of a job row other than its documents
+    COLUMNS = ("id, status, chunk_size, total_chunks, embedded_chunks,"
+               " stored_chunks, error, attempts, created_at, started_at,"
+               " finished_at")
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the job database.
+
+        Args:
+            path: SQLite database file
+        """
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # The connection stays on the single worker thread
+            self.executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="ingestion-jobs"
+            )
+            self.connection = self.executor.submit(
+                self._connect, path).result()
+
+        except Exception as e:
+            raise IngestionJobException(
+                f"Error opening job database: {str(e)}")
+
+    async def enqueue_job(self, job: IngestionJob) -> None:
+        """
+        Stores a new job as queued.
+
+        Args:
+            job: IngestionJob entity to enqueue
+        """
+        try:
+            documents = json.dumps([
+                {
+                    "id": document.id,
+                    "content": document.content,
+                    "source": document.source,
+                    "metadata": document.metadata
+                }
+                for document in job.documents
+            ])
+            await self._run(
+                self.connection.execute,
+                "INSERT INTO jobs (id, status, chunk_size, documents,"
+                " total_chunks, embedded_chunks, stored_chunks, attempts,"
+                " created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (job.id, job.status.value, job.chunk_size, documents,
+                 job.progress.total_chunks, job.progress.embedded_chunks,
+                 job.progress.stored_chunks, job.attempts,
+                 job.created_at.isoformat())
+            )
+
+        except Exception as e:
+            raise IngestionJobException(f"Error enqueuing job: {str(e)}")
+
+    async def claim_job(self, lease_timeout: float) -> Optional[IngestionJob]:
+        """
+        Marks the oldest queued or lease-expired job as running and
+        returns it.
+
+        Args:
+            lease_timeout: Seconds without a heartbeat after which a
+                running job may be claimed again
+
+        Returns:
+            Optional[IngestionJob]: The claimed job with its documents, or
+                None if the queue is empty
+        """
+        try:
+            return await self._run(self._claim, datetime.utcnow(),
+                                   time.time(), lease_timeout)
+
+        except Exception as e:
+            raise IngestionJobException(f"Error claiming job: {str(e)}")
+
+    async def update_job(self, job: IngestionJob) -> bool:
+        """
+        Stores a job's status, progress and error and renews its lease.
+
+        Args:
+            job: IngestionJob entity to update
+
+        Returns:
+            bool: False if the job was claimed again since this attempt
+                started; nothing is written then
+        """
+        try:
+            cursor = await self._run(
+                self.connection.execute,
+                "UPDATE jobs SET status = ?, total_chunks = ?,"
+                " embedded_chunks = ?, stored_chunks = ?, error = ?,"
+                " finished_at = ?, heartbeat_at = ?,"
+                " documents = CASE WHEN ? THEN NULL ELSE documents END"
+                " WHERE id = ? AND attempts = ?",
+                (job.status.value, job.progress.total_chunks,
+                 job.progress.embedded_chunks, job.progress.stored_chunks,
+                 job.error, self._timestamp(job.finished_at), time.time(),
+                 job.status == JobStatus.SUCCEEDED, job.id, job.attempts)
+            )
+            return cursor.rowcount == 1
+
+        except Exception as e:
+            raise IngestionJobException(f"Error updating job: {str(e)}")
+
+    async def get_job(self, job_id: str) -> Optional[IngestionJob]:
+        """
+        Retrieves a job's status.
+
+        Args:
+            job_id: ID of the job to retrieve
+
+        Returns:
+            Optional[IngestionJob]: The job without its documents, or None
+                if not found
+        """
+        try:
+            row = await self._run(self._fetch_one,
+                                  f"SELECT {self.COLUMNS}, NULL FROM jobs"
+                                  " WHERE id = ?", (job_id,))
+            return self._row_to_job(row) if row else None
+
+        except Exception as e:
+            raise IngestionJobException(f"Error retrieving job: {str(e)}")
+
+    async def close(self) -> None:
+        """Closes the database connection"""
+        self.executor.submit(self.connection.close).result()
+        self.executor.shutdown(wait=True)
+
+    async def _run(self, function, *args):
+        """Helper method to run a blocking call on the database thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor,
+                                          partial(function, *args))
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        """Opens the database and creates the job table"""
+        connection = sqlite3.connect(path, isolation_level=None,
+                                     timeout=5.0)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY,"
+            " status TEXT NOT NULL,"
+            " chunk_size INTEGER,"
+            " documents TEXT,"
+            " total_chunks INTEGER NOT NULL,"
+            " embedded_chunks INTEGER NOT NULL,"
+            " stored_chunks INTEGER NOT NULL,"
+            " error TEXT,"
+            " attempts INTEGER NOT NULL,"
+            " created_at TEXT NOT NULL,"
+            " started_at TEXT,"
+            " finished_at TEXT,"
+            " heartbeat_at REAL)")
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS jobs_queue"
+            " ON jobs (status, created_at)")
+        return connection
+
+    def _claim(self, now: datetime, heartbeat: float,
+               lease_timeout: float) -> Optional[IngestionJob]:
+        """Claims the oldest available job in one statement"""
+        row = self._fetch_one(
+            "UPDATE jobs SET status = :running, attempts = attempts + 1,"
+            " started_at = :now, heartbeat_at = :heartbeat"
+            " WHERE id = (SELECT id FROM jobs WHERE status = :queued"
+            "  OR (status = :running AND heartbeat_at < :expired)"
+            "  ORDER BY created_at LIMIT 1)"
+            f" RETURNING {self.COLUMNS}, documents",
+            {"running": JobStatus.RUNNING.value, "now": now.isoformat(),
+             "heartbeat": heartbeat, "queued": JobStatus.QUEUED.value,
+             "expired": heartbeat - lease_timeout}
+        )
+        return self._row_to_job(row) if row else None
+
+    def _fetch_one(self, sql: str, parameters) -> Optional[tuple]:
+        """Helper method to run a statement and return its first row.
+        Fetching every row completes the statement, releasing its lock."""
+        rows = self.connection.execute(sql, parameters).fetchall()
+        return rows[0] if rows else None
+
+    def _row_to_job(self, row: tuple) -> IngestionJob:
+        """Helper method to convert a job row to an IngestionJob"""
+        (job_id, status, chunk_size, total_chunks, embedded_chunks,
+         stored_chunks, error, attempts, created_at, started_at,
+         finished_at, documents) = row
+        return IngestionJob(
+            id=job_id,
+            status=JobStatus(status),
+            chunk_size=chunk_size,
+            documents=[
+                Document(
+                    id=document["id"],
+                    content=document["content"],
+                    source=document["source"],
+                    metadata=document["metadata"]
+                )
+                for document in json.loads(documents or "[]")
+            ],
+            progress=IngestionProgress(
+                total_chunks=total_chunks,
+                embedded_chunks=embedded_chunks,
+                stored_chunks=stored_chunks
+            ),
+            error=error,
+            attempts=attempts,
+            created_at=datetime.fromisoformat(created_at),
+            started_at=self._parse(started_at),
+            finished_at=self._parse(finished_at)
+        )
+
+    @staticmethod
+    def _timestamp(value: Optional[datetime]) -> Optional[str]:
+        """Helper method to store an optional datetime"""
+        return value.isoformat() if value else None
+
+    @staticmethod
+    def _parse(value: Optional[str]) -> Optional[datetime]:
+        """Helper method to load an optional datetime"""
+        return datetime.fromisoformat(value) if value else None
@@ -0,0 +1,281 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional, Set
+
+from src.domain.entities import ChatSession, Message, SessionPage
+from src.application.interfaces.chat_repository_port import ChatRepositoryPort
+from src.application.exceptions import ChatRepositoryException
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindChatRepository(ChatRepositoryPort):
+    """
+    Write-behind decorator around another ChatRepositoryPort.
+    save_session only snapshots the session into a pending buffer and
+    returns; background workers persist it to the wrapped repository.
+    Repeated saves of a session that is still pending coalesce into a
+    single write of the latest snapshot.
+
+    Reads of a session with a pending write are served from the buffer,
+    so a client always sees its own writes. list_sessions reads the
+    wrapped repository and may lag behind pending writes.
+
+    A snapshot whose write keeps failing stays buffered and is retried
+    after a longer pause; flush() and close() raise while any session
+    remains unwritten, so data is never dropped silently.
+    """
+    def __init__(
+        self,
+        repository: ChatRepositoryPort,
+        max_pending: int = 1000,
+        max_retries: int = 5,
+        retry_delay: float = 0.5,
+        workers: int = 2
+    ):
+        """
+        Initialize the write-behind decorator.
+
+        Args:
+            repository: Repository that durably stores sessions
+            max_pending: Maximum number of sessions waiting to be written.
+                Saves wait for room once the buffer is full.
+            max_retries: Retries of a failed write before it is put
+                aside and tried again later
+            retry_delay: Delay before the first retry, doubled each time
+            workers: Number of background writer tasks
+        """
+        self.repository = repository
+        self.max_pending = max_pending
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.workers = workers
+        # Latest unsaved snapshot of each session
+        self._pending: Dict[str, ChatSession] = {}
+        # Sessions queued for a worker, and sessions being written
+        self._queued: Set[str] = set()
+        self._saving: Set[str] = set()
+        # Sessions whose last write exhausted its retries
+        self._failed: Set[str] = set()
+        self._retry_tasks: Set[asyncio.Task] = set()
+        self._queue: Optional[asyncio.Queue] = None
+        self._saved: Optional[asyncio.Condition] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def save_session(self, session: ChatSession) -> None:
+        """
+        Buffers a snapshot of the session for a background write.
+        Returns as soon as the snapshot is queued.
+
+        Args:
+            session: ChatSession entity to save
+        """
+        self._ensure_workers()
+        self._pending[session.id] = session.copy()
+
+        # A queued session picks up the new snapshot when it is written
+        await self._enqueue(session.id)
+
+    async def get_session(self, session_id: str) -> Optional[ChatSession]:
+        """Retrieves a chat session, preferring its pending snapshot"""
+        if session_id in self._pending:
+            return self._pending[session_id].copy()
+        return await self.repository.get_session(session_id)
+
+    async def get_session_window(
+        self,
+        session_id: str,
+        window_size: int
+    ) -> Optional[ChatSession]:
+        """
+        Retrieves a windowed chat session, preferring its pending snapshot.
+        The snapshot is returned whole; callers only look at its tail.
+        """
+        if session_id in self._pending:
+            return self._pending[session_id].copy()
+        return await self.repository.get_session_window(session_id,
+                                                        window_size)
+
+    async def get_messages(
+        self,
+        session_id: str,
+        offset: int,
+        limit: int
+    ) -> List[Message]:
+        """
+        Retrieves a range of messages, from the pending snapshot when it
+        holds the whole range.
+        """
+        pending = self._pending.get(session_id)
+        if pending is not None and offset >= pending.history_offset:
+            start = offset - pending.history_offset
+            return pending.messages[start:start + limit]
+        return await self.repository.get_messages(session_id, offset, limit)
+
+    async def delete_session(self, session_id: str) -> None:
+        """
+        Deletes a chat session, discarding any pending write.
+        Waits for an in-flight write so it cannot recreate the session.
+        """
+        self._pending.pop(session_id, None)
+        self._failed.discard(session_id)
+        if self._saved is not None:
+            async with self._saved:
+                await self._saved.wait_for(
+                    lambda: session_id not in self._saving)
+        await self.repository.delete_session(session_id)
+
+    async def list_sessions(
+        self,
+        limit: int = 10,
+        offset: int = 0
+    ) -> List[ChatSession]:
+        """Lists persisted chat sessions from the wrapped repository"""
+        return await self.repository.list_sessions(limit=limit,
+                                                   offset=offset)
+
+    async def list_session_summaries(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None
+    ) -> SessionPage:
+        """Lists persisted session summaries from the wrapped repository"""
+        return await self.repository.list_session_summaries(limit=limit,
+                                                            cursor=cursor)
+
+    async def initialize(self) -> None:
+        """Prepares the wrapped repository"""
+        await self.repository.initialize()
+
+    def lock_session(self, session_id: str):
+        """Delegates session locking to the wrapped repository"""
+        return self.repository.lock_session(session_id)
+
+    async def flush(self) -> None:
+        """
+        Waits until every buffered session has been written.
+
+        Raises:
+            ChatRepositoryException: If some sessions could not be
+                written; they stay buffered and are retried later
+        """
+        if self._queue is not None:
+            await self._queue.join()
+        if self._failed:
+            raise ChatRepositoryException(
+                f"Sessions not written: {', '.join(sorted(self._failed))}")
+
+    async def close(self) -> None:
+        """
+        Flushes pending writes, stops the workers and closes the
+        wrapped repository. Sessions waiting for a later retry are
+        tried once more first.
+
+        Raises:
+            ChatRepositoryException: If some sessions could not be
+                written before closing
+        """
+        try:
+            for session_id in list(self._failed):
+                await self._enqueue(session_id)
+            await self.flush()
+        finally:
+            tasks = [*self._retry_tasks, *self._tasks]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._tasks = []
+            await self.repository.close()
+
+    def _ensure_workers(self) -> None:
+        """Starts the background writers inside the running event loop"""
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._saved = asyncio.Condition()
+        self._tasks = [
+            asyncio.ensure_future(self._worker())
+            for _ in range(self.workers)
+        ]
+
+    async def _enqueue(self, session_id: str) -> None:
+        """Helper method to queue a session for a worker once"""
+        if session_id not in self._queued:
+            self._queued.add(session_id)
+            await self._queue.put(session_id)
+
+    async def _retry_later(self, session_id: str) -> None:
+        """Queues a session that failed to write again after a pause"""
+        await asyncio.sleep(self.retry_delay * 2 ** (self.max_retries + 1))
+        if session_id in self._pending:
+            await self._enqueue(session_id)
+
+    async def _worker(self) -> None:
+        """Writes queued sessions until cancelled"""
+        while True:
+            session_id = await self._queue.get()
+            self._queued.discard(session_id)
+            try:
+                # Another worker writing this session also writes any
+                # snapshot that arrived in the meantime
+                if session_id not in self._saving:
+                    await self._write(session_id)
+            finally:
+                self._queue.task_done()
+
+    async def _write(self, session_id: str) -> None:
+        """Writes the latest snapshot of a session until none is newer"""
+        self._saving.add(session_id)
+        try:
+            while session_id in self._pending:
+                session = self._pending[session_id]
+                if not await self._save_with_retry(session):
+                    # Keep the snapshot buffered and try again later
+                    self._failed.add(session_id)
+                    task = asyncio.ensure_future(
+                        self._retry_later(session_id))
+                    self._retry_tasks.add(task)
+                    task.add_done_callback(self._retry_tasks.discard)
+                    return
+
+                self._failed.discard(session_id)
+                newer = self._pending.get(session_id)
+                if newer is session:
+                    del self._pending[session_id]
+                elif newer is not None and \
+                        self._derives_from(newer, session):
+                    # The newer snapshot only needs its own messages added
+                    newer.persisted_message_count = max(
+                        newer.persisted_message_count,
+                        session.persisted_message_count)
+        finally:
+            self._saving.discard(session_id)
+            async with self._saved:
+                self._saved.notify_all()
+
+    async def _save_with_retry(self, session: ChatSession) -> bool:
+        """Saves a snapshot, backing off between failed attempts.
+        Returns whether it was saved."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self.repository.save_session(session)
+                return True
+            except Exception as e:
+                if attempt == self.max_retries:
+                    logger.error(
+                        f"Write of session {session.id} failed after "
+                        f"{attempt + 1} attempts; keeping it buffered "
+                        f"for a later retry: {str(e)}")
+                    return False
+                logger.warning(
+                    f"Retrying write of session {session.id}: {str(e)}")
+                await asyncio.sleep(self.retry_delay * 2 ** attempt)
+
+    def _derives_from(self, newer: ChatSession,
+                      older: ChatSession) -> bool:
+        """Helper method to check that newer extends older's history"""
+        if not older.messages:
+            return True
+        index = older.message_count - 1 - newer.history_offset
+        return 0 <= index < len(newer.messages) and \
+            newer.messages[index].id == older.messages[-1].id
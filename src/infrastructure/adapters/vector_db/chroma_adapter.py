@@ -1,5 +1,9 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import List, Optional
 import chromadb
+import numpy as np
 
 from src.domain.entities import Document, Embedding
 from src.application.interfaces.vector_db_port import VectorDBPort
@@ -10,9 +14,15 @@ class ChromaDBAdapter(VectorDBPort):
     """
     Adapter for ChromaDB implementing the VectorDBPort interface.
     Handles storage and retrieval of document embeddings.
+
+    The Chroma HTTP client is synchronous, so every collection call is
+    offloaded to a dedicated bounded thread pool and never blocks the
+    event loop.
     """
     def __init__(self, host: str, port: int,
-                 collection_name: str = "documents"):
+                 collection_name: str = "documents",
+                 batch_size: int = 1000,
+                 max_workers: int = 8):
         """
         Initialize ChromaDB connection and collection.
 
@@ -20,7 +30,17 @@ class ChromaDBAdapter(VectorDBPort):
             host: ChromaDB host address
             port: ChromaDB port number
             collection_name: Name of the collection to use
+            batch_size: Maximum number of records per bulk write call
+            max_workers: Maximum number of concurrent Chroma calls. Keep
+                this within the HTTP client's connection pool size (10)
+                so every worker reuses a kept-alive connection.
         """
+        self.batch_size = batch_size
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="chromadb"
+        )
+
         try:
             self.client = chromadb.HttpClient(
                 host=host,
@@ -46,20 +66,49 @@ class ChromaDBAdapter(VectorDBPort):
             embedding: Embedding vector for the document
         """
         try:
-            self.collection.add(
+            await self._run(
+                self.collection.add,
                 ids=[document.id],
-                embeddings=[embedding.vector],
-                metadatas=[{
-                    **document.metadata,
-                    "source": document.source,
-                    "embedding_model": embedding.model
-                }],
+                embeddings=self._to_lists([embedding]),
+                metadatas=[self._build_metadata(document, embedding)],
                 documents=[document.content]
             )
 
         except Exception as e:
             raise VectorDBException(f"Error storing embedding: {str(e)}")
 
+    async def store_embeddings(self, documents: List[Document],
+                               embeddings: List[Embedding]) -> None:
+        """
+        Stores documents and their embeddings in ChromaDB in batches.
+
+        Args:
+            documents: Document entities to store
+            embeddings: Embedding vector for each document
+        """
+        try:
+            await self._run(self._write_batches, self.collection.add,
+                            documents, embeddings)
+
+        except Exception as e:
+            raise VectorDBException(f"Error storing embeddings: {str(e)}")
+
+    async def upsert_embeddings(self, documents: List[Document],
+                                embeddings: List[Embedding]) -> None:
+        """
+        Inserts or replaces documents and their embeddings in batches.
+
+        Args:
+            documents: Document entities to insert or replace
+            embeddings: Embedding vector for each document
+        """
+        try:
+            await self._run(self._write_batches, self.collection.upsert,
+                            documents, embeddings)
+
+        except Exception as e:
+            raise VectorDBException(f"Error upserting embeddings: {str(e)}")
+
     async def search_similar(
         self,
         embedding: Embedding,
@@ -79,31 +128,51 @@ class ChromaDBAdapter(VectorDBPort):
         """
         try:
             # Perform similarity search
-            results = self.collection.query(
-                query_embeddings=[embedding.vector],
+            results = await self._run(
+                self.collection.query,
+                query_embeddings=self._to_lists([embedding]),
                 n_results=limit,
                 include=['documents', 'metadatas', 'distances']
             )
 
-            documents = []
-            for i in range(len(results['ids'][0])):
-                # Skip if below threshold
-                if (score_threshold is not None and
-                        results['distances'][0][i] > score_threshold):
-                    continue
-
-                doc = Document(
-                    id=results['ids'][0][i],
-                    content=results['documents'][0][i],
-                    source=results['metadatas'][0][i].get('source', ''),
-                    metadata={
-                        **results['metadatas'][0][i],
-                        'similarity_score': 1 - results['distances'][0][i]
-                    }
-                )
-                documents.append(doc)
-
-            return documents
+            return self._to_documents(results, 0, score_threshold)
+
+        except Exception as e:
+            raise VectorDBException(
+                f"Error searching similar documents: {str(e)}")
+
+    async def search_similar_batch(
+        self,
+        embeddings: List[Embedding],
+        limit: int = 3,
+        score_threshold: Optional[float] = None
+    ) -> List[List[Document]]:
+        """
+        Searches for similar documents for several queries in one call.
+
+        Args:
+            embeddings: Query embeddings to search with
+            limit: Maximum number of results to return per query
+            score_threshold: Minimum similarity score threshold
+
+        Returns:
+            List[List[Document]]: Results for each query, in input order
+        """
+        if not embeddings:
+            return []
+
+        try:
+            results = await self._run(
+                self.collection.query,
+                query_embeddings=self._to_lists(embeddings),
+                n_results=limit,
+                include=['documents', 'metadatas', 'distances']
+            )
+
+            return [
+                self._to_documents(results, i, score_threshold)
+                for i in range(len(embeddings))
+            ]
 
         except Exception as e:
             raise VectorDBException(
@@ -117,7 +186,67 @@ class ChromaDBAdapter(VectorDBPort):
             document_id: ID of the document to delete
         """
         try:
-            self.collection.delete(ids=[document_id])
+            await self._run(self.collection.delete, ids=[document_id])
 
         except Exception as e:
             raise VectorDBException(f"Error deleting document: {str(e)}")
+
+    async def _run(self, func, *args, **kwargs):
+        """Helper method to run a blocking Chroma call on the worker pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, partial(func, *args, **kwargs))
+
+    def _write_batches(self, write, documents: List[Document],
+                       embeddings: List[Embedding]) -> None:
+        """Helper method to send records to a collection method in batches"""
+        if len(documents) != len(embeddings):
+            raise ValueError("Each document requires exactly one embedding")
+
+        for start in range(0, len(documents), self.batch_size):
+            batch = list(zip(documents[start:start + self.batch_size],
+                             embeddings[start:start + self.batch_size]))
+            write(
+                ids=[doc.id for doc, _ in batch],
+                embeddings=self._to_lists([emb for _, emb in batch]),
+                metadatas=[self._build_metadata(doc, emb)
+                           for doc, emb in batch],
+                documents=[doc.content for doc, _ in batch]
+            )
+
+    def _to_documents(self, results: dict, query: int,
+                      score_threshold: Optional[float]) -> List[Document]:
+        """Helper method to convert one query's results to documents"""
+        documents = []
+        for i in range(len(results['ids'][query])):
+            # Skip if below threshold
+            if (score_threshold is not None and
+                    results['distances'][query][i] > score_threshold):
+                continue
+
+            doc = Document(
+                id=results['ids'][query][i],
+                content=results['documents'][query][i],
+                source=results['metadatas'][query][i].get('source', ''),
+                metadata={
+                    **results['metadatas'][query][i],
+                    'similarity_score': 1 - results['distances'][query][i]
+                }
+            )
+            documents.append(doc)
+
+        return documents
+
+    def _to_lists(self, embeddings: List[Embedding]) -> List[List[float]]:
+        """Helper method to convert vectors to the lists Chroma expects"""
+        return np.asarray([emb.vector for emb in embeddings],
+                          dtype=np.float32).tolist()
+
+    def _build_metadata(self, document: Document,
+                        embedding: Embedding) -> dict:
+        """Helper method to build the metadata stored with a record"""
+        return {
+            **document.metadata,
+            "source": document.source,
+            "embedding_model": embedding.model
+        }
@@ -0,0 +1,186 @@
+import json
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.domain.entities import Document
+
+
+class SQLiteDocumentStore:
+    """
+    Side store for in-process vector indexes.
+    Keeps document content and metadata in SQLite, keyed by the integer
+    row (or label) the vector occupies in the index, plus a small
+    key/value table for index metadata.
+
+    Not thread-safe on its own; callers serialize access.
+    """
+    def __init__(self, path: str):
+        """
+        Open (or create) the store.
+
+        Args:
+            path: SQLite database file
+        """
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(
+            "CREATE TABLE IF NOT EXISTS documents ("
+            " row INTEGER PRIMARY KEY,"
+            " id TEXT NOT NULL,"
+            " content TEXT NOT NULL,"
+            " source TEXT NOT NULL,"
+            " metadata TEXT NOT NULL,"
+            " deleted INTEGER NOT NULL DEFAULT 0);"
+            "CREATE INDEX IF NOT EXISTS documents_id ON documents (id);"
+            "CREATE INDEX IF NOT EXISTS documents_deleted"
+            " ON documents (deleted) WHERE deleted = 1;"
+            "CREATE TABLE IF NOT EXISTS pending_vectors ("
+            " row INTEGER PRIMARY KEY,"
+            " vector BLOB NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS meta ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL);"
+        )
+        self.connection.commit()
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Returns an index metadata value"""
+        row = self.connection.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        """Sets an index metadata value (committed with the next write)"""
+        self.connection.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            (key, value))
+
+    def next_row(self) -> int:
+        """Returns the first unused row number"""
+        row = self.connection.execute(
+            "SELECT MAX(row) FROM documents").fetchone()
+        return 0 if row[0] is None else row[0] + 1
+
+    def deleted_rows(self) -> List[int]:
+        """Returns rows that are tombstoned but not yet compacted"""
+        return [row for row, in self.connection.execute(
+            "SELECT row FROM documents WHERE deleted = 1")]
+
+    def live_count(self) -> int:
+        """Returns the number of documents that are not tombstoned"""
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM documents WHERE deleted = 0").fetchone()[0]
+
+    def purge_deleted(self) -> None:
+        """Removes tombstoned documents for good"""
+        self.connection.execute("DELETE FROM documents WHERE deleted = 1")
+
+    def rows_for_ids(self, ids: Iterable[str]) -> Dict[str, int]:
+        """Returns the live row of each known document id"""
+        ids = list(ids)
+        found = {}
+        # Stay well below SQLite's bound parameter limit
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(self.connection.execute(
+                "SELECT id, row FROM documents"
+                f" WHERE deleted = 0 AND id IN ({placeholders})",
+                chunk
+            ))
+        return found
+
+    def insert(self, rows: List[Tuple[int, Document, dict]]) -> None:
+        """
+        Adds documents at the given rows.
+        Live records with the same ids are tombstoned first.
+        """
+        ids = [(document.id,) for _, document, _ in rows]
+        self.connection.executemany(
+            "UPDATE documents SET deleted = 1"
+            " WHERE id = ? AND deleted = 0", ids)
+        self.connection.executemany(
+            "INSERT INTO documents (row, id, content, source, metadata)"
+            " VALUES (?, ?, ?, ?, ?)",
+            [
+                (row, document.id, document.content, document.source,
+                 json.dumps(metadata))
+                for row, document, metadata in rows
+            ]
+        )
+
+    def mark_deleted(self, rows: List[int]) -> None:
+        """Tombstones the documents at the given rows"""
+        self.connection.executemany(
+            "UPDATE documents SET deleted = 1 WHERE row = ?",
+            [(row,) for row in rows]
+        )
+
+    def get_rows(self, rows: List[int]) -> Dict[int, Document]:
+        """Loads the documents stored at the given rows"""
+        found = {}
+        for start in range(0, len(rows), 500):
+            chunk = [int(row) for row in rows[start:start + 500]]
+            placeholders = ",".join("?" * len(chunk))
+            for row, doc_id, content, source, metadata in \
+                    self.connection.execute(
+                        "SELECT row, id, content, source, metadata"
+                        f" FROM documents WHERE row IN ({placeholders})",
+                        chunk):
+                found[row] = Document(
+                    id=doc_id,
+                    content=content,
+                    source=source,
+                    metadata=json.loads(metadata)
+                )
+        return found
+
+    def compact(self) -> List[int]:
+        """
+        Purges tombstoned documents and renumbers the remaining rows
+        densely from zero, preserving their order.
+
+        Returns:
+            List[int]: The previous row of each remaining document, in
+            new row order
+        """
+        self.connection.execute("DELETE FROM documents WHERE deleted = 1")
+        old_rows = [row for row, in self.connection.execute(
+            "SELECT row FROM documents ORDER BY row")]
+        # Ascending order never collides: every new row is <= its old row
+        self.connection.executemany(
+            "UPDATE documents SET row = ? WHERE row = ?",
+            [(new, old) for new, old in enumerate(old_rows) if new != old]
+        )
+        return old_rows
+
+    def append_pending_vectors(self, rows: List[Tuple[int, bytes]]) -> None:
+        """
+        Journals raw vectors that are not yet in an index snapshot, so
+        they can be replayed after a restart.
+        """
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO pending_vectors (row, vector)"
+            " VALUES (?, ?)", rows)
+
+    def pending_vectors(self) -> List[Tuple[int, bytes]]:
+        """Returns journaled vectors in row order"""
+        return list(self.connection.execute(
+            "SELECT row, vector FROM pending_vectors ORDER BY row"))
+
+    def clear_pending_vectors(self) -> None:
+        """Empties the vector journal once a snapshot covers it"""
+        self.connection.execute("DELETE FROM pending_vectors")
+
+    def commit(self) -> None:
+        """Commits pending writes"""
+        self.connection.commit()
+
+    def rollback(self) -> None:
+        """Discards pending writes"""
+        self.connection.rollback()
+
+    def close(self) -> None:
+        """Closes the database connection"""
+        self.connection.close()
@@ -0,0 +1,471 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Optional, Tuple
+import hnswlib
+import numpy as np
+
+from src.domain.entities import Document, Embedding
+from src.application.interfaces.vector_db_port import VectorDBPort
+from src.application.exceptions import VectorDBException
+from .document_store import SQLiteDocumentStore
+
+
+class HNSWVectorDBAdapter(VectorDBPort):
+    """
+    Embedded approximate nearest neighbour index implementing the
+    VectorDBPort interface on top of hnswlib (CPU only).
+    Content and metadata live in a SQLite side store keyed by the
+    integer label of each vector.
+
+    The graph is persisted as periodic on-disk snapshots. Vectors and
+    deletes made since the last snapshot are journaled in the side store
+    and replayed on start, so no acknowledged write is lost.
+    Deleted slots are reused by later inserts.
+
+    Writes are serialized by one lock, while searches run concurrently
+    with them; only growing the graph waits for in-flight searches.
+    """
+    def __init__(
+        self,
+        path: str,
+        M: int = 16,
+        ef_construction: int = 200,
+        ef_search: int = 64,
+        initial_capacity: int = 10000,
+        snapshot_interval: int = 10000,
+        max_workers: int = 4
+    ):
+        """
+        Open (or create) the index.
+
+        Args:
+            path: Directory holding the snapshot and side store
+            M: Graph out-degree; higher improves recall and uses memory
+            ef_construction: Build-time candidate list size; higher
+                improves graph quality and slows inserts
+            ef_search: Query-time candidate list size; higher improves
+                recall and slows searches
+            initial_capacity: Elements allocated when the index is created
+            snapshot_interval: Journaled vectors that trigger a snapshot
+            max_workers: Maximum number of concurrent index operations
+        """
+        self.path = path
+        self.M = M
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.initial_capacity = initial_capacity
+        self.snapshot_interval = snapshot_interval
+        self.snapshot_path = os.path.join(path, "index.bin")
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="hnsw-index"
+        )
+        self.lock = threading.RLock()
+        # The side store shares one connection between threads
+        self.store_lock = threading.Lock()
+        # Resizing reallocates the graph, so it excludes searches
+        self.resize_condition = threading.Condition()
+        self.searches = 0
+        self.resizing = False
+
+        try:
+            os.makedirs(path, exist_ok=True)
+            self.store = SQLiteDocumentStore(
+                os.path.join(path, "documents.sqlite3"))
+            self._load()
+
+        except Exception as e:
+            raise VectorDBException(
+                f"Error initializing HNSW index: {str(e)}")
+
+    async def store_embedding(self, document: Document,
+                              embedding: Embedding) -> None:
+        """
+        Stores a document and its embedding in the index.
+
+        Args:
+            document: Document entity to store
+            embedding: Embedding vector for the document
+        """
+        try:
+            await self._run(self._write, [document], [embedding])
+
+        except Exception as e:
+            raise VectorDBException(f"Error storing embedding: {str(e)}")
+
+    async def store_embeddings(self, documents: List[Document],
+                               embeddings: List[Embedding]) -> None:
+        """
+        Inserts documents and their embeddings in one write.
+        Documents whose id is already stored replace the old record.
+
+        Args:
+            documents: Document entities to store
+            embeddings: Embedding vector for each document
+        """
+        try:
+            await self._run(self._write, documents, embeddings)
+
+        except Exception as e:
+            raise VectorDBException(f"Error storing embeddings: {str(e)}")
+
+    async def upsert_embeddings(self, documents: List[Document],
+                                embeddings: List[Embedding]) -> None:
+        """
+        Inserts or replaces documents and their embeddings.
+
+        Args:
+            documents: Document entities to insert or replace
+            embeddings: Embedding vector for each document
+        """
+        try:
+            await self._run(self._write, documents, embeddings)
+
+        except Exception as e:
+            raise VectorDBException(f"Error upserting embeddings: {str(e)}")
+
+    async def search_similar(
+        self,
+        embedding: Embedding,
+        limit: int = 3,
+        score_threshold: Optional[float] = None
+    ) -> List[Document]:
+        """
+        Searches for approximately nearest documents by cosine distance.
+
+        Args:
+            embedding: Query embedding to search with
+            limit: Maximum number of results to return
+            score_threshold: Maximum cosine distance of returned results
+
+        Returns:
+            List[Document]: List of similar documents
+        """
+        try:
+            results = await self._run(
+                self._search, embedding.vector[np.newaxis], limit,
+                score_threshold)
+            return results[0]
+
+        except Exception as e:
+            raise VectorDBException(
+                f"Error searching similar documents: {str(e)}")
+
+    async def search_similar_batch(
+        self,
+        embeddings: List[Embedding],
+        limit: int = 3,
+        score_threshold: Optional[float] = None
+    ) -> List[List[Document]]:
+        """
+        Searches for similar documents for several queries at once.
+
+        Args:
+            embeddings: Query embeddings to search with
+            limit: Maximum number of results to return per query
+            score_threshold: Maximum cosine distance of returned results
+
+        Returns:
+            List[List[Document]]: Results for each query, in input order
+        """
+        if not embeddings:
+            return []
+
+        try:
+            return await self._run(
+                self._search,
+                np.stack([emb.vector for emb in embeddings]),
+                limit,
+                score_threshold
+            )
+
+        except Exception as e:
+            raise VectorDBException(
+                f"Error searching similar documents: {str(e)}")
+
+    async def delete_document(self, document_id: str) -> None:
+        """
+        Deletes a document and its embedding from the index.
+
+        Args:
+            document_id: ID of the document to delete
+        """
+        try:
+            await self._run(self._delete, [document_id])
+
+        except Exception as e:
+            raise VectorDBException(f"Error deleting document: {str(e)}")
+
+    async def snapshot(self) -> None:
+        """Writes the graph to disk and truncates the vector journal"""
+        try:
+            await self._run(self._snapshot)
+
+        except Exception as e:
+            raise VectorDBException(f"Error saving HNSW snapshot: {str(e)}")
+
+    def set_ef_search(self, ef_search: int) -> None:
+        """
+        Changes the query-time candidate list size of later searches.
+
+        Args:
+            ef_search: Query-time candidate list size; higher improves
+                recall and slows searches
+        """
+        with self.lock:
+            self.ef_search = ef_search
+            if self.index is not None:
+                self.index.set_ef(ef_search)
+
+    async def _run(self, func, *args):
+        """Helper method to run an index operation on the worker pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args))
+
+    def _load(self) -> None:
+        """Loads the latest snapshot and replays the journal"""
+        dimension = self.store.get_meta("dimension")
+        self.dimension = int(dimension) if dimension else None
+        self.next_label = int(self.store.get_meta("next_label") or 0)
+        self.live = self.store.live_count()
+        self.pending = 0
+        self.index = None
+
+        if self.dimension is None:
+            return
+
+        self.index = hnswlib.Index(space="cosine", dim=self.dimension)
+        if os.path.exists(self.snapshot_path):
+            self.index.load_index(self.snapshot_path,
+                                  allow_replace_deleted=True)
+        else:
+            self._init_index(self.index)
+        # ef only changes through set_ef_search; hnswlib widens it per
+        # query when k is larger
+        self.index.set_ef(self.ef_search)
+
+        # Replay writes and deletes made since the snapshot
+        pending = self.store.pending_vectors()
+        if pending:
+            labels = np.array([row for row, _ in pending])
+            vectors = np.stack([np.frombuffer(blob, dtype=np.float32)
+                                for _, blob in pending])
+            self._ensure_capacity(len(labels))
+            self.index.add_items(vectors, labels, replace_deleted=True)
+            self.pending = len(pending)
+        for label in self.store.deleted_rows():
+            self._mark_deleted(label)
+
+    def _init_index(self, index: hnswlib.Index) -> None:
+        """Allocates an empty graph"""
+        index.init_index(
+            max_elements=self.initial_capacity,
+            ef_construction=self.ef_construction,
+            M=self.M,
+            allow_replace_deleted=True
+        )
+
+    def _ensure_capacity(self, additional: int) -> None:
+        """Doubles the graph capacity until additional elements fit"""
+        required = self.index.get_current_count() + additional
+        capacity = self.index.get_max_elements()
+        if required <= capacity:
+            return
+        while capacity < required:
+            capacity *= 2
+
+        with self.resize_condition:
+            self.resizing = True
+            self.resize_condition.wait_for(lambda: self.searches == 0)
+            try:
+                self.index.resize_index(capacity)
+            finally:
+                self.resizing = False
+                self.resize_condition.notify_all()
+
+    def _mark_deleted(self, label: int) -> None:
+        """Marks a label deleted, ignoring labels already gone"""
+        try:
+            self.index.mark_deleted(label)
+        except RuntimeError:
+            pass
+
+    def _write(self, documents: List[Document],
+               embeddings: List[Embedding]) -> None:
+        """Inserts records, deleting older records with the same ids"""
+        if len(documents) != len(embeddings):
+            raise ValueError("Each document requires exactly one embedding")
+
+        # The last record wins when an id repeats within one write
+        records = {doc.id: (doc, emb) for doc, emb in zip(documents, embeddings)}
+        if not records:
+            return
+        documents = [doc for doc, _ in records.values()]
+        embeddings = [emb for _, emb in records.values()]
+        vectors = np.stack([emb.vector for emb in embeddings])
+
+        with self.lock:
+            if self.dimension is None:
+                self._create_index(vectors.shape[1])
+            elif vectors.shape[1] != self.dimension:
+                raise ValueError(
+                    f"Expected {self.dimension}-dimensional vectors, "
+                    f"got {vectors.shape[1]}")
+
+            start = self.next_label
+            labels = np.arange(start, start + len(documents))
+
+            with self.store_lock:
+                replaced = list(self.store.rows_for_ids(
+                    doc.id for doc in documents).values())
+                self._insert_records(labels, documents, embeddings, vectors)
+
+            for label in replaced:
+                self._mark_deleted(label)
+            self._ensure_capacity(len(labels))
+            self.index.add_items(vectors, labels, replace_deleted=True)
+
+            self.next_label = start + len(labels)
+            self.live += len(labels) - len(replaced)
+            self.pending += len(labels)
+            if self.pending >= self.snapshot_interval:
+                self._snapshot()
+
+    def _create_index(self, dimension: int) -> None:
+        """Creates the graph for the first write, fixing its dimension"""
+        index = hnswlib.Index(space="cosine", dim=dimension)
+        self._init_index(index)
+        index.set_ef(self.ef_search)
+
+        with self.store_lock:
+            self.store.set_meta("dimension", str(dimension))
+        self.dimension = dimension
+        # Publish the graph only once searches can use it
+        self.index = index
+
+    def _insert_records(self, labels: np.ndarray, documents: List[Document],
+                        embeddings: List[Embedding],
+                        vectors: np.ndarray) -> None:
+        """Helper method to store records and journal their vectors"""
+        start = int(labels[0])
+        try:
+            self.store.insert([
+                (int(label), doc, {
+                    **doc.metadata,
+                    "source": doc.source,
+                    "embedding_model": emb.model
+                })
+                for label, doc, emb in zip(labels, documents, embeddings)
+            ])
+            self.store.append_pending_vectors([
+                (int(label), vector.tobytes())
+                for label, vector in zip(labels, vectors)
+            ])
+            self.store.set_meta("next_label", str(start + len(labels)))
+            self.store.commit()
+
+        except Exception:
+            self.store.rollback()
+            raise
+
+    def _delete(self, document_ids: List[str]) -> None:
+        """Deletes the records of the given document ids"""
+        with self.lock:
+            with self.store_lock:
+                rows = list(self.store.rows_for_ids(document_ids).values())
+                if not rows:
+                    return
+
+                self.store.mark_deleted(rows)
+                self.store.commit()
+            for label in rows:
+                self._mark_deleted(label)
+            self.live -= len(rows)
+
+    def _snapshot(self) -> None:
+        """
+        Saves the graph beside the current snapshot and swaps it in.
+        A crash before the journal is truncated only replays vectors
+        that the new snapshot already holds, which is harmless.
+        """
+        with self.lock:
+            if self.index is None:
+                return
+
+            temporary = self.snapshot_path + ".tmp"
+            self.index.save_index(temporary)
+            os.replace(temporary, self.snapshot_path)
+
+            with self.store_lock:
+                self.store.clear_pending_vectors()
+                self.store.purge_deleted()
+                self.store.commit()
+            self.pending = 0
+
+    def _knn_query(self, vectors: np.ndarray,
+                   k: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Helper method to query the graph without blocking writers.
+        Returns None when there is no element to return.
+        """
+        index = self.index
+        if index is None or k <= 0:
+            return None
+
+        with self.resize_condition:
+            self.resize_condition.wait_for(lambda: not self.resizing)
+            self.searches += 1
+
+        try:
+            while k > 0:
+                try:
+                    return index.knn_query(vectors, k=k)
+                except RuntimeError:
+                    # A concurrent delete left fewer than k elements
+                    k = min(k - 1, self.live)
+            return None
+
+        finally:
+            with self.resize_condition:
+                self.searches -= 1
+                self.resize_condition.notify_all()
+
+    def _search(self, vectors: np.ndarray, limit: int,
+                score_threshold: Optional[float]) -> List[List[Document]]:
+        """Approximate top-k search for a matrix of queries in one call"""
+        result = self._knn_query(vectors, min(limit, self.live))
+        if result is None:
+            return [[] for _ in range(len(vectors))]
+
+        labels, distances = result
+        with self.store_lock:
+            stored = self.store.get_rows(np.unique(labels).tolist())
+
+        results = []
+        for row_labels, row_distances in zip(labels.tolist(),
+                                             distances.tolist()):
+            documents = []
+            for label, distance in zip(row_labels, row_distances):
+                # Skip if below threshold
+                if score_threshold is not None and \
+                        distance > score_threshold:
+                    continue
+
+                document = stored.get(label)
+                if document is None:
+                    continue
+                documents.append(Document(
+                    id=document.id,
+                    content=document.content,
+                    source=document.source,
+                    metadata={
+                        **document.metadata,
+                        "similarity_score": 1.0 - distance
+                    }
+                ))
+            results.append(documents)
+
+        return results
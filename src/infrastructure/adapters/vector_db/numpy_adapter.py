@@ -0,0 +1,418 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Optional
+import numpy as np
+
+from src.domain.entities import Document, Embedding
+from src.application.interfaces.vector_db_port import VectorDBPort
+from src.application.exceptions import VectorDBException
+from .document_store import SQLiteDocumentStore
+
+
+class NumpyVectorDBAdapter(VectorDBPort):
+    """
+    In-process vector index implementing the VectorDBPort interface.
+    Normalized float32 vectors live in a memory-mapped matrix file and
+    are searched exactly with one matrix product plus argpartition.
+    Content and metadata live in a SQLite side store.
+
+    Deletes are tombstoned and reclaimed by compaction once they exceed
+    compaction_ratio of the stored rows. Cold start only maps the matrix
+    file, so opening a large index does not read it into memory.
+    """
+    def __init__(
+        self,
+        path: str,
+        initial_capacity: int = 1024,
+        compaction_ratio: float = 0.2,
+        max_workers: int = 4
+    ):
+        """
+        Open (or create) the index.
+
+        Args:
+            path: Directory holding the matrix file and side store
+            initial_capacity: Rows allocated when the matrix is created
+            compaction_ratio: Fraction of tombstoned rows that triggers
+                compaction
+            max_workers: Maximum number of concurrent index operations
+        """
+        self.path = path
+        self.initial_capacity = initial_capacity
+        self.compaction_ratio = compaction_ratio
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="vector-index"
+        )
+        self.lock = threading.RLock()
+
+        try:
+            os.makedirs(path, exist_ok=True)
+            self.store = SQLiteDocumentStore(
+                os.path.join(path, "documents.sqlite3"))
+            self._load()
+
+        except Exception as e:
+            raise VectorDBException(
+                f"Error initializing vector index: {str(e)}")
+
+    async def store_embedding(self, document: Document,
+                              embedding: Embedding) -> None:
+        """
+        Stores a document and its embedding in the index.
+
+        Args:
+            document: Document entity to store
+            embedding: Embedding vector for the document
+        """
+        try:
+            await self._run(self._write, [document], [embedding])
+
+        except Exception as e:
+            raise VectorDBException(f"Error storing embedding: {str(e)}")
+
+    async def store_embeddings(self, documents: List[Document],
+                               embeddings: List[Embedding]) -> None:
+        """
+        Appends documents and their embeddings in one write.
+        Documents whose id is already stored replace the old record.
+
+        Args:
+            documents: Document entities to store
+            embeddings: Embedding vector for each document
+        """
+        try:
+            await self._run(self._write, documents, embeddings)
+
+        except Exception as e:
+            raise VectorDBException(f"Error storing embeddings: {str(e)}")
+
+    async def upsert_embeddings(self, documents: List[Document],
+                                embeddings: List[Embedding]) -> None:
+        """
+        Inserts or replaces documents and their embeddings.
+
+        Args:
+            documents: Document entities to insert or replace
+            embeddings: Embedding vector for each document
+        """
+        try:
+            await self._run(self._write, documents, embeddings)
+
+        except Exception as e:
+            raise VectorDBException(f"Error upserting embeddings: {str(e)}")
+
+    async def search_similar(
+        self,
+        embedding: Embedding,
+        limit: int = 3,
+        score_threshold: Optional[float] = None
+    ) -> List[Document]:
+        """
+        Searches for similar documents by cosine similarity.
+
+        Args:
+            embedding: Query embedding to search with
+            limit: Maximum number of results to return
+            score_threshold: Maximum cosine distance of returned results
+
+        Returns:
+            List[Document]: List of similar documents
+        """
+        try:
+            results = await self._run(
+                self._search, embedding.vector[np.newaxis], limit,
+                score_threshold)
+            return results[0]
+
+        except Exception as e:
+            raise VectorDBException(
+                f"Error searching similar documents: {str(e)}")
+
+    async def search_similar_batch(
+        self,
+        embeddings: List[Embedding],
+        limit: int = 3,
+        score_threshold: Optional[float] = None
+    ) -> List[List[Document]]:
+        """
+        Searches for similar documents for several queries at once.
+
+        Args:
+            embeddings: Query embeddings to search with
+            limit: Maximum number of results to return per query
+            score_threshold: Maximum cosine distance of returned results
+
+        Returns:
+            List[List[Document]]: Results for each query, in input order
+        """
+        if not embeddings:
+            return []
+
+        try:
+            return await self._run(
+                self._search,
+                np.stack([emb.vector for emb in embeddings]),
+                limit,
+                score_threshold
+            )
+
+        except Exception as e:
+            raise VectorDBException(
+                f"Error searching similar documents: {str(e)}")
+
+    async def delete_document(self, document_id: str) -> None:
+        """
+        Tombstones a document and its embedding.
+
+        Args:
+            document_id: ID of the document to delete
+        """
+        try:
+            await self._run(self._delete, [document_id])
+
+        except Exception as e:
+            raise VectorDBException(f"Error deleting document: {str(e)}")
+
+    async def compact(self) -> None:
+        """Rewrites the matrix without tombstoned rows"""
+        try:
+            await self._run(self._compact)
+
+        except Exception as e:
+            raise VectorDBException(f"Error compacting index: {str(e)}")
+
+    async def _run(self, func, *args):
+        """Helper method to run an index operation on the worker pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args))
+
+    def _load(self) -> None:
+        """Maps the current matrix file and rebuilds the tombstone mask"""
+        dimension = self.store.get_meta("dimension")
+        self.dimension = int(dimension) if dimension else None
+        self.generation = int(self.store.get_meta("generation") or 0)
+        self.count = self.store.next_row()
+        self.matrix = None
+        self.alive = np.zeros(0, dtype=bool)
+
+        if self.dimension is not None:
+            capacity = max(self.count, self.initial_capacity)
+            self.matrix = self._open_matrix(self.generation, capacity)
+            self.alive = np.zeros(self.matrix.shape[0], dtype=bool)
+            self.alive[:self.count] = True
+            self.alive[self.store.deleted_rows()] = False
+
+        self._remove_stale_files()
+
+    def _matrix_path(self, generation: int) -> str:
+        """Returns the matrix file for a generation"""
+        return os.path.join(self.path, f"vectors-{generation}.f32")
+
+    def _open_matrix(self, generation: int, capacity: int) -> np.memmap:
+        """Maps a matrix file, growing it to at least capacity rows"""
+        path = self._matrix_path(generation)
+        row_bytes = self.dimension * np.dtype(np.float32).itemsize
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        rows = max(size // row_bytes, capacity)
+        if size < rows * row_bytes:
+            with open(path, "ab") as f:
+                f.truncate(rows * row_bytes)
+        return np.memmap(path, dtype=np.float32, mode="r+",
+                         shape=(rows, self.dimension))
+
+    def _remove_stale_files(self) -> None:
+        """Deletes matrix files left behind by earlier generations"""
+        current = os.path.basename(self._matrix_path(self.generation))
+        for name in os.listdir(self.path):
+            if name.startswith("vectors-") and name != current:
+                os.remove(os.path.join(self.path, name))
+
+    def _normalize(self, vectors: np.ndarray) -> np.ndarray:
+        """Scales vectors to unit length so dot products are cosines"""
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.maximum(norms, np.finfo(np.float32).tiny)
+
+    def _write(self, documents: List[Document],
+               embeddings: List[Embedding]) -> None:
+        """Appends records, tombstoning older records with the same ids"""
+        if len(documents) != len(embeddings):
+            raise ValueError("Each document requires exactly one embedding")
+        # The last record wins when an id repeats within one write
+        records = {doc.id: (doc, emb) for doc, emb in zip(documents, embeddings)}
+        if not records:
+            return
+        documents = [doc for doc, _ in records.values()]
+        embeddings = [emb for _, emb in records.values()]
+
+        vectors = self._normalize(np.stack([emb.vector for emb in embeddings]))
+
+        with self.lock:
+            if self.dimension is None:
+                self.dimension = vectors.shape[1]
+                self.store.set_meta("dimension", str(self.dimension))
+                self.matrix = self._open_matrix(self.generation,
+                                                self.initial_capacity)
+                self.alive = np.zeros(self.matrix.shape[0], dtype=bool)
+            elif vectors.shape[1] != self.dimension:
+                raise ValueError(
+                    f"Expected {self.dimension}-dimensional vectors, "
+                    f"got {vectors.shape[1]}")
+
+            start = self.count
+            end = start + len(documents)
+            if end > self.matrix.shape[0]:
+                self._grow(end)
+
+            replaced = list(self.store.rows_for_ids(
+                doc.id for doc in documents).values())
+
+            try:
+                self.matrix[start:end] = vectors
+                self.matrix.flush()
+                self.store.insert([
+                    (start + i, doc, {
+                        **doc.metadata,
+                        "source": doc.source,
+                        "embedding_model": emb.model
+                    })
+                    for i, (doc, emb) in enumerate(zip(documents, embeddings))
+                ])
+                self.store.commit()
+
+            except Exception:
+                self.store.rollback()
+                raise
+
+            self.alive[replaced] = False
+            self.alive[start:end] = True
+            self.count = end
+            self._maybe_compact()
+
+    def _grow(self, required: int) -> None:
+        """Doubles the matrix capacity until required rows fit"""
+        capacity = self.matrix.shape[0]
+        while capacity < required:
+            capacity *= 2
+
+        self.matrix.flush()
+        self.matrix = self._open_matrix(self.generation, capacity)
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:len(self.alive)] = self.alive
+        self.alive = alive
+
+    def _delete(self, document_ids: List[str]) -> None:
+        """Tombstones the records of the given document ids"""
+        with self.lock:
+            rows = list(self.store.rows_for_ids(document_ids).values())
+            if not rows:
+                return
+
+            self.store.mark_deleted(rows)
+            self.store.commit()
+            self.alive[rows] = False
+            self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        """Compacts when tombstones exceed the configured ratio"""
+        tombstones = self.count - int(self.alive[:self.count].sum())
+        if tombstones and tombstones > self.compaction_ratio * self.count:
+            self._compact()
+
+    def _compact(self) -> None:
+        """
+        Copies live rows into a new generation of the matrix file and
+        renumbers the side store in the same transaction, so a crash
+        leaves either the old or the new generation intact.
+        """
+        with self.lock:
+            if self.matrix is None:
+                return
+
+            generation = self.generation + 1
+            old_rows = None
+            try:
+                old_rows = self.store.compact()
+                capacity = max(len(old_rows), self.initial_capacity)
+                path = self._matrix_path(generation)
+                if os.path.exists(path):
+                    os.remove(path)
+                matrix = self._open_matrix(generation, capacity)
+                matrix[:len(old_rows)] = self.matrix[old_rows]
+                matrix.flush()
+
+                self.store.set_meta("generation", str(generation))
+                self.store.commit()
+
+            except Exception:
+                self.store.rollback()
+                raise
+
+            self.matrix = matrix
+            self.generation = generation
+            self.count = len(old_rows)
+            self.alive = np.zeros(capacity, dtype=bool)
+            self.alive[:self.count] = True
+            self._remove_stale_files()
+
+    def _search(self, vectors: np.ndarray, limit: int,
+                score_threshold: Optional[float]) -> List[List[Document]]:
+        """
+        Exact top-k search over the live rows for a matrix of queries,
+        using a single matrix product for the whole batch.
+        """
+        with self.lock:
+            if self.matrix is None or self.count == 0 or limit <= 0:
+                return [[] for _ in range(len(vectors))]
+            generation = self.generation
+            matrix = self.matrix[:self.count]
+            alive = self.alive[:self.count].copy()
+
+        # The product runs outside the lock; numpy releases the GIL
+        queries = self._normalize(np.asarray(vectors, dtype=np.float32))
+        scores = queries @ matrix.T
+        scores[:, ~alive] = -np.inf
+
+        k = min(limit, int(alive.sum()))
+        if k == 0:
+            return [[] for _ in range(len(vectors))]
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        with self.lock:
+            if generation != self.generation:
+                # Rows were renumbered by a compaction; search again
+                return self._search(vectors, limit, score_threshold)
+            stored = self.store.get_rows(np.unique(top).tolist())
+
+        results = []
+        for rows, row_scores in zip(top.tolist(), top_scores.tolist()):
+            documents = []
+            for row, score in zip(rows, row_scores):
+                distance = 1.0 - score
+                # Skip if below threshold
+                if score_threshold is not None and \
+                        distance > score_threshold:
+                    continue
+
+                document = stored.get(row)
+                if document is None:
+                    continue
+                documents.append(Document(
+                    id=document.id,
+                    content=document.content,
+                    source=document.source,
+                    metadata={
+                        **document.metadata,
+                        "similarity_score": score
+                    }
+                ))
+            results.append(documents)
+
+        return results
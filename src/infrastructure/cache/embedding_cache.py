@@ -0,0 +1,199 @@
+import asyncio
+import hashlib
+import os
+import sqlite3
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    Two-tier cache for embedding vectors.
+    A bounded in-process LRU sits in front of a persistent SQLite store.
+    Entries are keyed by (embedding model, content hash), so vectors
+    produced by one model are never returned for another.
+    """
+    def __init__(self, path: str, max_entries: int = 10000):
+        """
+        Initialize the cache tiers.
+
+        Args:
+            path: SQLite file for the persistent tier; empty disables it
+            max_entries: Capacity of the in-memory tier; 0 disables it
+        """
+        self.max_entries = max_entries
+        self.memory: "OrderedDict[Tuple[str, str], np.ndarray]" = \
+            OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.connection = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # SQLite connections stay on the single worker thread
+            self.executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="embedding-cache"
+            )
+            self.executor.submit(self._connect, path).result()
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        """Returns the hash used to key a text in the cache"""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    async def get_many(self, model: str,
+                       texts: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Looks up cached vectors for texts embedded with a model.
+
+        Args:
+            model: Embedding model the vectors must come from
+            texts: Texts to look up
+
+        Returns:
+            Dict[str, np.ndarray]: Cached read-only vectors keyed by text
+        """
+        found = {}
+        missing = {}
+
+        for text in texts:
+            key = (model, self.content_hash(text))
+            vector = self.memory.get(key)
+            if vector is not None:
+                self.memory.move_to_end(key)
+                self.hits += 1
+                found[text] = vector
+            else:
+                missing[key[1]] = text
+
+        if missing and self.connection is not None:
+            stored = await self._run(self._select, model, list(missing))
+            for digest, vector in stored.items():
+                text = missing.pop(digest)
+                self.disk_hits += 1
+                self._remember((model, digest), vector)
+                found[text] = vector
+
+        self.misses += len(missing)
+        return found
+
+    async def put_many(self, model: str,
+                       items: Dict[str, np.ndarray]) -> None:
+        """
+        Stores vectors for texts embedded with a model in both tiers.
+
+        Args:
+            model: Embedding model that produced the vectors
+            items: Vectors keyed by text
+        """
+        rows = []
+        for text, vector in items.items():
+            digest = self.content_hash(text)
+            vector = np.array(vector, dtype=np.float32)
+            vector.setflags(write=False)
+            self._remember((model, digest), vector)
+            rows.append((model, digest, vector.tobytes()))
+
+        if rows and self.connection is not None:
+            await self._run(self._insert, rows)
+
+    async def invalidate(self, keep_model: Optional[str] = None) -> None:
+        """
+        Drops cached vectors from every model except keep_model.
+        Pass no model to clear the cache entirely.
+
+        Args:
+            keep_model: Embedding model whose vectors remain valid
+        """
+        for key in [key for key in self.memory if key[0] != keep_model]:
+            del self.memory[key]
+
+        if self.connection is not None:
+            await self._run(self._delete_other_models, keep_model)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns hit, miss and eviction counters"""
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "memory_entries": len(self.memory)
+        }
+
+    def close(self) -> None:
+        """Closes the persistent store"""
+        if self.connection is not None:
+            self.executor.submit(self.connection.close).result()
+            self.executor.shutdown(wait=True)
+            self.connection = None
+
+    def _remember(self, key: Tuple[str, str], vector: np.ndarray) -> None:
+        """Helper method to insert into the LRU tier, evicting if full"""
+        if self.max_entries <= 0:
+            return
+
+        self.memory[key] = vector
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+            self.evictions += 1
+
+    async def _run(self, func, *args):
+        """Helper method to run a SQLite call on the worker thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args))
+
+    def _connect(self, path: str) -> None:
+        """Opens the SQLite store and creates its schema"""
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " model TEXT NOT NULL,"
+            " content_hash TEXT NOT NULL,"
+            " vector BLOB NOT NULL,"
+            " PRIMARY KEY (model, content_hash))"
+        )
+        self.connection.commit()
+
+    def _select(self, model: str,
+                digests: List[str]) -> Dict[str, np.ndarray]:
+        """Reads stored vectors for content hashes of one model"""
+        found = {}
+        # Stay well below SQLite's bound parameter limit
+        for start in range(0, len(digests), 500):
+            chunk = digests[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.connection.execute(
+                "SELECT content_hash, vector FROM embeddings"
+                f" WHERE model = ? AND content_hash IN ({placeholders})",
+                [model, *chunk]
+            )
+            for digest, blob in rows:
+                # frombuffer over bytes yields a read-only array
+                found[digest] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def _insert(self, rows: List[Tuple[str, str, bytes]]) -> None:
+        """Writes vectors to the persistent store"""
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO embeddings"
+            " (model, content_hash, vector) VALUES (?, ?, ?)",
+            rows
+        )
+        self.connection.commit()
+
+    def _delete_other_models(self, keep_model: Optional[str]) -> None:
+        """Deletes stored vectors that belong to other models"""
+        self.connection.execute(
+            "DELETE FROM embeddings WHERE model IS NOT ?", (keep_model,))
+        self.connection.commit()
@@ -15,18 +15,118 @@ class Settings(BaseSettings):
     openai_model: str = Field('gpt-4', env='OPENAI_MODEL')
     openai_embedding_model: str = Field('text-embedding-ada-002',
                                         env='OPENAI_EMBEDDING_MODEL')
+    openai_embedding_batch_size: int = Field(
+        512, env='OPENAI_EMBEDDING_BATCH_SIZE')
+    openai_embedding_batch_max_tokens: int = Field(
+        250_000, env='OPENAI_EMBEDDING_BATCH_MAX_TOKENS')
+    openai_max_connections: int = Field(100, env='OPENAI_MAX_CONNECTIONS')
+    openai_max_keepalive_connections: int = Field(
+        20, env='OPENAI_MAX_KEEPALIVE_CONNECTIONS')
+    openai_keepalive_expiry: float = Field(30.0,
+                                           env='OPENAI_KEEPALIVE_EXPIRY')
+    openai_connect_timeout: float = Field(5.0, env='OPENAI_CONNECT_TIMEOUT')
+    openai_completion_timeout: float = Field(
+        60.0, env='OPENAI_COMPLETION_TIMEOUT')
+    openai_embedding_timeout: float = Field(30.0,
+                                            env='OPENAI_EMBEDDING_TIMEOUT')
+
+    # Embedding Cache Configuration
+    # Set the size to 0 or the path to '' to disable a tier
+    embedding_cache_size: int = Field(10000, env='EMBEDDING_CACHE_SIZE')
+    embedding_cache_path: str = Field('.cache/embeddings.sqlite3',
+                                      env='EMBEDDING_CACHE_PATH')
+
+    # Vector Database Selection ('chroma', 'numpy' or 'hnsw')
+    vector_db_backend: str = Field('chroma', env='VECTOR_DB_BACKEND')
+
+    # In-process Vector Index Configuration
+    vector_index_path: str = Field('data/vector_index',
+                                   env='VECTOR_INDEX_PATH')
+    vector_index_compaction_ratio: float = Field(
+        0.2, env='VECTOR_INDEX_COMPACTION_RATIO')
+    vector_index_max_workers: int = Field(4, env='VECTOR_INDEX_MAX_WORKERS')
+
+    # Embedded HNSW Index Configuration
+    hnsw_index_path: str = Field('data/hnsw_index', env='HNSW_INDEX_PATH')
+    hnsw_m: int = Field(16, env='HNSW_M')
+    hnsw_ef_construction: int = Field(200, env='HNSW_EF_CONSTRUCTION')
+    hnsw_ef_search: int = Field(64, env='HNSW_EF_SEARCH')
+    hnsw_snapshot_interval: int = Field(10000, env='HNSW_SNAPSHOT_INTERVAL')
 
     # ChromaDB Configuration
     chroma_host: str = Field('localhost', env='CHROMA_HOST')
     chroma_port: int = Field(8000, env='CHROMA_PORT')
+    chroma_batch_size: int = Field(1000, env='CHROMA_BATCH_SIZE')
+    chroma_max_workers: int = Field(8, env='CHROMA_MAX_WORKERS')
+
+    # Chat Repository Selection ('mongodb' or 'sqlite')
+    chat_repository_backend: str = Field('mongodb',
+                                         env='CHAT_REPOSITORY_BACKEND')
+
+    # Embedded SQLite Chat Repository Configuration
+    sqlite_chat_path: str = Field('data/chat.sqlite3',
+                                  env='SQLITE_CHAT_PATH')
+    sqlite_chat_read_workers: int = Field(4, env='SQLITE_CHAT_READ_WORKERS')
 
     # MongoDB Configuration
     mongodb_uri: str = Field('mongodb://localhost:27017', env='MONGODB_URI')
     mongodb_db_name: str = Field('rag_chatbot', env='MONGODB_DB_NAME')
+    # Session layout: 'document' (one document per session) or 'bucketed'
+    chat_storage_layout: str = Field('document', env='CHAT_STORAGE_LAYOUT')
+    chat_bucket_size: int = Field(100, env='CHAT_BUCKET_SIZE')
+
+    # Chat Session Cache Configuration
+    # Set the size to 0 to disable caching
+    chat_cache_size: int = Field(1000, env='CHAT_CACHE_SIZE')
+    chat_cache_ttl: float = Field(300.0, env='CHAT_CACHE_TTL')
+    # Most recent messages kept per cached session
+    chat_cache_max_messages: int = Field(50, env='CHAT_CACHE_MAX_MESSAGES')
+
+    # Chat Persistence Configuration ('sync' or 'write_behind')
+    chat_persistence_mode: str = Field('sync', env='CHAT_PERSISTENCE_MODE')
+    chat_write_behind_max_pending: int = Field(
+        1000, env='CHAT_WRITE_BEHIND_MAX_PENDING')
+    chat_write_behind_max_retries: int = Field(
+        5, env='CHAT_WRITE_BEHIND_MAX_RETRIES')
+    chat_write_behind_retry_delay: float = Field(
+        0.5, env='CHAT_WRITE_BEHIND_RETRY_DELAY')
+    chat_write_behind_workers: int = Field(2,
+                                           env='CHAT_WRITE_BEHIND_WORKERS')
+
+    # Ingestion Pipeline Configuration
+    ingestion_embedding_batch_size: int = Field(
+        128, env='INGESTION_EMBEDDING_BATCH_SIZE')
+    ingestion_embedding_concurrency: int = Field(
+        4, env='INGESTION_EMBEDDING_CONCURRENCY')
+    ingestion_storage_batch_size: int = Field(
+        500, env='INGESTION_STORAGE_BATCH_SIZE')
+    ingestion_storage_concurrency: int = Field(
+        2, env='INGESTION_STORAGE_CONCURRENCY')
+    ingestion_queue_size: int = Field(8, env='INGESTION_QUEUE_SIZE')
+
+    # Ingestion Job Queue Configuration
+    ingestion_job_path: str = Field('data/ingestion_jobs.sqlite3',
+                                    env='INGESTION_JOB_PATH')
+    ingestion_job_workers: int = Field(2, env='INGESTION_JOB_WORKERS')
+    ingestion_job_max_attempts: int = Field(3,
+                                            env='INGESTION_JOB_MAX_ATTEMPTS')
+    ingestion_job_lease_timeout: float = Field(
+        60.0, env='INGESTION_JOB_LEASE_TIMEOUT')
+    # Longest line of a bulk NDJSON upload; longer documents are rejected
+    bulk_ingestion_max_document_bytes: int = Field(
+        10_000_000, env='BULK_INGESTION_MAX_DOCUMENT_BYTES')
 
     # Additional Fields
     log_level: str = Field('INFO', env='LOG_LEVEL')
     rate_limit: int = Field(100, env='RATE_LIMIT')
+    # Rate limiting is per client per window of rate_limit_window seconds.
+    # The 'sqlite' backend shares limits between worker processes.
+    rate_limit_window: float = Field(3600.0, env='RATE_LIMIT_WINDOW')
+    rate_limit_backend: str = Field('memory', env='RATE_LIMIT_BACKEND')
+    rate_limit_path: str = Field('data/rate_limit.sqlite3',
+                                 env='RATE_LIMIT_PATH')
+    rate_limit_max_clients: int = Field(100000,
+                                        env='RATE_LIMIT_MAX_CLIENTS')
     allowed_origins: List[str] = Field(['http://localhost:3000',
                                         'http://localhost:8000'],
                                        env='ALLOWED_ORIGINS')
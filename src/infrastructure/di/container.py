@@ -1,11 +1,23 @@
 from dependency_injector import containers, providers
 from src.infrastructure.config.settings import Settings
 from src.infrastructure.adapters.llm.openai_adapter import OpenAIAdapter
+from src.infrastructure.adapters.llm.cached_llm_adapter import CachedLLMAdapter
+from src.infrastructure.cache.embedding_cache import EmbeddingCache
+from src.infrastructure.rate_limit.rate_limiter import MemoryRateLimiter, SQLiteRateLimiter
 from src.infrastructure.adapters.vector_db.chroma_adapter import ChromaDBAdapter
+from src.infrastructure.adapters.vector_db.numpy_adapter import NumpyVectorDBAdapter
+from src.infrastructure.adapters.vector_db.hnsw_adapter import HNSWVectorDBAdapter
 from src.infrastructure.adapters.repository.mongodb_chat_repository import MongoDBChatRepository
+from src.infrastructure.adapters.repository.mongodb_bucketed_chat_repository import MongoDBBucketedChatRepository
+from src.infrastructure.adapters.repository.sqlite_chat_repository import SQLiteChatRepository
+from src.infrastructure.adapters.repository.cached_chat_repository import CachedChatRepository
+from src.infrastructure.adapters.repository.write_behind_chat_repository import WriteBehindChatRepository
+from src.infrastructure.adapters.repository.sqlite_ingestion_job_store import SQLiteIngestionJobStore
 from src.application.services.prompt_service import PromptService
 from src.application.use_cases.chat_completion import ChatCompletionUseCase
 from src.application.use_cases.document_ingestion import DocumentIngestionUseCase
+from src.application.use_cases.ingestion_jobs import IngestionJobUseCase
+from src.presentation.api.handlers import ChatHandler
 
 
 class Container(containers.DeclarativeContainer):
@@ -20,24 +32,123 @@ class Container(containers.DeclarativeContainer):
     # Services
     prompt_service = providers.Singleton(PromptService)
 
+    rate_limiter = providers.Selector(
+        config.provided.rate_limit_backend,
+        memory=providers.Singleton(
+            MemoryRateLimiter,
+            rate_limit=config.provided.rate_limit,
+            window=config.provided.rate_limit_window,
+            max_clients=config.provided.rate_limit_max_clients
+        ),
+        sqlite=providers.Singleton(
+            SQLiteRateLimiter,
+            path=config.provided.rate_limit_path,
+            rate_limit=config.provided.rate_limit,
+            window=config.provided.rate_limit_window
+        )
+    )
+
     # Adapters
-    llm = providers.Singleton(
+    openai_llm = providers.Singleton(
         OpenAIAdapter,
         api_key=config.provided.openai_api_key,
         model=config.provided.openai_model,
+        embedding_model=config.provided.openai_embedding_model,
+        embedding_batch_size=config.provided.openai_embedding_batch_size,
+        embedding_batch_max_tokens=(
+            config.provided.openai_embedding_batch_max_tokens),
+        max_connections=config.provided.openai_max_connections,
+        max_keepalive_connections=(
+            config.provided.openai_max_keepalive_connections),
+        keepalive_expiry=config.provided.openai_keepalive_expiry,
+        connect_timeout=config.provided.openai_connect_timeout,
+        completion_timeout=config.provided.openai_completion_timeout,
+        embedding_timeout=config.provided.openai_embedding_timeout
+    )
+
+    embedding_cache = providers.Singleton(
+        EmbeddingCache,
+        path=config.provided.embedding_cache_path,
+        max_entries=config.provided.embedding_cache_size
+    )
+
+    llm = providers.Singleton(
+        CachedLLMAdapter,
+        llm=openai_llm,
+        cache=embedding_cache,
         embedding_model=config.provided.openai_embedding_model
     )
 
-    vector_db = providers.Singleton(
-        ChromaDBAdapter,
-        host=config.provided.chroma_host,
-        port=config.provided.chroma_port
+    vector_db = providers.Selector(
+        config.provided.vector_db_backend,
+        chroma=providers.Singleton(
+            ChromaDBAdapter,
+            host=config.provided.chroma_host,
+            port=config.provided.chroma_port,
+            batch_size=config.provided.chroma_batch_size,
+            max_workers=config.provided.chroma_max_workers
+        ),
+        numpy=providers.Singleton(
+            NumpyVectorDBAdapter,
+            path=config.provided.vector_index_path,
+            compaction_ratio=config.provided.vector_index_compaction_ratio,
+            max_workers=config.provided.vector_index_max_workers
+        ),
+        hnsw=providers.Singleton(
+            HNSWVectorDBAdapter,
+            path=config.provided.hnsw_index_path,
+            M=config.provided.hnsw_m,
+            ef_construction=config.provided.hnsw_ef_construction,
+            ef_search=config.provided.hnsw_ef_search,
+            snapshot_interval=config.provided.hnsw_snapshot_interval,
+            max_workers=config.provided.vector_index_max_workers
+        )
     )
 
-    chat_repository = providers.Singleton(
-        MongoDBChatRepository,
-        uri=config.provided.mongodb_uri,
-        database=config.provided.mongodb_db_name
+    mongodb_chat_repository = providers.Selector(
+        config.provided.chat_storage_layout,
+        document=providers.Singleton(
+            MongoDBChatRepository,
+            uri=config.provided.mongodb_uri,
+            database=config.provided.mongodb_db_name
+        ),
+        bucketed=providers.Singleton(
+            MongoDBBucketedChatRepository,
+            uri=config.provided.mongodb_uri,
+            database=config.provided.mongodb_db_name,
+            bucket_size=config.provided.chat_bucket_size
+        )
+    )
+
+    chat_store = providers.Selector(
+        config.provided.chat_repository_backend,
+        mongodb=mongodb_chat_repository,
+        sqlite=providers.Singleton(
+            SQLiteChatRepository,
+            path=config.provided.sqlite_chat_path,
+            read_workers=config.provided.sqlite_chat_read_workers
+        )
+    )
+
+    cached_chat_repository = providers.Singleton(
+        CachedChatRepository,
+        repository=chat_store,
+        max_sessions=config.provided.chat_cache_size,
+        ttl=config.provided.chat_cache_ttl,
+        max_messages=config.provided.chat_cache_max_messages
+    )
+
+    chat_repository = providers.Selector(
+        config.provided.chat_persistence_mode,
+        sync=cached_chat_repository,
+        write_behind=providers.Singleton(
+            WriteBehindChatRepository,
+            repository=cached_chat_repository,
+            max_pending=config.provided.chat_write_behind_max_pending,
+            max_retries=config.provided.chat_write_behind_max_retries,
+            retry_delay=config.provided.chat_write_behind_retry_delay,
+            workers=config.provided.chat_write_behind_workers
+        )
     )
 
     # Use Cases
@@ -52,5 +163,35 @@ class Container(containers.DeclarativeContainer):
     document_ingestion = providers.Singleton(
         DocumentIngestionUseCase,
         llm=llm,
-        vector_db=vector_db
+        vector_db=vector_db,
+        embedding_batch_size=config.provided.ingestion_embedding_batch_size,
+        embedding_concurrency=(
+            config.provided.ingestion_embedding_concurrency),
+        storage_batch_size=config.provided.ingestion_storage_batch_size,
+        storage_concurrency=config.provided.ingestion_storage_concurrency,
+        queue_size=config.provided.ingestion_queue_size
+    )
+
+    # Durable queue of background ingestion jobs
+    ingestion_job_store = providers.Singleton(
+        SQLiteIngestionJobStore,
+        path=config.provided.ingestion_job_path
+    )
+
+    ingestion_jobs = providers.Singleton(
+        IngestionJobUseCase,
+        document_ingestion=document_ingestion,
+        job_store=ingestion_job_store,
+        workers=config.provided.ingestion_job_workers,
+        max_attempts=config.provided.ingestion_job_max_attempts,
+        lease_timeout=config.provided.ingestion_job_lease_timeout
+    )
+
+    # Presentation
+    chat_handler = providers.Singleton(
+        ChatHandler,
+        chat_completion=chat_completion,
+        document_ingestion=document_ingestion,
+        ingestion_jobs=ingestion_jobs,
+        max_document_bytes=config.provided.bulk_ingestion_max_document_bytes
     )
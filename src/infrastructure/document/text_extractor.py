@@ -0,0 +1,53 @@
+import io
+import os
+from docx import Document as WordDocument
+from PyPDF2 import PdfReader
+
+from src.domain.entities import InvalidDocumentError
+
+
+# File extensions extract_text can read
+SUPPORTED_EXTENSIONS = ("txt", "md", "pdf", "docx")
+
+
+def extract_text(data: bytes, filename: str) -> str:
+    """
+    Extracts the plain text of an uploaded file, chosen by its extension.
+    PDF and Word parsing is CPU-bound; run this off the event loop.
+
+    Args:
+        data: Raw file content
+        filename: Name of the file, used to pick the format
+
+    Returns:
+        str: The text of the document
+
+    Raises:
+        InvalidDocumentError: If the format is unsupported or unreadable
+    """
+    extension = os.path.splitext(filename)[1].lower().lstrip(".")
+    try:
+        if extension == "pdf":
+            return _extract_pdf(data)
+        if extension == "docx":
+            return _extract_docx(data)
+        if extension in ("txt", "md"):
+            return data.decode("utf-8")
+
+    except Exception as e:
+        raise InvalidDocumentError(
+            f"Error reading {filename}: {str(e)}")
+
+    raise InvalidDocumentError(f"Unsupported document type: {filename}")
+
+
+def _extract_pdf(data: bytes) -> str:
+    """Helper method to join the text of every PDF page"""
+    reader = PdfReader(io.BytesIO(data))
+    return "\n\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+def _extract_docx(data: bytes) -> str:
+    """Helper method to join the paragraphs of a Word document"""
+    document = WordDocument(io.BytesIO(data))
+    return "\n".join(paragraph.text for paragraph in document.paragraphs)
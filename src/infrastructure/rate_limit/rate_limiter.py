@@ -0,0 +1,157 @@
+import asyncio
+import os
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Tuple
+
+
+class RateLimiter(ABC):
+    """
+    Token-bucket rate limiter keyed by client.
+    Each client may burst up to rate_limit requests and then gets one
+    more request every window / rate_limit seconds. Checking a request
+    is O(1) in time and each client costs O(1) memory.
+    """
+    def __init__(self, rate_limit: int, window: float = 3600.0):
+        """
+        Args:
+            rate_limit: Requests allowed per client per window
+            window: Window length in seconds
+        """
+        self.capacity = float(rate_limit)
+        self.refill_rate = rate_limit / window
+        # After this long without requests a bucket is full again, so it
+        # can be forgotten without changing any decision
+        self.idle_ttl = window
+
+    @abstractmethod
+    async def allow(self, key: str) -> bool:
+        """Takes a token from the key's bucket; False if it is empty"""
+        pass
+
+    async def close(self) -> None:
+        """Releases backend resources. Does nothing by default."""
+        pass
+
+
+class MemoryRateLimiter(RateLimiter):
+    """
+    In-process token buckets, bounded in memory.
+    Idle clients are evicted once their bucket has refilled, and the
+    least recently seen client is evicted past max_clients.
+    Limits are per process, so each uvicorn worker counts separately.
+    """
+    def __init__(self, rate_limit: int, window: float = 3600.0,
+                 max_clients: int = 100000):
+        """
+        Args:
+            rate_limit: Requests allowed per client per window
+            window: Window length in seconds
+            max_clients: Maximum number of tracked clients
+        """
+        super().__init__(rate_limit, window)
+        self.max_clients = max_clients
+        # Client -> (tokens, last update), least recently seen first
+        self.buckets: "OrderedDict[str, Tuple[float, float]]" = \
+            OrderedDict()
+
+    async def allow(self, key: str) -> bool:
+        """Takes a token from the key's bucket; False if it is empty"""
+        now = time.monotonic()
+        tokens, updated = self.buckets.pop(key, (self.capacity, now))
+        tokens = min(self.capacity,
+                     tokens + (now - updated) * self.refill_rate)
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        self.buckets[key] = (tokens, now)
+        self._evict(now)
+        return allowed
+
+    def _evict(self, now: float) -> None:
+        """Helper method to drop idle and excess buckets"""
+        while self.buckets:
+            key, (_, updated) = next(iter(self.buckets.items()))
+            if now - updated < self.idle_ttl and \
+                    len(self.buckets) <= self.max_clients:
+                break
+            del self.buckets[key]
+
+
+class SQLiteRateLimiter(RateLimiter):
+    """
+    Token buckets in a SQLite file, shared by every process that opens
+    it, so uvicorn workers on one host enforce a single limit.
+    Each check is one atomic upsert.
+    """
+    # Idle buckets are purged once every this many checks
+    PURGE_INTERVAL = 1000
+
+    def __init__(self, path: str, rate_limit: int, window: float = 3600.0):
+        """
+        Args:
+            path: SQLite file shared by the workers
+            rate_limit: Requests allowed per client per window
+            window: Window length in seconds
+        """
+        super().__init__(rate_limit, window)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.checks = 0
+        # The connection stays on the single worker thread
+        self.executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="rate-limiter"
+        )
+        self.connection = self.executor.submit(self._connect, path).result()
+
+    async def allow(self, key: str) -> bool:
+        """Takes a token from the key's bucket; False if it is empty"""
+        self.checks += 1
+        purge = self.checks % self.PURGE_INTERVAL == 0
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, partial(self._take, key, time.time(), purge))
+
+    async def close(self) -> None:
+        """Closes the database connection"""
+        self.executor.submit(self.connection.close).result()
+        self.executor.shutdown(wait=True)
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        """Opens the database and creates the bucket table"""
+        connection = sqlite3.connect(path, isolation_level=None,
+                                     timeout=5.0)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            " key TEXT PRIMARY KEY,"
+            " tokens REAL NOT NULL,"
+            " updated REAL NOT NULL)")
+        return connection
+
+    def _take(self, key: str, now: float, purge: bool) -> bool:
+        """Refills and takes a token in one statement; the update is
+        skipped, changing no rows, when the bucket is empty"""
+        refilled = "MIN(:capacity, tokens + (:now - updated) * :rate)"
+        cursor = self.connection.execute(
+            "INSERT INTO buckets (key, tokens, updated)"
+            " VALUES (:key, :capacity - 1, :now)"
+            " ON CONFLICT (key) DO UPDATE SET"
+            f" tokens = {refilled} - 1, updated = :now"
+            f" WHERE {refilled} >= 1",
+            {"key": key, "capacity": self.capacity, "now": now,
+             "rate": self.refill_rate}
+        )
+        if purge:
+            self.connection.execute(
+                "DELETE FROM buckets WHERE updated < ?",
+                (now - self.idle_ttl,))
+        return cursor.rowcount == 1
@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .routes import router
@@ -10,11 +11,36 @@ def create_app() -> FastAPI:
     Factory function to create and configure the FastAPI application.
     Sets up middleware, routes, and dependency injection.
     """
+    # Set up dependency injection
+    container = Container()
+    container.wire(modules=["src.presentation.api.routes"])
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Open pooled LLM connections and create storage indexes before
+        # serving traffic
+        llm = container.llm()
+        await llm.warmup()
+        await container.chat_repository().initialize()
+        # Resume ingestion jobs queued or interrupted before a restart
+        await container.ingestion_jobs().start()
+        yield
+        await container.ingestion_jobs().stop()
+        await container.ingestion_job_store().close()
+        try:
+            # Flush buffered chat sessions before the process exits;
+            # raises if some could not be written
+            await container.chat_repository().close()
+        finally:
+            await llm.close()
+            await container.rate_limiter().close()
+
     # Create FastAPI app
     app = FastAPI(
         title="RAG Chatbot API",
         description="API for chat completion with RAG capabilities",
-        version="1.0.0"
+        version="1.0.0",
+        lifespan=lifespan
     )
 
     # Configure CORS
@@ -28,10 +54,9 @@ def create_app() -> FastAPI:
 
     # Add custom middleware
     app.add_middleware(LoggingMiddleware)
-    app.add_middleware(RateLimitMiddleware, rate_limit=100)
+    app.add_middleware(RateLimitMiddleware,
+                       limiter=container.rate_limiter())
 
-    # Set up dependency injection
-    container = Container()
     app.container = container
 
     # Include routers
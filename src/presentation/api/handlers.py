@@ -1,11 +1,28 @@
+import json
+import logging
+from collections import defaultdict
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from fastapi import HTTPException
-from src.domain.entities import Document
+from fastapi.responses import StreamingResponse
+from src.domain.entities import Document, Message
 from src.application.use_cases.chat_completion import ChatCompletionUseCase
 from src.application.use_cases.document_ingestion import DocumentIngestionUseCase
+from src.application.use_cases.ingestion_jobs import IngestionJobUseCase
 from src.application.exceptions import (
     LLMException,
     VectorDBException
 )
+from ..schemas.api_models import (
+    MessageRequest,
+    MessageResponse,
+    DocumentRecord,
+    DocumentRequest,
+    IngestionJobResponse,
+    BulkDocumentResult,
+    BulkIngestionResponse
+)
+
+logger = logging.getLogger(__name__)
 
 
 class ChatHandler:
@@ -16,10 +33,15 @@ class ChatHandler:
     def __init__(
         self,
         chat_completion: ChatCompletionUseCase,
-        document_ingestion: DocumentIngestionUseCase
+        document_ingestion: DocumentIngestionUseCase,
+        ingestion_jobs: IngestionJobUseCase,
+        max_document_bytes: int = 10_000_000
     ):
         self.chat_completion = chat_completion
         self.document_ingestion = document_ingestion
+        self.ingestion_jobs = ingestion_jobs
+        # Longest line accepted in a bulk upload
+        self.max_document_bytes = max_document_bytes
 
     async def send_message(
         self,
@@ -84,18 +106,90 @@ class ChatHandler:
                 }
             )
 
+    async def stream_message(
+        self,
+        session_id: str,
+        request: MessageRequest
+    ) -> StreamingResponse:
+        """
+        Handles message sending with the response streamed as
+        Server-Sent Events: a "delta" event per piece of content, then a
+        "done" event with the saved message, or an "error" event.
+        If the client disconnects, the response task is cancelled, which
+        closes the stream and the upstream LLM request with it.
+
+        Args:
+            session_id: ID of the chat session
+            request: Validated message request
+
+        Returns:
+            StreamingResponse: The text/event-stream response
+        """
+        return StreamingResponse(
+            self._stream_events(session_id, request),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no"
+            }
+        )
+
+    async def _stream_events(
+        self,
+        session_id: str,
+        request: MessageRequest
+    ) -> AsyncIterator[str]:
+        """Formats the streamed completion as Server-Sent Events"""
+        stream = self.chat_completion.execute_stream(
+            session_id=session_id,
+            user_input=request.content,
+            temperature=request.temperature,
+            max_tokens=request.max_tokens
+        )
+        try:
+            async for item in stream:
+                if isinstance(item, Message):
+                    response = MessageResponse.from_entity(item)
+                    yield self._sse("done", response.json())
+                else:
+                    yield self._sse("delta", json.dumps({"content": item}))
+
+        except LLMException as e:
+            yield self._sse("error", json.dumps({
+                "error": "Language model service unavailable",
+                "details": str(e),
+                "code": "LLM_ERROR"
+            }))
+        except Exception as e:
+            logger.error(f"Error streaming response: {str(e)}")
+            yield self._sse("error", json.dumps({
+                "error": "Internal server error",
+                "details": str(e),
+                "code": "INTERNAL_ERROR"
+            }))
+        finally:
+            await stream.aclose()
+
+    @staticmethod
+    def _sse(event: str, data: str) -> str:
+        """Helper method to format one Server-Sent Event"""
+        return f"event: {event}\ndata: {data}\n\n"
+
     async def ingest_documents(
         self,
         request: DocumentRequest
-    ) -> None:
+    ) -> IngestionJobResponse:
         """
-        Handles document ingestion for RAG.
+        Handles document ingestion for RAG by queueing a background job.
 
         Args:
             request: Validated document request
 
+        Returns:
+            IngestionJobResponse: The queued job
+
         Raises:
-            HTTPException: If an error occurs during ingestion
+            HTTPException: If the job cannot be queued
         """
         try:
             document = Document(
@@ -104,10 +198,11 @@ class ChatHandler:
                 metadata=request.metadata
             )
 
-            await self.document_ingestion.execute(
+            job = await self.ingestion_jobs.submit(
                 documents=[document],
                 chunk_size=request.chunk_size
             )
+            return IngestionJobResponse.from_entity(job)
 
         except Exception as e:
             raise HTTPException(
@@ -118,3 +213,176 @@ class ChatHandler:
                     "code": "INGESTION_ERROR"
                 }
             )
+
+    async def get_ingestion_job(self, job_id: str) -> IngestionJobResponse:
+        """
+        Handles ingestion job status lookups.
+
+        Args:
+            job_id: ID of the ingestion job
+
+        Returns:
+            IngestionJobResponse: The job's status and progress
+
+        Raises:
+            HTTPException: If the job does not exist or cannot be read
+        """
+        try:
+            job = await self.ingestion_jobs.get_job(job_id)
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail={
+                    "error": "Failed to retrieve ingestion job",
+                    "details": str(e),
+                    "code": "INGESTION_JOB_ERROR"
+                }
+            )
+
+        if job is None:
+            raise HTTPException(
+                status_code=404,
+                detail={
+                    "error": "Ingestion job not found",
+                    "details": job_id,
+                    "code": "INGESTION_JOB_NOT_FOUND"
+                }
+            )
+        return IngestionJobResponse.from_entity(job)
+
+    async def ingest_documents_bulk(
+        self,
+        body: AsyncIterator[bytes],
+        chunk_size: Optional[int] = None
+    ) -> BulkIngestionResponse:
+        """
+        Handles bulk ingestion of an NDJSON body, one document per line.
+        Lines are parsed and fed to the ingestion pipeline as the body
+        streams in, so memory use does not grow with the upload. Invalid
+        lines are rejected, and documents whose chunks fail to embed or
+        store are marked failed, without stopping the upload.
+
+        Args:
+            body: Request body as a stream of byte chunks
+            chunk_size: Optional size for document chunking
+
+        Returns:
+            BulkIngestionResponse: The outcome of every non-empty line
+        """
+        results: List[BulkDocumentResult] = []
+        # Document ID -> (its result, number of chunks it produces)
+        accepted: Dict[str, Tuple[BulkDocumentResult, int]] = {}
+        stored: Dict[str, int] = defaultdict(int)
+        errors: Dict[str, str] = {}
+
+        async def documents() -> AsyncIterator[Document]:
+            async for line_no, line in self._ndjson_lines(body):
+                try:
+                    if line is None:
+                        raise ValueError(
+                            f"Line exceeds {self.max_document_bytes} bytes")
+                    record = DocumentRecord.model_validate_json(line)
+                    document = Document(
+                        content=record.content,
+                        source=record.source,
+                        metadata=record.metadata
+                    )
+                    expected = self.document_ingestion.count_chunks(
+                        document, chunk_size)
+                except Exception as e:
+                    results.append(BulkDocumentResult(
+                        line=line_no, status="rejected", error=str(e)))
+                    continue
+
+                result = BulkDocumentResult(
+                    line=line_no, id=document.id, source=document.source,
+                    status="failed")
+                results.append(result)
+                accepted[document.id] = (result, expected)
+                yield document
+
+        def parent_id(chunk: Document) -> str:
+            # Unchunked documents are stored as themselves
+            return chunk.id if chunk.id in accepted \
+                else chunk.metadata["parent_id"]
+
+        def on_stored(chunks: List[Document]) -> None:
+            for chunk in chunks:
+                stored[parent_id(chunk)] += 1
+
+        def on_failed(chunks: List[Document], e: Exception) -> None:
+            logger.error(f"Bulk ingestion batch failed: {str(e)}")
+            for chunk in chunks:
+                errors[parent_id(chunk)] = str(e)
+
+        error = None
+        try:
+            await self.document_ingestion.execute(
+                documents=documents(),
+                chunk_size=chunk_size,
+                stored_callback=on_stored,
+                failed_callback=on_failed
+            )
+        except Exception as e:
+            logger.error(f"Bulk ingestion stopped: {str(e)}")
+            error = str(e)
+
+        for document_id, (result, expected) in accepted.items():
+            result.chunks = stored[document_id]
+            if result.chunks < expected:
+                result.error = errors.get(document_id, error)
+            elif expected:
+                result.status = "ingested"
+            else:
+                result.status = "skipped"
+                result.error = "Document is too short to produce a chunk"
+
+        counts = defaultdict(int)
+        for result in results:
+            counts[result.status] += 1
+        return BulkIngestionResponse(
+            ingested=counts["ingested"],
+            skipped=counts["skipped"],
+            rejected=counts["rejected"],
+            failed=counts["failed"],
+            error=error,
+            documents=results
+        )
+
+    async def _ndjson_lines(
+        self,
+        body: AsyncIterator[bytes]
+    ) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+        """
+        Helper method to split a streamed body into numbered non-empty
+        lines. A line longer than max_document_bytes is discarded as it
+        arrives and yielded as None.
+        """
+        buffer = bytearray()
+        line_no = 0
+        oversized = False
+
+        async for data in body:
+            buffer += data
+            while True:
+                end = buffer.find(b"\n")
+                if end < 0:
+                    break
+                line_no += 1
+                line = bytes(buffer[:end])
+                del buffer[:end + 1]
+                if oversized or len(line) > self.max_document_bytes:
+                    yield line_no, None
+                elif line.strip():
+                    yield line_no, line
+                oversized = False
+
+            # Drop the start of an overlong line instead of buffering it
+            if len(buffer) > self.max_document_bytes:
+                buffer.clear()
+                oversized = True
+
+        if oversized or buffer.strip():
+            line_no += 1
+            yield line_no, None if oversized else bytes(buffer)
@@ -1,85 +1,114 @@
-from fastapi import Request
-from fastapi.middleware.base import BaseHTTPMiddleware
+from typing import Optional
 from fastapi.responses import JSONResponse
+from starlette.datastructures import URL
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import time
 import logging
+from src.infrastructure.rate_limit.rate_limiter import (
+    RateLimiter,
+    MemoryRateLimiter
+)
 
 logger = logging.getLogger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """
     Middleware for logging requests and responses.
     Tracks timing and basic metrics.
+
+    Implemented as raw ASGI middleware, so responses, including streamed
+    ones, pass through without extra tasks or body buffering.
     """
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive,
+                       send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.time()
+        status_code = None
 
         # Log request
-        logger.info(f"Request: {request.method} {request.url}")
+        logger.info(f"Request: {scope['method']} {URL(scope=scope)}")
 
-        try:
-            response = await call_next(request)
-
-            # Log response timing
-            duration = time.time() - start_time
-            logger.info(
-                f"Response: {response.status_code} "
-                f"Duration: {duration:.3f}s"
-            )
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-            return response
+        try:
+            await self.app(scope, receive, send_wrapper)
 
         except Exception as e:
             logger.error(f"Error processing request: {str(e)}")
-            return JSONResponse(
+            # Once the response has started it can no longer be replaced
+            if status_code is not None:
+                raise
+            response = JSONResponse(
                 status_code=500,
                 content={
                     "error": "Internal server error",
                     "code": "INTERNAL_ERROR"
                 }
             )
+            await response(scope, receive, send)
+            return
+
+        # Log response timing
+        duration = time.time() - start_time
+        logger.info(
+            f"Response: {status_code} "
+            f"Duration: {duration:.3f}s"
+        )
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
-    Middleware for basic rate limiting.
-    Uses a simple rolling window approach.
+    Middleware for per-client rate limiting.
+    Delegates to a token-bucket RateLimiter, which decides in O(1) and
+    may be shared between worker processes.
     """
-    def __init__(self, app, rate_limit: int = 100):
-        super().__init__(app)
-        self.rate_limit = rate_limit
-        self.requests = {}
+    def __init__(
+        self,
+        app: ASGIApp,
+        rate_limit: int = 100,
+        limiter: Optional[RateLimiter] = None
+    ):
+        """
+        Args:
+            app: ASGI application to wrap
+            rate_limit: Requests per client per hour, used when no
+                limiter is given
+            limiter: Rate limiter backend to consult
+        """
+        self.app = app
+        self.limiter = limiter or MemoryRateLimiter(rate_limit)
+
+    async def __call__(self, scope: Scope, receive: Receive,
+                       send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next):
         # Get client IP
-        client_ip = request.client.host
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
 
         # Check rate limit
-        current_time = time.time()
-        if not self._check_rate_limit(client_ip, current_time):
-            return JSONResponse(
+        if not await self.limiter.allow(client_ip):
+            response = JSONResponse(
                 status_code=429,
                 content={
                     "error": "Too many requests",
                     "code": "RATE_LIMIT_EXCEEDED"
                 }
             )
+            await response(scope, receive, send)
+            return
 
-        return await call_next(request)
-
-    def _check_rate_limit(self, client_ip: str, current_time: float) -> bool:
-        # Clean old requests
-        window_start = current_time - 3600  # 1 hour window
-
-        if client_ip in self.requests:
-            self.requests[client_ip] = [
-                t for t in self.requests[client_ip]
-                if t > window_start
-            ]
-
-            if len(self.requests[client_ip]) >= self.rate_limit:
-                return False
-
-        self.requests.setdefault(client_ip, []).append(current_time)
-        return True
+        await self.app(scope, receive, send)
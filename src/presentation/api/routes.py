@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from dependency_injector.wiring import inject, Provide
 from src.infrastructure.di.container import Container
 from .handlers import ChatHandler
@@ -6,6 +8,8 @@ from ..schemas.api_models import (
     MessageRequest,
     MessageResponse,
     DocumentRequest,
+    IngestionJobResponse,
+    BulkIngestionResponse,
     ErrorResponse
 )
 
@@ -45,12 +49,41 @@ async def send_message(
     return await handler.send_message(session_id, request)
 
 
+@router.post(
+    "/chat/{session_id}/messages/stream",
+    response_class=StreamingResponse,
+    summary="Send a message and stream the response",
+    response_description="Server-Sent Events carrying the response"
+)
+@inject
+async def stream_message(
+    session_id: str,
+    request: MessageRequest,
+    handler: ChatHandler = Depends(Provide[Container.chat_handler])
+) -> StreamingResponse:
+    """
+    Send a message in a chat session and stream the response as
+    Server-Sent Events while it is generated.
+
+    Events:
+        delta: {"content": "..."} for each piece of the response
+        done: The saved response message, as in the non-streaming route
+        error: An error body, as in the non-streaming route
+
+    Parameters:
+        session_id: Unique identifier for the chat session
+        request: Message content and optional parameters
+    """
+    return await handler.stream_message(session_id, request)
+
+
 @router.post(
     "/documents",
-    status_code=204,
-    summary="Ingest a document for RAG",
+    status_code=202,
+    response_model=IngestionJobResponse,
+    summary="Queue a document for RAG ingestion",
     responses={
-        204: {"description": "Document successfully ingested"},
+        202: {"description": "Document queued for ingestion"},
         500: {"model": ErrorResponse}
     }
 )
@@ -58,11 +91,80 @@ async def send_message(
 async def ingest_document(
     request: DocumentRequest,
     handler: ChatHandler = Depends(Provide[Container.chat_handler])
-) -> None:
+) -> IngestionJobResponse:
     """
-    Ingest a document for use in RAG responses.
+    Queue a document for ingestion for use in RAG responses. Returns
+    at once; poll the job for progress.
 
     Parameters:
         request: Document content and metadata
+
+    Returns:
+        IngestionJobResponse: The queued job
+    """
+    return await handler.ingest_documents(request)
+
+
+@router.get(
+    "/documents/jobs/{job_id}",
+    response_model=IngestionJobResponse,
+    summary="Get the status of an ingestion job",
+    responses={404: {"model": ErrorResponse}}
+)
+@inject
+async def get_ingestion_job(
+    job_id: str,
+    handler: ChatHandler = Depends(Provide[Container.chat_handler])
+) -> IngestionJobResponse:
+    """
+    Get the status, chunk progress, throughput and any error of an
+    ingestion job.
+
+    Parameters:
+        job_id: ID returned when the document was queued
+
+    Returns:
+        IngestionJobResponse: The job's status and progress
+    """
+    return await handler.get_ingestion_job(job_id)
+
+
+@router.post(
+    "/documents/bulk",
+    response_model=BulkIngestionResponse,
+    summary="Ingest a stream of documents for RAG",
+    response_description="The outcome of every document in the upload",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {
+                    "schema": {"type": "string", "format": "binary"}
+                }
+            }
+        }
+    }
+)
+@inject
+async def ingest_documents_bulk(
+    request: Request,
+    chunk_size: Optional[int] = Query(
+        None,
+        description="Size of chunks for document splitting",
+        gt=100
+    ),
+    handler: ChatHandler = Depends(Provide[Container.chat_handler])
+) -> BulkIngestionResponse:
+    """
+    Ingest many documents from one NDJSON body. Each line is a JSON
+    object with content, source and optional metadata. Documents are
+    ingested as the body streams in, and the response reports each one.
+
+    Parameters:
+        request: The request whose body is streamed
+        chunk_size: Optional size for document chunking
+
+    Returns:
+        BulkIngestionResponse: Per-document results
     """
-    await handler.ingest_documents(request)
+    return await handler.ingest_documents_bulk(request.stream(), chunk_size)
@@ -1,6 +1,8 @@
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from datetime import datetime
 from pydantic import BaseModel, Field, validator
+from src.domain.entities import IngestionJob, Message
+from src.domain.value_objects.job_status import JobStatus
 
 
 class MessageRequest(BaseModel):
@@ -43,6 +45,18 @@ class MessageResponse(BaseModel):
     timestamp: datetime
     metadata: Optional[Dict[str, str]] = None
 
+    @classmethod
+    def from_entity(cls, message: Message) -> "MessageResponse":
+        """Builds the response model from a Message entity"""
+        return cls(
+            id=message.id,
+            content=message.content,
+            role=message.role,
+            type=message.type.value,
+            timestamp=message.timestamp,
+            metadata=message.metadata
+        )
+
     class Config:
         schema_extra = {
             "example": {
@@ -56,14 +70,18 @@ class MessageResponse(BaseModel):
         }
 
 
-class DocumentRequest(BaseModel):
-    """Request model for document ingestion"""
+class DocumentRecord(BaseModel):
+    """One document to ingest; also a line of a bulk NDJSON upload"""
     content: str = Field(..., description="The document content")
     source: str = Field(..., description="Source of the document")
-    metadata: Optional[Dict[str, str]] = Field(
+    metadata: Dict[str, str] = Field(
         default_factory=dict,
         description="Additional metadata for the document"
     )
+
+
+class DocumentRequest(DocumentRecord):
+    """Request model for document ingestion"""
     chunk_size: Optional[int] = Field(
         None,
         description="Size of chunks for document splitting",
@@ -71,6 +89,87 @@ class DocumentRequest(BaseModel):
     )
 
 
+class IngestionJobResponse(BaseModel):
+    """Response model for the status of a document ingestion job"""
+    id: str
+    status: str
+    total_chunks: int
+    embedded_chunks: int
+    stored_chunks: int
+    progress: float = Field(..., description="Share of chunks stored")
+    throughput: float = Field(..., description="Chunks stored per second")
+    error: Optional[str] = None
+    attempts: int
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @classmethod
+    def from_entity(cls, job: IngestionJob) -> "IngestionJobResponse":
+        """Builds the response model from an IngestionJob entity"""
+        return cls(
+            id=job.id,
+            status=job.status.value,
+            total_chunks=job.progress.total_chunks,
+            embedded_chunks=job.progress.embedded_chunks,
+            stored_chunks=job.progress.stored_chunks,
+            # A finished run may have produced no chunks at all
+            progress=(1.0 if job.status == JobStatus.SUCCEEDED
+                      else job.progress.fraction),
+            throughput=job.throughput,
+            error=job.error,
+            attempts=job.attempts,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at
+        )
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "id": "3f6c1a52-8d2e-4f7b-9b1e-2c4d5e6f7a8b",
+                "status": "running",
+                "total_chunks": 120,
+                "embedded_chunks": 96,
+                "stored_chunks": 64,
+                "progress": 0.53,
+                "throughput": 41.7,
+                "error": None,
+                "attempts": 1,
+                "created_at": "2024-03-21T14:30:00Z",
+                "started_at": "2024-03-21T14:30:01Z",
+                "finished_at": None
+            }
+        }
+
+
+class BulkDocumentResult(BaseModel):
+    """Outcome of one line of a bulk ingestion upload"""
+    line: int = Field(..., description="Line number in the upload, from 1")
+    id: Optional[str] = Field(None, description="ID of the document")
+    source: Optional[str] = None
+    status: str = Field(
+        ...,
+        description="ingested, skipped (too short to chunk), rejected "
+                    "(invalid line) or failed (ingestion error)"
+    )
+    chunks: int = Field(0, description="Number of chunks stored")
+    error: Optional[str] = None
+
+
+class BulkIngestionResponse(BaseModel):
+    """Response model for bulk ingestion, with one result per line"""
+    ingested: int
+    skipped: int
+    rejected: int
+    failed: int
+    error: Optional[str] = Field(
+        None,
+        description="Error that stopped the upload before its end"
+    )
+    documents: List[BulkDocumentResult]
+
+
 class ErrorResponse(BaseModel):
     """Standardized error response model"""
     error: str
@@ -0,0 +1,18 @@
+import functools
+import html
+
+
+def format_message_html(role: str, content: str) -> str:
+    """Build the HTML block for one chat message, escaping its content."""
+    if role == "user":
+        css_class, label = "user-message", "You"
+    else:
+        css_class, label = "assistant-message", "Assistant"
+    body = html.escape(content).replace("\n", "<br>")
+    return f'<div class="{css_class}"><strong>{label}:</strong> {body}</div>'
+
+
+# Messages in the history never change, so their HTML is built only once.
+# The cache lives in this module rather than the Streamlit script, which
+# is re-executed, and would rebuild the cache, on every rerun.
+cached_message_html = functools.lru_cache(maxsize=4096)(format_message_html)
@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+# Number of messages shown, and loaded per "load older" click
+HISTORY_PAGE_SIZE = 20
+
+
+@dataclass
+class ChatHistoryWindow:
+    """
+    The part of a conversation the chat UI keeps in memory and shows.
+    messages holds the most recent messages; history_offset counts the
+    earlier messages left in the chat repository. Only the last
+    visible_count messages are rendered, so reruns cost the same however
+    long the conversation grows.
+    """
+    messages: List[Dict] = field(default_factory=list)
+    history_offset: int = 0
+    page_size: int = HISTORY_PAGE_SIZE
+    visible_count: int = field(init=False)
+
+    def __post_init__(self):
+        self.visible_count = self.page_size
+
+    @property
+    def visible(self) -> List[Dict]:
+        """The messages to render, oldest first"""
+        return self.messages[-self.visible_count:] if self.visible_count \
+            else []
+
+    @property
+    def hidden_count(self) -> int:
+        """Number of earlier messages not rendered"""
+        return self.history_offset + len(self.messages) - len(self.visible)
+
+    def append(self, message: Dict) -> None:
+        """Adds a new message at the end of the conversation"""
+        self.messages.append(message)
+
+    def load_older(self, fetch: Callable[[int, int], List[Dict]]) -> None:
+        """
+        Shows another page of history, fetching the messages not yet in
+        memory.
+
+        Args:
+            fetch: Called with (offset, limit) to read stored messages
+        """
+        self.visible_count += self.page_size
+        missing = min(self.visible_count - len(self.messages),
+                      self.history_offset)
+        if missing > 0:
+            offset = self.history_offset - missing
+            self.messages[:0] = fetch(offset, missing)
+            self.history_offset = offset
+
+    def trim(self) -> None:
+        """
+        Goes back to showing one page of history, dropping older messages
+        from memory; they can be paged back in with load_older.
+        """
+        self.visible_count = self.page_size
+        excess = len(self.messages) - self.page_size
+        if excess > 0:
+            del self.messages[:excess]
+            self.history_offset += excess
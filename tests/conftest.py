@@ -1,10 +1,10 @@
 import pytest
 import asyncio
-from typing import AsyncGenerator, Generator
+from typing import Generator
 from unittest.mock import Mock, AsyncMock
-from datetime import datetime
 
-from src.domain.entities import Message, Document, Embedding, MessageType
+from src.domain.entities import Message, Document, Embedding
+from src.domain.value_objects.message_type import MessageType
 from src.application.interfaces.llm_port import LLMPort
 from src.application.interfaces.vector_db_port import VectorDBPort
 from src.application.interfaces.chat_repository_port import ChatRepositoryPort
@@ -22,8 +22,11 @@ def event_loop() -> Generator:
 
 
 @pytest.fixture
-async def mock_llm() -> AsyncGenerator[Mock, None]:
-    """Create a mock LLM port implementation."""
+def mock_llm() -> Mock:
+    """
+    Create a mock LLM port implementation. Batch embeddings are
+    derived from the length of each text.
+    """
     mock = AsyncMock(spec=LLMPort)
     mock.generate_response.return_value = Message(
         content="Mocked response",
@@ -34,11 +37,15 @@ async def mock_llm() -> AsyncGenerator[Mock, None]:
         vector=[0.1, 0.2, 0.3],
         model="test-model"
     )
-    yield mock
+    mock.generate_embeddings.side_effect = lambda texts: [
+        Embedding(vector=[float(len(text))], model="test-model")
+        for text in texts
+    ]
+    return mock
 
 
 @pytest.fixture
-async def mock_vector_db() -> AsyncGenerator[Mock, None]:
+def mock_vector_db() -> Mock:
     """Create a mock vector database port implementation."""
     mock = AsyncMock(spec=VectorDBPort)
     mock.search_similar.return_value = [
@@ -48,14 +55,16 @@ async def mock_vector_db() -> AsyncGenerator[Mock, None]:
             metadata={"key": "value"}
         )
     ]
-    yield mock
+    return mock
 
 
 @pytest.fixture
-async def mock_chat_repository() -> AsyncGenerator[Mock, None]:
-    """Create a mock chat repository port implementation."""
+def mock_chat_repository() -> Mock:
+    """Create a mock chat repository port holding no sessions."""
     mock = AsyncMock(spec=ChatRepositoryPort)
-    yield mock
+    mock.get_session.return_value = None
+    mock.get_session_window.return_value = None
+    return mock
 
 
 @pytest.fixture
@@ -65,17 +74,29 @@ def prompt_service() -> PromptService:
 
 
 @pytest.fixture
-async def chat_completion_use_case(
+def chat_completion_use_case(
     mock_llm: Mock,
     mock_vector_db: Mock,
     mock_chat_repository: Mock,
     prompt_service: PromptService
-) -> AsyncGenerator[ChatCompletionUseCase, None]:
+) -> ChatCompletionUseCase:
     """Create a ChatCompletionUseCase instance with mock dependencies."""
-    use_case = ChatCompletionUseCase(
+    return ChatCompletionUseCase(
         llm=mock_llm,
         vector_db=mock_vector_db,
         chat_repository=mock_chat_repository,
         prompt_service=prompt_service
     )
-    yield use_case
+
+
+@pytest.fixture
+def document_ingestion_use_case(
+    mock_llm: Mock,
+    mock_vector_db: Mock
+) -> DocumentIngestionUseCase:
+    """Create a DocumentIngestionUseCase instance with mock dependencies."""
+    return DocumentIngestionUseCase(
+        llm=mock_llm,
+        vector_db=mock_vector_db,
+        embedding_batch_size=4
+    )
@@ -5,7 +5,7 @@ import pytest
 def test_streamlit_chat_interface():
     """Test Streamlit UI components."""
     # Create a Streamlit test instance
-    at = AppTest.from_file("src/main.py")
+    at = AppTest.from_file("main.py")
     at.run()
 
     # Test chat input
@@ -0,0 +1,82 @@
+import pytest
+import os
+import time
+import numpy as np
+from src.infrastructure.adapters.vector_db.hnsw_adapter import HNSWVectorDBAdapter
+from src.domain.entities import Document, Embedding
+
+# Small by default; set ANN_BENCHMARK_SIZE=1000000 for the full-size run,
+# which takes many minutes and several GB of memory
+VECTOR_COUNT = int(os.environ.get("ANN_BENCHMARK_SIZE", 10_000))
+DIMENSION = 128
+QUERY_COUNT = 200
+TOP_K = 10
+BATCH_SIZE = 20_000
+
+
+def exact_top_k(vectors: np.ndarray, queries: np.ndarray) -> np.ndarray:
+    """Brute-force cosine top-k used as ground truth."""
+    tops = []
+    # Score a few queries at a time to bound memory at 1M vectors
+    for start in range(0, len(queries), 10):
+        scores = queries[start:start + 10] @ vectors.T
+        tops.append(np.argpartition(-scores, TOP_K - 1, axis=1)[:, :TOP_K])
+    return np.concatenate(tops)
+
+
+@pytest.mark.asyncio
+async def test_hnsw_recall_and_qps(tmp_path):
+    """Benchmark recall@k against exact search and QPS on synthetic data."""
+    rng = np.random.default_rng(42)
+    # Clustered data resembles real embeddings more than uniform noise
+    centroids = rng.standard_normal((1000, DIMENSION), dtype=np.float32)
+    vectors = centroids[rng.integers(0, 1000, VECTOR_COUNT)] + \
+        1.5 * rng.standard_normal((VECTOR_COUNT, DIMENSION), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    queries = centroids[rng.integers(0, 1000, QUERY_COUNT)] + \
+        1.5 * rng.standard_normal((QUERY_COUNT, DIMENSION), dtype=np.float32)
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+
+    adapter = HNSWVectorDBAdapter(
+        path=str(tmp_path),
+        initial_capacity=VECTOR_COUNT,
+        snapshot_interval=VECTOR_COUNT + 1
+    )
+
+    # Build
+    start_time = time.perf_counter()
+    for start in range(0, VECTOR_COUNT, BATCH_SIZE):
+        batch = vectors[start:start + BATCH_SIZE]
+        await adapter.store_embeddings(
+            [Document(id=str(start + i), content="", source="benchmark")
+             for i in range(len(batch))],
+            [Embedding(vector=v, model="benchmark") for v in batch]
+        )
+    build_duration = time.perf_counter() - start_time
+
+    truth = exact_top_k(vectors, queries)
+
+    recalls = []
+    for ef_search in (16, 64, 256):
+        adapter.set_ef_search(ef_search)
+        hits = 0
+        start_time = time.perf_counter()
+        for query, expected in zip(queries, truth):
+            results = await adapter.search_similar(
+                Embedding(vector=query, model="benchmark"), limit=TOP_K)
+            hits += len({int(doc.id) for doc in results} &
+                        set(expected.tolist()))
+        duration = time.perf_counter() - start_time
+
+        recall = hits / (QUERY_COUNT * TOP_K)
+        recalls.append(recall)
+        print(f"\nN={VECTOR_COUNT:,} ef_search={ef_search}: "
+              f"recall@{TOP_K}={recall:.3f}, "
+              f"{QUERY_COUNT / duration:,.0f} QPS")
+
+    print(f"Build: {build_duration:.1f}s "
+          f"({VECTOR_COUNT / build_duration:,.0f} vectors/s)")
+
+    # A wider candidate list must buy recall
+    assert recalls == sorted(recalls) and recalls[-1] > recalls[0]
+    assert recalls[-1] > 0.9
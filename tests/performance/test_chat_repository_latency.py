@@ -0,0 +1,64 @@
+import pytest
+import time
+import uuid
+import pymongo
+from src.infrastructure.adapters.repository.sqlite_chat_repository import SQLiteChatRepository
+from src.infrastructure.adapters.repository.mongodb_chat_repository import MongoDBChatRepository
+from src.domain.entities import ChatSession, Message
+from src.domain.value_objects.message_type import MessageType
+
+TURNS = 200
+MONGODB_URI = "mongodb://localhost:27017/?serverSelectionTimeoutMS=500"
+
+
+def mongodb_available() -> bool:
+    """Checks for a MongoDB server on localhost."""
+    try:
+        pymongo.MongoClient(MONGODB_URI).admin.command("ping")
+        return True
+    except Exception:
+        return False
+
+
+async def measure_turns(repository) -> float:
+    """Plays TURNS chat turns and returns the median turn latency."""
+    session_id = str(uuid.uuid4())
+    latencies = []
+    for turn in range(TURNS):
+        start_time = time.perf_counter()
+        session = await repository.get_session_window(session_id, 10) \
+            or ChatSession(id=session_id)
+        session.add_message(Message(content=f"Question {turn}",
+                                    role="user", type=MessageType.TEXT))
+        session.add_message(Message(content=f"Answer {turn} " * 50,
+                                    role="assistant", type=MessageType.TEXT))
+        await repository.save_session(session)
+        latencies.append(time.perf_counter() - start_time)
+    return sorted(latencies)[len(latencies) // 2]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_turn_latency(tmp_path):
+    """Benchmark load-and-save turn latency of the SQLite repository."""
+    repository = SQLiteChatRepository(str(tmp_path / "chat.sqlite3"))
+    latency = await measure_turns(repository)
+    await repository.close()
+
+    print(f"\nSQLite median turn latency: {latency * 1000:.2f}ms")
+    assert latency < 0.05
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not mongodb_available(),
+                    reason="MongoDB is not running on localhost")
+async def test_mongodb_turn_latency():
+    """Benchmark load-and-save turn latency of MongoDB on localhost."""
+    database = f"benchmark_{uuid.uuid4().hex}"
+    repository = MongoDBChatRepository(uri=MONGODB_URI, database=database)
+    try:
+        latency = await measure_turns(repository)
+    finally:
+        await repository.client.drop_database(database)
+        await repository.close()
+
+    print(f"\nMongoDB median turn latency: {latency * 1000:.2f}ms")
@@ -0,0 +1,77 @@
+import pytest
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+from src.infrastructure.adapters.vector_db.chroma_adapter import ChromaDBAdapter
+from src.application.interfaces.llm_port import LLMPort
+from src.application.interfaces.chat_repository_port import ChatRepositoryPort
+from src.application.services.prompt_service import PromptService
+from src.application.use_cases.chat_completion import ChatCompletionUseCase
+from src.domain.entities import Message, Embedding
+from src.domain.value_objects.message_type import MessageType
+
+CONCURRENT_REQUESTS = 8
+SEARCH_LATENCY = 0.2
+
+
+def slow_query(**kwargs):
+    """Simulates a blocking Chroma vector search."""
+    time.sleep(SEARCH_LATENCY)
+    return {"ids": [[]], "documents": [[]], "metadatas": [[]],
+            "distances": [[]]}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_chats_do_not_serialize_behind_vector_search():
+    """Load test: concurrent chat turns overlap their vector searches."""
+    # Arrange
+    collection = MagicMock()
+    collection.query.side_effect = slow_query
+    with patch('chromadb.HttpClient') as mock_client:
+        mock_client.return_value.get_or_create_collection.return_value \
+            = collection
+        vector_db = ChromaDBAdapter(host="localhost", port=8000,
+                                    max_workers=CONCURRENT_REQUESTS)
+
+    llm = AsyncMock(spec=LLMPort)
+    llm.generate_embedding.return_value = Embedding(
+        vector=[0.1, 0.2, 0.3], model="test-model")
+    llm.generate_response.return_value = Message(
+        content="Mocked response", role="assistant", type=MessageType.TEXT)
+    chat_repository = AsyncMock(spec=ChatRepositoryPort)
+    chat_repository.get_session_window.return_value = None
+
+    chat_completion = ChatCompletionUseCase(
+        llm=llm,
+        vector_db=vector_db,
+        chat_repository=chat_repository,
+        prompt_service=PromptService()
+    )
+
+    # Track event loop responsiveness while the requests run
+    max_lag = 0.0
+
+    async def measure_loop_lag():
+        nonlocal max_lag
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            max_lag = max(max_lag, time.perf_counter() - start - 0.01)
+
+    monitor = asyncio.ensure_future(measure_loop_lag())
+
+    # Act
+    start_time = time.perf_counter()
+    await asyncio.gather(*[
+        chat_completion.execute(session_id=f"load-{i}", user_input="Hi")
+        for i in range(CONCURRENT_REQUESTS)
+    ])
+    duration = time.perf_counter() - start_time
+    monitor.cancel()
+
+    print(f"\n{CONCURRENT_REQUESTS} concurrent chats: {duration:.3f}s, "
+          f"max event loop lag {max_lag * 1000:.1f}ms")
+
+    # Assert - serialized searches would take CONCURRENT_REQUESTS times as long
+    assert duration < SEARCH_LATENCY * CONCURRENT_REQUESTS / 2
+    assert max_lag < SEARCH_LATENCY / 2
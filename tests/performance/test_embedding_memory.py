@@ -0,0 +1,63 @@
+import pytest
+import base64
+import time
+import tracemalloc
+import numpy as np
+from src.domain.entities import Embedding
+
+CHUNK_COUNT = 100_000
+SAMPLE_SIZE = 1000
+DIMENSION = 1536
+
+
+def legacy_validate(vector) -> None:
+    """The per-element validation Embedding used to run on Python lists."""
+    if not isinstance(vector, list) or \
+       not all(isinstance(x, float) for x in vector):
+        raise ValueError("Vector must be a list of float values")
+
+
+def retained_bytes(build) -> int:
+    """Measures memory retained by SAMPLE_SIZE objects from build()."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    retained = [build(i) for i in range(SAMPLE_SIZE)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del retained
+    return (after - before) // SAMPLE_SIZE
+
+
+def test_embedding_memory_and_cpu_for_100k_chunks():
+    """Microbenchmark: list-of-floats versus float32 array embeddings."""
+    rng = np.random.default_rng(0)
+    source = rng.random(DIMENSION, dtype=np.float32)
+    payload = base64.b64encode(source.tobytes()).decode()
+
+    # Memory per vector, extrapolated to the full ingest
+    list_bytes = retained_bytes(lambda i: source.tolist())
+    array_bytes = retained_bytes(
+        lambda i: Embedding(vector=np.frombuffer(
+            base64.b64decode(payload), dtype=np.float32), model="m"))
+
+    # CPU: legacy validation over lists, measured on a sample
+    start_time = time.perf_counter()
+    for _ in range(SAMPLE_SIZE):
+        legacy_validate(source.tolist())
+    legacy_duration = ((time.perf_counter() - start_time)
+                       * CHUNK_COUNT / SAMPLE_SIZE)
+
+    # CPU: decode and build every embedding as the adapters now do
+    start_time = time.perf_counter()
+    for _ in range(CHUNK_COUNT):
+        Embedding(vector=np.frombuffer(base64.b64decode(payload),
+                                       dtype=np.float32), model="m")
+    array_duration = time.perf_counter() - start_time
+
+    print(f"\nList vectors:    {list_bytes * CHUNK_COUNT / 2**20:,.0f} MiB, "
+          f"~{legacy_duration:.2f}s for {CHUNK_COUNT:,} chunks")
+    print(f"float32 vectors: {array_bytes * CHUNK_COUNT / 2**20:,.0f} MiB, "
+          f"{array_duration:.2f}s for {CHUNK_COUNT:,} chunks")
+
+    assert array_bytes * 4 < list_bytes
+    assert array_duration < legacy_duration
@@ -0,0 +1,89 @@
+import pytest
+import time
+from unittest.mock import patch
+from src.infrastructure.adapters.vector_db.chroma_adapter import ChromaDBAdapter
+from src.domain.entities import Document, Embedding
+
+CHUNK_COUNT = 10_000
+BATCH_SIZE = 1000
+
+
+class LocalChromaCollection:
+    """
+    Stand-in for a Chroma collection served over HTTP.
+    Charges a fixed round-trip cost per call plus a small per-record
+    insert cost, so call overhead dominates as it does against a server.
+    """
+    def __init__(self, call_overhead: float = 0.0005,
+                 record_cost: float = 0.000005):
+        self.call_overhead = call_overhead
+        self.record_cost = record_cost
+        self.calls = 0
+        self.records = {}
+
+    def _write(self, ids, embeddings, metadatas, documents):
+        self.calls += 1
+        time.sleep(self.call_overhead + self.record_cost * len(ids))
+        for i, record_id in enumerate(ids):
+            self.records[record_id] = (embeddings[i], metadatas[i],
+                                       documents[i])
+
+    def add(self, ids, embeddings, metadatas, documents):
+        self._write(ids, embeddings, metadatas, documents)
+
+    def upsert(self, ids, embeddings, metadatas, documents):
+        self._write(ids, embeddings, metadatas, documents)
+
+
+def create_adapter(collection: LocalChromaCollection) -> ChromaDBAdapter:
+    """Helper to build an adapter backed by the local stand-in."""
+    with patch('chromadb.HttpClient') as mock_client:
+        mock_client.return_value.get_or_create_collection.return_value \
+            = collection
+        return ChromaDBAdapter(host="localhost", port=8000,
+                               batch_size=BATCH_SIZE)
+
+
+def create_chunks(count: int):
+    """Helper to build chunk documents with small embeddings."""
+    documents = [
+        Document(content=f"chunk {i}", source="benchmark")
+        for i in range(count)
+    ]
+    embeddings = [
+        Embedding(vector=[0.1, 0.2, 0.3], model="test-model")
+        for _ in range(count)
+    ]
+    return documents, embeddings
+
+
+@pytest.mark.asyncio
+async def test_batched_ingestion_throughput():
+    """Compare per-chunk and batched write throughput for 10k chunks."""
+    documents, embeddings = create_chunks(CHUNK_COUNT)
+
+    # Per-chunk writes
+    per_chunk = LocalChromaCollection()
+    adapter = create_adapter(per_chunk)
+    start_time = time.perf_counter()
+    for document, embedding in zip(documents, embeddings):
+        await adapter.store_embedding(document, embedding)
+    per_chunk_duration = time.perf_counter() - start_time
+
+    # Batched writes
+    batched = LocalChromaCollection()
+    adapter = create_adapter(batched)
+    start_time = time.perf_counter()
+    await adapter.store_embeddings(documents, embeddings)
+    batched_duration = time.perf_counter() - start_time
+
+    per_chunk_rate = CHUNK_COUNT / per_chunk_duration
+    batched_rate = CHUNK_COUNT / batched_duration
+    print(f"\nPer-chunk: {per_chunk_rate:,.0f} chunks/s "
+          f"({per_chunk.calls} calls)")
+    print(f"Batched:   {batched_rate:,.0f} chunks/s "
+          f"({batched.calls} calls)")
+
+    assert len(batched.records) == CHUNK_COUNT
+    assert batched.calls == CHUNK_COUNT // BATCH_SIZE
+    assert batched_rate > per_chunk_rate * 5
@@ -0,0 +1,90 @@
+import pytest
+import time
+import logging
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from src.presentation.api.middleware import LoggingMiddleware, RateLimitMiddleware
+from src.infrastructure.rate_limit.rate_limiter import MemoryRateLimiter
+
+REQUESTS = 3000
+logger = logging.getLogger(__name__)
+
+
+class BaseHTTPLoggingMiddleware(BaseHTTPMiddleware):
+    """The previous BaseHTTPMiddleware-based logging middleware."""
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        logger.info(f"Request: {request.method} {request.url}")
+        response = await call_next(request)
+        duration = time.time() - start_time
+        logger.info(f"Response: {response.status_code} "
+                    f"Duration: {duration:.3f}s")
+        return response
+
+
+class BaseHTTPRateLimitMiddleware(BaseHTTPMiddleware):
+    """The previous BaseHTTPMiddleware-based rate limit middleware."""
+    def __init__(self, app, limiter):
+        super().__init__(app)
+        self.limiter = limiter
+
+    async def dispatch(self, request: Request, call_next):
+        if not await self.limiter.allow(request.client.host):
+            return JSONResponse(status_code=429, content={})
+        return await call_next(request)
+
+
+def create_app(logging_middleware, rate_limit_middleware) -> FastAPI:
+    """Builds a trivial app behind the given middleware pair."""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    app.add_middleware(logging_middleware)
+    app.add_middleware(rate_limit_middleware,
+                       limiter=MemoryRateLimiter(rate_limit=REQUESTS * 10))
+    return app
+
+
+async def measure_throughput(app: FastAPI) -> float:
+    """Calls the ASGI app directly and returns requests per second."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": "/ping",
+        "raw_path": b"/ping", "root_path": "", "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 50000), "server": ("testserver", 80)
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    statuses = []
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    start_time = time.perf_counter()
+    for _ in range(REQUESTS):
+        await app(dict(scope), receive, send)
+    duration = time.perf_counter() - start_time
+
+    assert statuses == [200] * REQUESTS
+    return REQUESTS / duration
+
+
+@pytest.mark.asyncio
+async def test_asgi_middleware_throughput():
+    """Micro-benchmark requests/sec of a trivial route per middleware."""
+    before = await measure_throughput(create_app(
+        BaseHTTPLoggingMiddleware, BaseHTTPRateLimitMiddleware))
+    after = await measure_throughput(create_app(
+        LoggingMiddleware, RateLimitMiddleware))
+
+    print(f"\nBaseHTTPMiddleware: {before:,.0f} req/s, "
+          f"pure ASGI: {after:,.0f} req/s")
+    assert after > before
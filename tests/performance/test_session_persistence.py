@@ -0,0 +1,61 @@
+import pytest
+import time
+import bson
+from unittest.mock import MagicMock
+from bson import ObjectId
+from src.infrastructure.adapters.repository.mongodb_chat_repository import MongoDBChatRepository
+from src.domain.entities import ChatSession, Message
+from src.domain.value_objects.message_type import MessageType
+
+TURNS = 500
+
+
+class EncodingCollection:
+    """
+    Stand-in for a Motor collection that BSON-encodes every update,
+    as the driver would before sending it, and counts the bytes.
+    """
+    def __init__(self):
+        self.bytes_written = 0
+
+    async def update_one(self, filter, update, upsert=False):
+        self.bytes_written += len(bson.encode(filter)) + \
+            len(bson.encode(update))
+        return MagicMock(matched_count=1)
+
+
+async def run_session(repository: MongoDBChatRepository,
+                      incremental: bool) -> float:
+    """Plays TURNS user/assistant turns, saving after each one."""
+    session = ChatSession(id=str(ObjectId()))
+    start_time = time.perf_counter()
+    for turn in range(TURNS):
+        session.add_message(Message(content=f"Question {turn} " * 20,
+                                    role="user", type=MessageType.TEXT))
+        session.add_message(Message(content=f"Answer {turn} " * 60,
+                                    role="assistant", type=MessageType.TEXT))
+        if not incremental:
+            # Force the original full-document rewrite on every turn
+            session.persisted_message_count = 0
+        await repository.save_session(session)
+    return time.perf_counter() - start_time
+
+
+@pytest.mark.asyncio
+async def test_append_only_persistence_for_500_turn_sessions():
+    """Compare full rewrites and $push appends over a 500-turn session."""
+    results = {}
+    for incremental in (False, True):
+        repository = MongoDBChatRepository(uri="mongodb://localhost:27017",
+                                           database="benchmark")
+        repository.sessions = EncodingCollection()
+        duration = await run_session(repository, incremental)
+        results[incremental] = (repository.sessions.bytes_written, duration)
+
+    for incremental, (written, duration) in results.items():
+        label = "Append-only" if incremental else "Full rewrite"
+        print(f"\n{label}: {written / 2**20:,.1f} MiB encoded, "
+              f"{duration:.2f}s for {TURNS} turns")
+
+    assert results[True][0] * 50 < results[False][0]
+    assert results[True][1] < results[False][1]
@@ -0,0 +1,63 @@
+import pytest
+from unittest.mock import AsyncMock
+from src.application.use_cases.chat_completion import ChatCompletionUseCase
+from src.application.interfaces.llm_port import LLMPort
+from src.application.interfaces.vector_db_port import VectorDBPort
+from src.application.interfaces.chat_repository_port import ChatRepositoryPort
+from src.application.services.prompt_service import PromptService
+from src.domain.entities import Message, Embedding
+
+
+def create_use_case(deltas):
+    """Helper to build the use case around an LLM streaming deltas."""
+    llm = AsyncMock(spec=LLMPort)
+    llm.generate_embedding.return_value = Embedding(
+        vector=[0.1, 0.2, 0.3], model="test-model")
+
+    async def stream_response(**kwargs):
+        for delta in deltas:
+            yield delta
+
+    llm.stream_response = stream_response
+    vector_db = AsyncMock(spec=VectorDBPort)
+    vector_db.search_similar.return_value = []
+    chat_repository = AsyncMock(spec=ChatRepositoryPort)
+    chat_repository.get_session_window.return_value = None
+    use_case = ChatCompletionUseCase(
+        llm=llm,
+        vector_db=vector_db,
+        chat_repository=chat_repository,
+        prompt_service=PromptService()
+    )
+    return use_case, chat_repository
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_saves_assembled_message_at_end():
+    """Test deltas stream out and the full response is saved after."""
+    # Arrange
+    use_case, chat_repository = create_use_case(["Machine ", "learning"])
+
+    # Act
+    items = [item async for item in use_case.execute_stream(
+        session_id="test-session", user_input="What is ML?")]
+
+    # Assert
+    assert items[:2] == ["Machine ", "learning"]
+    assert isinstance(items[2], Message)
+    assert items[2].content == "Machine learning"
+    saved = chat_repository.save_session.call_args.args[0]
+    assert [msg.role for msg in saved.messages] == ["user", "assistant"]
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_closed_early_saves_nothing():
+    """Test a stream abandoned by its consumer does not persist."""
+    use_case, chat_repository = create_use_case(["a", "b", "c"])
+
+    stream = use_case.execute_stream(session_id="test-session",
+                                     user_input="Hi")
+    assert await stream.__anext__() == "a"
+    await stream.aclose()
+
+    chat_repository.save_session.assert_not_called()
@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import AsyncMock, Mock
 from src.application.use_cases.chat_completion import ChatCompletionUseCase
-from src.domain.entities import Message, MessageType
+from src.domain.entities import Message
 
 
 @pytest.mark.asyncio
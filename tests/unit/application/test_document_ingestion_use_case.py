@@ -0,0 +1,150 @@
+import pytest
+import asyncio
+from unittest.mock import AsyncMock
+from src.application.use_cases.document_ingestion import DocumentIngestionUseCase
+from src.domain.entities import Document
+
+
+@pytest.mark.asyncio
+async def test_document_ingestion_pipeline_stores_every_chunk(
+    mock_llm: AsyncMock,
+    mock_vector_db: AsyncMock
+):
+    """Test the pipeline embeds in batches and stores every chunk."""
+    # Arrange
+    use_case = DocumentIngestionUseCase(
+        llm=mock_llm,
+        vector_db=mock_vector_db,
+        embedding_batch_size=4,
+        embedding_concurrency=2,
+        storage_batch_size=6,
+        storage_concurrency=2,
+        queue_size=1
+    )
+    documents = [
+        Document(content="x" * 5000, source=f"doc-{i}") for i in range(3)
+    ]
+
+    # Act
+    await use_case.execute(documents=documents, chunk_size=500)
+
+    # Assert
+    stored = [
+        chunk
+        for call in mock_vector_db.upsert_embeddings.call_args_list
+        for chunk in call.args[0]
+    ]
+    assert len(stored) == 3 * 12
+    assert len({chunk.id for chunk in stored}) == len(stored)
+    assert all(len(chunk.embeddings) == 1 for chunk in stored)
+    assert all(len(call.args[0]) <= 4
+               for call in mock_llm.generate_embeddings.call_args_list)
+
+
+@pytest.mark.asyncio
+async def test_document_ingestion_pipeline_propagates_storage_errors(
+    mock_llm: AsyncMock,
+    mock_vector_db: AsyncMock
+):
+    """Test a failing stage aborts the pipeline instead of hanging."""
+    mock_vector_db.upsert_embeddings.side_effect = RuntimeError("store failed")
+    use_case = DocumentIngestionUseCase(
+        llm=mock_llm,
+        vector_db=mock_vector_db,
+        embedding_batch_size=1,
+        storage_batch_size=1,
+        queue_size=1
+    )
+    documents = [Document(content="x" * 5000, source="doc")]
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(
+            use_case.execute(documents=documents, chunk_size=500),
+            timeout=5
+        )
+
+
+@pytest.mark.asyncio
+async def test_document_ingestion_reports_progress(
+    mock_llm: AsyncMock,
+    mock_vector_db: AsyncMock
+):
+    """Test progress snapshots count up to every stored chunk."""
+    # Arrange
+    use_case = DocumentIngestionUseCase(
+        llm=mock_llm,
+        vector_db=mock_vector_db,
+        embedding_batch_size=4,
+        storage_batch_size=6
+    )
+    documents = [
+        Document(content="x" * 5000, source="doc"),
+        Document(content="x" * 1230, source="short")
+    ]
+    snapshots = []
+
+    # Act
+    result = await use_case.execute(documents=documents, chunk_size=500,
+                                    progress_callback=snapshots.append)
+
+    # Assert
+    assert snapshots[0].total_chunks == 12 + 3
+    assert snapshots[0].stored_chunks == 0
+    assert [s.stored_chunks for s in snapshots] == \
+        sorted(s.stored_chunks for s in snapshots)
+    assert snapshots[-1].done and snapshots[-1].fraction == 1.0
+    assert result.embedded_chunks == result.stored_chunks == 15
+
+
+@pytest.mark.asyncio
+async def test_document_ingestion_consumes_async_iterables(
+    mock_llm: AsyncMock,
+    mock_vector_db: AsyncMock
+):
+    """Test streamed documents are counted and stored as they arrive."""
+    # Arrange
+    use_case = DocumentIngestionUseCase(
+        llm=mock_llm,
+        vector_db=mock_vector_db,
+        embedding_batch_size=4,
+        queue_size=1
+    )
+
+    async def documents():
+        for i in range(3):
+            yield Document(content="x" * 5000, source=f"doc-{i}")
+
+    stored = []
+
+    # Act
+    result = await use_case.execute(documents=documents(), chunk_size=500,
+                                    stored_callback=stored.extend)
+
+    # Assert
+    assert result.total_chunks == result.stored_chunks == 3 * 12
+    assert len(stored) == 3 * 12
+    assert len({chunk.metadata["parent_id"] for chunk in stored}) == 3
+
+
+@pytest.mark.asyncio
+async def test_document_ingestion_rerun_upserts_same_chunks(
+    mock_llm: AsyncMock,
+    mock_vector_db: AsyncMock
+):
+    """Test rerunning a document upserts chunks under the same IDs."""
+    # Arrange
+    use_case = DocumentIngestionUseCase(llm=mock_llm, vector_db=mock_vector_db)
+    document = Document(content="x" * 2000, source="doc")
+
+    # Act
+    await use_case.execute(documents=[document], chunk_size=500)
+    await use_case.execute(documents=[document], chunk_size=500)
+
+    # Assert
+    first, second = [
+        [chunk.id for chunk in call.args[0]]
+        for call in mock_vector_db.upsert_embeddings.call_args_list
+    ]
+    assert first == second
+    assert first[0] == f"{document.id}:0"
+    mock_vector_db.store_embeddings.assert_not_called()
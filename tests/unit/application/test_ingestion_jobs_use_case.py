@@ -0,0 +1,93 @@
+import pytest
+import asyncio
+from unittest.mock import AsyncMock
+from src.application.use_cases.document_ingestion import DocumentIngestionUseCase
+from src.application.use_cases.ingestion_jobs import IngestionJobUseCase
+from src.infrastructure.adapters.repository.sqlite_ingestion_job_store import SQLiteIngestionJobStore
+from src.domain.entities import Document
+from src.domain.value_objects.job_status import JobStatus
+
+
+async def wait_for_job(use_case: IngestionJobUseCase, job_id: str):
+    """Helper to poll a job until it finishes."""
+    while True:
+        job = await use_case.get_job(job_id)
+        if job.status in (JobStatus.SUCCEEDED, JobStatus.FAILED):
+            return job
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_ingestion_jobs_run_in_background(
+    tmp_path,
+    document_ingestion_use_case: DocumentIngestionUseCase
+):
+    """Test submitted jobs return at once and are run by the workers."""
+    # Arrange
+    store = SQLiteIngestionJobStore(str(tmp_path / "jobs.sqlite3"))
+    use_case = IngestionJobUseCase(document_ingestion_use_case, store,
+                                   poll_interval=0.05)
+    await use_case.start()
+
+    # Act
+    job = await use_case.submit(
+        [Document(content="x" * 5000, source="doc")], chunk_size=500)
+    finished = await asyncio.wait_for(wait_for_job(use_case, job.id), 5)
+
+    # Assert
+    assert job.status == JobStatus.QUEUED
+    assert finished.status == JobStatus.SUCCEEDED
+    assert finished.progress.stored_chunks == 12
+    assert finished.throughput > 0
+    await use_case.stop()
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_ingestion_jobs_record_failures(
+    tmp_path,
+    document_ingestion_use_case: DocumentIngestionUseCase,
+    mock_vector_db: AsyncMock
+):
+    """Test a failing job is marked failed with its error."""
+    mock_vector_db.upsert_embeddings.side_effect = RuntimeError("store failed")
+    store = SQLiteIngestionJobStore(str(tmp_path / "jobs.sqlite3"))
+    use_case = IngestionJobUseCase(document_ingestion_use_case, store,
+                                   poll_interval=0.05)
+    await use_case.start()
+
+    job = await use_case.submit([Document(content="x" * 500, source="doc")])
+    finished = await asyncio.wait_for(wait_for_job(use_case, job.id), 5)
+
+    assert finished.status == JobStatus.FAILED
+    assert finished.error == "store failed"
+    await use_case.stop()
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_ingestion_jobs_stop_requeues_running_jobs(
+    tmp_path,
+    document_ingestion_use_case: DocumentIngestionUseCase,
+    mock_vector_db: AsyncMock
+):
+    """Test stopping the workers hands running jobs back to the queue."""
+    started = asyncio.Event()
+
+    async def block(*args):
+        started.set()
+        await asyncio.Event().wait()
+
+    mock_vector_db.upsert_embeddings.side_effect = block
+    store = SQLiteIngestionJobStore(str(tmp_path / "jobs.sqlite3"))
+    use_case = IngestionJobUseCase(document_ingestion_use_case, store,
+                                   poll_interval=0.05)
+    await use_case.start()
+
+    job = await use_case.submit([Document(content="x" * 500, source="doc")])
+    await asyncio.wait_for(started.wait(), 5)
+    await use_case.stop()
+
+    assert (await use_case.get_job(job.id)).status == JobStatus.QUEUED
+    assert (await store.claim_job(lease_timeout=60)).attempts == 2
+    await store.close()
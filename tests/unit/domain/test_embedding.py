@@ -0,0 +1,30 @@
+import pytest
+import numpy as np
+from src.domain.entities import Embedding
+
+
+def test_embedding_stores_contiguous_float32_vector():
+    """Test list input is converted to a float32 array."""
+    embedding = Embedding(vector=[0.1, 0.2, 0.3], model="test-model")
+
+    assert embedding.vector.dtype == np.float32
+    assert embedding.vector.flags["C_CONTIGUOUS"]
+    assert embedding.dimension == 3
+
+
+def test_embedding_reuses_float32_arrays():
+    """Test float32 arrays are kept without copying."""
+    vector = np.zeros(1536, dtype=np.float32)
+
+    embedding = Embedding(vector=vector, model="test-model")
+
+    assert embedding.vector is vector
+
+
+def test_invalid_embedding_vector():
+    """Test that non-numeric or nested vectors raise an error."""
+    with pytest.raises(ValueError):
+        Embedding(vector=["a", "b"], model="test-model")
+
+    with pytest.raises(ValueError):
+        Embedding(vector=[[0.1], [0.2]], model="test-model")
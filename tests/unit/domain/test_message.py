@@ -1,6 +1,7 @@
 import pytest
 from datetime import datetime
-from src.domain.entities import Message, MessageType
+from src.domain.entities import Message
+from src.domain.value_objects.message_type import MessageType
 from src.domain.entities.exceptions import InvalidMessageError
 
 
@@ -0,0 +1,93 @@
+import pytest
+import asyncio
+from unittest.mock import AsyncMock
+from src.infrastructure.adapters.repository.cached_chat_repository import CachedChatRepository
+from src.application.interfaces.chat_repository_port import ChatRepositoryPort
+from src.domain.entities import ChatSession
+from tests.utils.test_helpers import create_test_message
+
+
+@pytest.mark.asyncio
+async def test_saved_sessions_are_served_from_cache():
+    """Test a saved session is read back without a storage round trip."""
+    # Arrange
+    backend = AsyncMock(spec=ChatRepositoryPort)
+    repository = CachedChatRepository(backend)
+    session = ChatSession(messages=[create_test_message("hello")])
+
+    # Act
+    await repository.save_session(session)
+    session.add_message(create_test_message("unsaved"))
+    first = await repository.get_session_window(session.id, 10)
+    first.add_message(create_test_message("also unsaved"))
+    second = await repository.get_session(session.id)
+
+    # Assert
+    backend.save_session.assert_called_once()
+    backend.get_session.assert_not_called()
+    backend.get_session_window.assert_not_called()
+    assert [msg.content for msg in second.messages] == ["hello"]
+    assert repository.stats()["hits"] == 2
+    assert repository.stats()["hit_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded_by_size_and_ttl():
+    """Test entries are evicted past capacity and reloaded after the TTL."""
+    backend = AsyncMock(spec=ChatRepositoryPort)
+    backend.get_session.side_effect = lambda session_id: \
+        ChatSession(id=session_id)
+    repository = CachedChatRepository(backend, max_sessions=2, ttl=0.05)
+
+    for session_id in ("a", "b", "c"):
+        await repository.get_session(session_id)
+    await repository.get_session("c")
+    await asyncio.sleep(0.06)
+    await repository.get_session("c")
+
+    stats = repository.stats()
+    assert stats["evictions"] == 1
+    assert stats["expirations"] == 1
+    assert stats["hits"] == 1
+    assert backend.get_session.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_cached_sessions_keep_only_recent_messages():
+    """Test a growing session is cached as a bounded window."""
+    backend = AsyncMock(spec=ChatRepositoryPort)
+    repository = CachedChatRepository(backend, max_messages=4)
+    session = ChatSession()
+
+    for turn in range(30):
+        session.add_message(create_test_message(f"turn {turn}"))
+        await repository.save_session(session)
+    window = await repository.get_session_window(session.id, 3)
+    older = await repository.get_messages(session.id, 0, 5)
+
+    cached, _ = repository.sessions[session.id]
+    assert len(cached.messages) == 4 and cached.history_offset == 26
+    assert [msg.content for msg in window.messages] == \
+        ["turn 27", "turn 28", "turn 29"]
+    assert window.history_offset == 27 and window.message_count == 30
+    backend.get_session_window.assert_not_called()
+    assert older is backend.get_messages.return_value
+
+
+@pytest.mark.asyncio
+async def test_lock_session_serializes_turns_on_one_session():
+    """Test concurrent turns on a session never interleave."""
+    repository = CachedChatRepository(AsyncMock(spec=ChatRepositoryPort))
+    events = []
+
+    async def turn(name: str, session_id: str):
+        async with repository.lock_session(session_id):
+            events.append(f"{name} start")
+            await asyncio.sleep(0.01)
+            events.append(f"{name} end")
+
+    await asyncio.gather(turn("first", "s"), turn("second", "s"))
+
+    assert events == ["first start", "first end",
+                      "second start", "second end"]
+    assert repository.locks == {}
@@ -0,0 +1,59 @@
+import pytest
+from unittest.mock import AsyncMock
+from src.infrastructure.adapters.llm.cached_llm_adapter import CachedLLMAdapter
+from src.infrastructure.cache.embedding_cache import EmbeddingCache
+
+
+@pytest.mark.asyncio
+async def test_cached_llm_only_embeds_misses(tmp_path, mock_llm: AsyncMock):
+    """Test repeated texts are served from the in-memory tier."""
+    # Arrange
+    cache = EmbeddingCache(path=str(tmp_path / "cache.db"), max_entries=10)
+    adapter = CachedLLMAdapter(llm=mock_llm, cache=cache,
+                               embedding_model="model-a")
+
+    # Act
+    await adapter.generate_embeddings(["a", "bb"])
+    embeddings = await adapter.generate_embeddings(["bb", "ccc", "a"])
+
+    # Assert
+    assert [e.vector.tolist() for e in embeddings] == [[2.0], [3.0], [1.0]]
+    assert mock_llm.generate_embeddings.call_args_list[1].args[0] == ["ccc"]
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 3
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_cached_llm_persists_and_invalidates_by_model(
+    tmp_path,
+    mock_llm: AsyncMock
+):
+    """Test the disk tier survives restarts and is keyed by model."""
+    path = str(tmp_path / "cache.db")
+    cache = EmbeddingCache(path=path, max_entries=1)
+    adapter = CachedLLMAdapter(llm=mock_llm, cache=cache,
+                               embedding_model="model-a")
+    await adapter.generate_embeddings(["a", "bb"])
+    assert cache.stats()["evictions"] == 1
+    cache.close()
+
+    # Same model after a restart reads from disk
+    mock_llm.reset_mock()
+    cache = EmbeddingCache(path=path, max_entries=10)
+    adapter = CachedLLMAdapter(llm=mock_llm, cache=cache,
+                               embedding_model="model-a")
+    await adapter.generate_embedding("a")
+    mock_llm.generate_embeddings.assert_not_called()
+    assert cache.stats()["disk_hits"] == 1
+    cache.close()
+
+    # A different model never sees those vectors
+    mock_llm.reset_mock()
+    cache = EmbeddingCache(path=path, max_entries=10)
+    adapter = CachedLLMAdapter(llm=mock_llm, cache=cache,
+                               embedding_model="model-b")
+    await adapter.warmup()
+    await adapter.generate_embedding("a")
+    mock_llm.generate_embeddings.assert_called_once_with(["a"])
+    cache.close()
@@ -27,3 +27,53 @@ async def test_chroma_store_embedding():
 
         # Assert
         mock_collection.add.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_chroma_store_embeddings_in_batches():
+    """Test bulk storage is split into batch-sized add calls."""
+    mock_collection = MagicMock()
+
+    with patch('chromadb.HttpClient') as mock_client:
+        mock_client.return_value.get_or_create_collection.return_value \
+            = mock_collection
+        adapter = ChromaDBAdapter(host="localhost", port=8000, batch_size=2)
+
+    documents = [
+        MagicMock(id=f"id-{i}", content="test content", metadata={})
+        for i in range(5)
+    ]
+    embeddings = [MagicMock(vector=[0.1, 0.2, 0.3]) for _ in range(5)]
+
+    await adapter.store_embeddings(documents, embeddings)
+    await adapter.upsert_embeddings(documents[:1], embeddings[:1])
+
+    assert mock_collection.add.call_count == 3
+    assert mock_collection.add.call_args_list[2].kwargs["ids"] == ["id-4"]
+    mock_collection.upsert.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_chroma_search_similar_batch_uses_one_query():
+    """Test several query embeddings are answered in a single call."""
+    mock_collection = MagicMock()
+    mock_collection.query.return_value = {
+        "ids": [["a"], ["b"]],
+        "documents": [["doc a"], ["doc b"]],
+        "metadatas": [[{"source": "s"}], [{"source": "s"}]],
+        "distances": [[0.1], [0.9]]
+    }
+
+    with patch('chromadb.HttpClient') as mock_client:
+        mock_client.return_value.get_or_create_collection.return_value \
+            = mock_collection
+        adapter = ChromaDBAdapter(host="localhost", port=8000)
+
+    results = await adapter.search_similar_batch(
+        embeddings=[MagicMock(vector=[0.1, 0.2]), MagicMock(vector=[0.3, 0.4])],
+        limit=1,
+        score_threshold=0.5
+    )
+
+    mock_collection.query.assert_called_once()
+    assert [[doc.id for doc in docs] for docs in results] == [["a"], []]
@@ -0,0 +1,104 @@
+import asyncio
+import pytest
+import numpy as np
+from src.infrastructure.adapters.vector_db.hnsw_adapter import HNSWVectorDBAdapter
+from src.domain.entities import Document, Embedding
+
+
+def create_records(vectors, prefix: str = "doc"):
+    """Helper to build documents and embeddings from raw vectors."""
+    documents = [
+        Document(id=f"{prefix}-{i}", content=f"content {i}", source="test")
+        for i in range(len(vectors))
+    ]
+    embeddings = [Embedding(vector=v, model="test-model") for v in vectors]
+    return documents, embeddings
+
+
+@pytest.mark.asyncio
+async def test_hnsw_adapter_search_and_delete(tmp_path):
+    """Test inserts, nearest neighbour search and deletes."""
+    # Arrange
+    adapter = HNSWVectorDBAdapter(path=str(tmp_path), initial_capacity=2)
+    documents, embeddings = create_records(
+        [[1.0, 0.0], [0.0, 1.0], [0.7, 0.7]])
+    query = Embedding(vector=[1.0, 0.1], model="test-model")
+
+    # Act
+    await adapter.store_embeddings(documents, embeddings)
+    before = await adapter.search_similar(query, limit=2)
+    await adapter.delete_document("doc-0")
+    after = await adapter.search_similar(query, limit=5)
+
+    # Assert
+    assert [doc.id for doc in before] == ["doc-0", "doc-2"]
+    assert [doc.id for doc in after] == ["doc-2", "doc-1"]
+
+
+@pytest.mark.asyncio
+async def test_hnsw_adapter_recovers_journal_after_restart(tmp_path):
+    """Test writes after the last snapshot are replayed on start."""
+    rng = np.random.default_rng(0)
+    adapter = HNSWVectorDBAdapter(path=str(tmp_path), snapshot_interval=5)
+    await adapter.store_embeddings(*create_records(rng.random((5, 8)), "a"))
+    await adapter.store_embeddings(*create_records(rng.random((3, 8)), "b"))
+    await adapter.delete_document("a-0")
+    assert adapter.pending == 3
+
+    reopened = HNSWVectorDBAdapter(path=str(tmp_path))
+    results = await reopened.search_similar(
+        Embedding(vector=rng.random(8), model="test-model"), limit=10)
+
+    assert sorted(doc.id for doc in results) == [
+        "a-1", "a-2", "a-3", "a-4", "b-0", "b-1", "b-2"]
+
+
+@pytest.mark.asyncio
+async def test_hnsw_adapter_batch_search(tmp_path):
+    """Test a batch of queries returns results per query, in order."""
+    adapter = HNSWVectorDBAdapter(path=str(tmp_path))
+    await adapter.store_embeddings(*create_records(
+        [[1.0, 0.0], [0.0, 1.0], [0.7, 0.7]]))
+
+    results = await adapter.search_similar_batch(
+        [Embedding(vector=[0.0, 1.0], model="test-model"),
+         Embedding(vector=[1.0, 0.0], model="test-model")],
+        limit=1
+    )
+
+    assert [[doc.id for doc in docs] for docs in results] == [
+        ["doc-1"], ["doc-0"]]
+
+
+@pytest.mark.asyncio
+async def test_hnsw_adapter_searches_while_writing(tmp_path):
+    """Test searches run alongside inserts that grow the graph."""
+    rng = np.random.default_rng(1)
+    adapter = HNSWVectorDBAdapter(path=str(tmp_path), initial_capacity=2,
+                                  ef_search=10)
+    await adapter.store_embeddings(*create_records(rng.random((2, 8)), "a"))
+    query = Embedding(vector=rng.random(8), model="test-model")
+
+    writes = [
+        adapter.store_embeddings(*create_records(rng.random((4, 8)), f"w{i}"))
+        for i in range(10)
+    ]
+    searches = [adapter.search_similar(query, limit=20) for _ in range(20)]
+    results = await asyncio.gather(*writes, *searches)
+
+    assert all(len(docs) >= 2 for docs in results[len(writes):])
+    assert len(await adapter.search_similar(query, limit=50)) == 42
+    assert adapter.index.ef == 10
+
+
+@pytest.mark.asyncio
+async def test_hnsw_adapter_ef_search_can_be_changed(tmp_path):
+    """Test set_ef_search applies before and after the graph is built."""
+    adapter = HNSWVectorDBAdapter(path=str(tmp_path), ef_search=10)
+    adapter.set_ef_search(32)
+    await adapter.store_embeddings(*create_records([[1.0, 0.0]]))
+    assert adapter.index.ef == 32
+
+    adapter.set_ef_search(128)
+
+    assert adapter.index.ef == 128
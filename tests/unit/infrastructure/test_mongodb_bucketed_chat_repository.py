@@ -0,0 +1,199 @@
+import pytest
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from src.infrastructure.adapters.repository.mongodb_bucketed_chat_repository import MongoDBBucketedChatRepository
+from src.domain.entities import ChatSession
+from tests.utils.test_helpers import create_test_message
+
+
+class FakeCursor:
+    """Minimal async Motor cursor over a list of documents."""
+    def __init__(self, rows):
+        self.rows = rows
+
+    def sort(self, key, direction):
+        self.rows = sorted(self.rows, key=lambda row: row[key],
+                           reverse=direction < 0)
+        return self
+
+    def limit(self, count):
+        self.rows = self.rows[:count]
+        return self
+
+    def __aiter__(self):
+        self.iterator = iter(self.rows)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.iterator)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def create_repository(bucket_size: int = 4) -> MongoDBBucketedChatRepository:
+    """Helper to create a repository with mocked collections."""
+    repository = MongoDBBucketedChatRepository(
+        uri="mongodb://localhost:27017", database="test",
+        bucket_size=bucket_size)
+    repository.sessions = MagicMock()
+    repository.buckets = MagicMock()
+    repository.buckets.bulk_write = AsyncMock()
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_save_session_appends_to_tail_buckets():
+    """Test new messages are pushed into the buckets of their positions."""
+    # Arrange
+    repository = create_repository()
+    repository.sessions.find_one_and_update = AsyncMock(
+        return_value={"message_count": 3})
+    session = ChatSession(id="session", persisted_message_count=3,
+                          messages=[create_test_message(str(i))
+                                    for i in range(6)])
+
+    # Act
+    await repository.save_session(session)
+
+    # Assert
+    header_update = repository.sessions.find_one_and_update.call_args
+    assert header_update.args[1]["$inc"] == {"message_count": 3}
+    operations = repository.buckets.bulk_write.call_args.args[0]
+    pushed = [
+        (op._filter["bucket_no"],
+         [msg["content"] for msg in op._doc["$push"]["messages"]["$each"]])
+        for op in operations
+    ]
+    assert pushed == [(0, ["3"]), (1, ["4", "5"])]
+    assert [msg["seq"] for op in operations
+            for msg in op._doc["$push"]["messages"]["$each"]] == [3, 4, 5]
+    assert session.persisted_message_count == 6
+
+
+@pytest.mark.asyncio
+async def test_get_session_window_reads_only_tail_buckets():
+    """Test windowed reads stop once the last buckets fill the window."""
+    repository = create_repository()
+    repository.sessions.find_one = AsyncMock(return_value={
+        "_id": "session", "message_count": 10, "metadata": {},
+        "created_at": datetime.utcnow(), "last_activity": datetime.utcnow()
+    })
+    stored = [{**repository._message_to_dict(create_test_message(str(i))),
+               "seq": i}
+              for i in range(10)]
+    cursor = FakeCursor([
+        {"bucket_no": 0, "messages": stored[0:4]},
+        {"bucket_no": 1, "messages": stored[4:8]},
+        {"bucket_no": 2, "messages": stored[8:10]}
+    ])
+    repository.buckets.find = MagicMock(return_value=cursor)
+
+    session = await repository.get_session_window("session", 3)
+
+    assert [msg.content for msg in session.messages] == ["7", "8", "9"]
+    assert session.history_offset == 7
+    assert session.message_count == 10
+    assert [bucket["bucket_no"] for bucket in cursor.rows] == [2, 1]
+
+
+class FakeBucketStore:
+    """In-memory header and bucket collections applying $inc and $push."""
+    def __init__(self):
+        self.header = None
+        self.buckets = {}
+        # Events the next bulk writes wait on, in call order
+        self.gates = []
+
+    async def find_one_and_update(self, query, update, **kwargs):
+        before = self.header
+        count = (before or {}).get("message_count", 0)
+        self.header = {
+            "_id": query["_id"], "metadata": {},
+            "created_at": datetime.utcnow(),
+            "last_activity": datetime.utcnow(),
+            "message_count": count + update["$inc"]["message_count"]
+        }
+        return before and {"message_count": count}
+
+    async def find_one(self, query):
+        return self.header
+
+    async def bulk_write(self, operations, ordered=True):
+        gate = self.gates.pop(0) if self.gates else None
+        if gate is not None:
+            await gate.wait()
+        for op in operations:
+            bucket_no = op._filter["bucket_no"]
+            push = op._doc["$push"]["messages"]
+            bucket = self.buckets.setdefault(
+                bucket_no, {"bucket_no": bucket_no, "messages": []})
+            bucket["messages"].extend(push["$each"])
+            bucket["messages"].sort(key=lambda msg: msg["seq"])
+
+    def find(self, query):
+        bounds = query.get("bucket_no", {})
+        return FakeCursor([
+            bucket for bucket_no, bucket in self.buckets.items()
+            if bounds.get("$gte", 0) <= bucket_no
+            <= bounds.get("$lte", bucket_no)
+        ])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_appends_read_back_in_reserved_order():
+    """Test appends whose bucket writes land out of order keep positions."""
+    # Arrange
+    repository = create_repository(bucket_size=3)
+    store = FakeBucketStore()
+    repository.sessions = store
+    repository.buckets = store
+    first_gate = asyncio.Event()
+    store.gates.append(first_gate)
+    first = ChatSession(id="session", messages=[
+        create_test_message(f"a{i}") for i in range(2)])
+    second = ChatSession(id="session", messages=[
+        create_test_message(f"b{i}") for i in range(2)])
+
+    # Act: the first writer reserves [0, 2) but its push lands last
+    first_save = asyncio.ensure_future(repository.save_session(first))
+    await asyncio.sleep(0)
+    await repository.save_session(second)
+    first_gate.set()
+    await first_save
+
+    # Assert
+    expected = ["a0", "a1", "b0", "b1"]
+    session = await repository.get_session("session")
+    assert [msg.content for msg in session.messages] == expected
+    middle = await repository.get_messages("session", 1, 2)
+    assert [msg.content for msg in middle] == ["a1", "b0"]
+    window = await repository.get_session_window("session", 3)
+    assert [msg.content for msg in window.messages] == expected[1:]
+    assert window.history_offset == 1
+
+
+@pytest.mark.asyncio
+async def test_lost_bucket_write_leaves_later_positions_intact():
+    """Test positions reserved by a failed write are skipped on read."""
+    repository = create_repository(bucket_size=3)
+    store = FakeBucketStore()
+    repository.sessions = store
+    repository.buckets = store
+    await repository.save_session(ChatSession(
+        id="session", messages=[create_test_message("kept")]))
+
+    # The header is bumped but the bucket write never lands
+    store.bulk_write, bulk_write = AsyncMock(), store.bulk_write
+    await repository.save_session(ChatSession(
+        id="session", messages=[create_test_message("lost")]))
+    store.bulk_write = bulk_write
+    await repository.save_session(ChatSession(
+        id="session", messages=[create_test_message("later")]))
+
+    assert [msg.content for msg in
+            await repository.get_messages("session", 2, 1)] == ["later"]
+    window = await repository.get_session_window("session", 1)
+    assert [msg.content for msg in window.messages] == ["later"]
+    assert window.history_offset == 2
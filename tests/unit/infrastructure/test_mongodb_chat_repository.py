@@ -0,0 +1,142 @@
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from bson import ObjectId
+from src.infrastructure.adapters.repository.mongodb_chat_repository import MongoDBChatRepository
+from src.domain.entities import ChatSession
+from tests.utils.test_helpers import create_test_message
+
+
+def create_repository() -> MongoDBChatRepository:
+    """Helper to create a repository with a mocked collection."""
+    repository = MongoDBChatRepository(uri="mongodb://localhost:27017",
+                                       database="test")
+    repository.sessions = MagicMock()
+    repository.sessions.update_one = AsyncMock(
+        return_value=MagicMock(matched_count=1))
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_save_session_pushes_only_new_messages():
+    """Test saved sessions append new messages instead of rewriting."""
+    # Arrange
+    repository = create_repository()
+    session = ChatSession(id=str(ObjectId()))
+    session.add_message(create_test_message("first"))
+
+    # Act
+    await repository.save_session(session)
+    session.add_message(create_test_message("reply", role="assistant"))
+    await repository.save_session(session)
+
+    # Assert
+    first, second = repository.sessions.update_one.call_args_list
+    assert "$set" in first.args[1] and "$push" not in first.args[1]
+    assert first.args[1]["$set"]["message_count"] == 1
+    assert second.args[0]["message_count"] == 1
+    pushed = second.args[1]["$push"]["messages"]["$each"]
+    assert [msg["content"] for msg in pushed] == ["reply"]
+    assert session.persisted_message_count == 2
+
+
+@pytest.mark.asyncio
+async def test_save_session_rewrites_when_stored_count_differs():
+    """Test a mismatched append falls back to a full rewrite."""
+    repository = create_repository()
+    repository.sessions.update_one.side_effect = [
+        MagicMock(matched_count=0), MagicMock(matched_count=1)]
+    session = ChatSession(id=str(ObjectId()), persisted_message_count=1,
+                          messages=[create_test_message("a"), create_test_message("b")])
+
+    await repository.save_session(session)
+
+    rewrite = repository.sessions.update_one.call_args_list[1]
+    assert len(rewrite.args[1]["$set"]["messages"]) == 2
+    assert rewrite.kwargs["upsert"] is True
+
+
+@pytest.mark.asyncio
+async def test_get_session_window_slices_messages_server_side():
+    """Test windowed loads project the last messages and keep the offset."""
+    # Arrange
+    repository = create_repository()
+    session_id = ObjectId()
+    repository.sessions.find_one = AsyncMock(return_value={
+        "_id": session_id,
+        "messages": [repository._message_to_dict(create_test_message("recent"))],
+        "message_count": 40,
+        "metadata": {},
+        "created_at": datetime.utcnow(),
+        "last_activity": datetime.utcnow()
+    })
+
+    # Act
+    session = await repository.get_session_window(str(session_id), 1)
+    session.add_message(create_test_message("new"))
+    await repository.save_session(session)
+
+    # Assert
+    projection = repository.sessions.find_one.call_args.args[1]
+    assert projection == {"messages": {"$slice": -1}}
+    assert session.history_offset == 39
+    assert session.message_count == 41
+    update = repository.sessions.update_one.call_args
+    assert update.args[0]["message_count"] == 40
+    assert [msg["content"] for msg in
+            update.args[1]["$push"]["messages"]["$each"]] == ["new"]
+
+
+class FakeCursor:
+    """Minimal async Motor cursor over a list of documents."""
+    def __init__(self, rows):
+        self.rows = rows
+
+    def sort(self, keys):
+        self.sort_keys = keys
+        return self
+
+    def limit(self, count):
+        self.rows = self.rows[:count]
+        return self
+
+    def __aiter__(self):
+        self.iterator = iter(self.rows)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.iterator)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+@pytest.mark.asyncio
+async def test_list_session_summaries_pages_by_keyset_cursor():
+    """Test summaries page on (last_activity, _id) without messages."""
+    # Arrange
+    repository = create_repository()
+    rows = [
+        {"_id": ObjectId(), "message_count": count, "metadata": {},
+         "created_at": datetime(2024, 1, 1),
+         "last_activity": datetime(2024, 1, 1, 12, count)}
+        for count in (3, 2, 1)
+    ]
+    repository.sessions.find = MagicMock(
+        side_effect=lambda query, projection: FakeCursor(list(rows)))
+
+    # Act
+    first = await repository.list_session_summaries(limit=2)
+    await repository.list_session_summaries(limit=2,
+                                            cursor=first.next_cursor)
+
+    # Assert
+    assert [summary.message_count for summary in first.sessions] == [3, 2]
+    first_query, projection = repository.sessions.find.call_args_list[0].args
+    assert first_query == {}
+    assert "messages" not in projection
+    next_query = repository.sessions.find.call_args_list[1].args[0]
+    assert next_query["$or"][1] == {
+        "last_activity": rows[1]["last_activity"],
+        "_id": {"$lt": rows[1]["_id"]}
+    }
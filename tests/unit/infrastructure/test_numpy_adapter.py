@@ -0,0 +1,78 @@
+import pytest
+import numpy as np
+from src.infrastructure.adapters.vector_db.numpy_adapter import NumpyVectorDBAdapter
+from src.domain.entities import Document, Embedding
+
+
+def create_records(vectors):
+    """Helper to build documents and embeddings from raw vectors."""
+    documents = [
+        Document(id=f"doc-{i}", content=f"content {i}", source="test")
+        for i in range(len(vectors))
+    ]
+    embeddings = [Embedding(vector=v, model="test-model") for v in vectors]
+    return documents, embeddings
+
+
+@pytest.mark.asyncio
+async def test_numpy_adapter_search_returns_nearest(tmp_path):
+    """Test exact search ranks documents by cosine similarity."""
+    # Arrange
+    adapter = NumpyVectorDBAdapter(path=str(tmp_path), initial_capacity=2)
+    documents, embeddings = create_records(
+        [[1.0, 0.0], [0.0, 1.0], [0.7, 0.7]])
+
+    # Act
+    await adapter.store_embeddings(documents, embeddings)
+    results = await adapter.search_similar(
+        Embedding(vector=[1.0, 0.1], model="test-model"), limit=2)
+
+    # Assert
+    assert [doc.id for doc in results] == ["doc-0", "doc-2"]
+    assert results[0].metadata["source"] == "test"
+    assert results[0].metadata["similarity_score"] > 0.99
+
+
+@pytest.mark.asyncio
+async def test_numpy_adapter_deletes_compacts_and_reopens(tmp_path):
+    """Test tombstones, compaction and cold start from the mapped file."""
+    adapter = NumpyVectorDBAdapter(path=str(tmp_path), compaction_ratio=0.5)
+    rng = np.random.default_rng(0)
+    documents, embeddings = create_records(rng.random((10, 4)))
+    await adapter.store_embeddings(documents, embeddings)
+
+    await adapter.delete_document("doc-0")
+    assert adapter.generation == 0
+    for i in range(1, 6):
+        await adapter.delete_document(f"doc-{i}")
+    assert adapter.generation == 1
+    assert adapter.count == 4
+
+    # Upserting an id replaces its record
+    await adapter.upsert_embeddings(
+        [Document(id="doc-9", content="updated", source="test")],
+        [Embedding(vector=[1.0, 0.0, 0.0, 0.0], model="test-model")])
+
+    reopened = NumpyVectorDBAdapter(path=str(tmp_path))
+    results = await reopened.search_similar(
+        Embedding(vector=[1.0, 0.0, 0.0, 0.0], model="test-model"), limit=10)
+
+    assert sorted(doc.id for doc in results) == [
+        "doc-6", "doc-7", "doc-8", "doc-9"]
+    assert results[0].content == "updated"
+
+
+@pytest.mark.asyncio
+async def test_numpy_adapter_batch_search_matches_single_queries(tmp_path):
+    """Test one batched search returns the same as per-query searches."""
+    adapter = NumpyVectorDBAdapter(path=str(tmp_path))
+    rng = np.random.default_rng(1)
+    await adapter.store_embeddings(*create_records(rng.random((50, 8))))
+    queries = [Embedding(vector=v, model="test-model")
+               for v in rng.random((4, 8))]
+
+    batched = await adapter.search_similar_batch(queries, limit=5)
+    single = [await adapter.search_similar(q, limit=5) for q in queries]
+
+    assert [[d.id for d in docs] for docs in batched] == \
+        [[d.id for d in docs] for docs in single]
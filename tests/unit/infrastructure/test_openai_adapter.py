@@ -1,5 +1,7 @@
 import pytest
-from unittest.mock import patch, AsyncMock
+import base64
+import numpy as np
+from unittest.mock import patch, AsyncMock, Mock
 from src.infrastructure.adapters.llm.openai_adapter import OpenAIAdapter
 from src.application.exceptions import LLMException
 
@@ -8,25 +10,25 @@ from src.application.exceptions import LLMException
 async def test_openai_generate_response():
     """Test OpenAI adapter response generation."""
     # Arrange
-    adapter = OpenAIAdapter(
-        api_key="test-key",
-        model="gpt-4",
-        embedding_model="text-embedding-ada-002"
-    )
-
-    mock_response = AsyncMock()
+    mock_response = Mock()
     mock_response.choices = [
-        AsyncMock(
-            message=AsyncMock(content="Test response")
+        Mock(
+            message=Mock(content="Test response"),
+            finish_reason="stop"
         )
     ]
 
     # Act
-    with patch('openai.OpenAI') as mock_openai:
+    with patch('openai.AsyncOpenAI') as mock_openai:
         mock_client = AsyncMock()
         mock_client.chat.completions.create.return_value = mock_response
         mock_openai.return_value = mock_client
 
+        adapter = OpenAIAdapter(
+            api_key="test-key",
+            model="gpt-4",
+            embedding_model="text-embedding-ada-002"
+        )
         response = await adapter.generate_response(
             messages=[],
             temperature=0.7
@@ -35,3 +37,126 @@ async def test_openai_generate_response():
     # Assert
     assert response.content == "Test response"
     assert response.role == "assistant"
+    assert "timeout" in mock_client.chat.completions.create.call_args.kwargs
+
+
+@pytest.mark.asyncio
+async def test_openai_generate_embeddings_batches_in_order():
+    """Test batched embeddings are split by size and keep input order."""
+    # Arrange
+    adapter = OpenAIAdapter(
+        api_key="test-key",
+        model="gpt-4",
+        embedding_model="text-embedding-ada-002",
+        embedding_batch_size=2
+    )
+
+    def create_response(model, input, **kwargs):
+        # Return vectors out of order to check they are re-sorted
+        data = [
+            Mock(index=i, embedding=[float(len(text))])
+            for i, text in enumerate(input)
+        ]
+        return Mock(data=list(reversed(data)))
+
+    adapter.client = Mock()
+    adapter.client.embeddings.create = AsyncMock(side_effect=create_response)
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    # Act
+    embeddings = await adapter.generate_embeddings(texts)
+
+    # Assert
+    assert adapter.client.embeddings.create.await_count == 3
+    assert [e.vector.tolist() for e in embeddings] == [[1.0], [2.0], [3.0], [4.0],
+                                              [5.0]]
+
+
+def test_openai_split_batches_respects_token_budget():
+    """Test batches are split when the token budget would be exceeded."""
+    adapter = OpenAIAdapter(
+        api_key="test-key",
+        model="gpt-4",
+        embedding_model="text-embedding-ada-002",
+        embedding_batch_max_tokens=50
+    )
+
+    batches = adapter._split_batches(["x" * 90, "y" * 90, "z" * 30])
+
+    assert batches == [["x" * 90], ["y" * 90, "z" * 30]]
+
+
+@pytest.mark.asyncio
+async def test_openai_warmup_does_not_raise_on_failure():
+    """Test connection warm-up failures are logged, not raised."""
+    adapter = OpenAIAdapter(
+        api_key="test-key",
+        model="gpt-4",
+        embedding_model="text-embedding-ada-002"
+    )
+    adapter.client = Mock()
+    adapter.client.models.retrieve = AsyncMock(
+        side_effect=RuntimeError("unreachable"))
+
+    await adapter.warmup()
+
+    adapter.client.models.retrieve.assert_awaited_once()
+
+
+def test_openai_decode_vector_from_base64():
+    """Test base64 payloads decode straight into float32 arrays."""
+    vector = np.array([0.5, -1.0, 2.0], dtype=np.float32)
+    payload = base64.b64encode(vector.tobytes()).decode()
+
+    decoded = OpenAIAdapter._decode_vector(payload)
+
+    assert decoded.dtype == np.float32
+    assert decoded.tolist() == [0.5, -1.0, 2.0]
+
+
+class FakeStream:
+    """Async chunk stream standing in for openai.AsyncStream."""
+    def __init__(self, deltas):
+        self.chunks = [
+            Mock(choices=[Mock(delta=Mock(content=delta))])
+            for delta in deltas
+        ]
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.chunks:
+            raise StopAsyncIteration
+        return self.chunks.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_openai_stream_response_yields_deltas_and_closes():
+    """Test streamed deltas arrive in order and early exit closes upstream."""
+    # Arrange
+    adapter = OpenAIAdapter(
+        api_key="test-key",
+        model="gpt-4",
+        embedding_model="text-embedding-ada-002"
+    )
+    streams = [FakeStream(["Hel", None, "lo"]), FakeStream(["a", "b"])]
+    adapter.client = Mock()
+    adapter.client.chat.completions.create = AsyncMock(side_effect=streams)
+
+    # Act
+    deltas = [delta async for delta in adapter.stream_response(messages=[])]
+    partial = adapter.stream_response(messages=[])
+    first = await partial.__anext__()
+    await partial.aclose()
+
+    # Assert
+    assert deltas == ["Hel", "lo"]
+    assert first == "a"
+    assert all(stream.closed for stream in streams)
+    kwargs = adapter.client.chat.completions.create.call_args.kwargs
+    assert kwargs["stream"] is True
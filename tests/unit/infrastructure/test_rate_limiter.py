@@ -0,0 +1,52 @@
+import pytest
+import asyncio
+from src.infrastructure.rate_limit.rate_limiter import MemoryRateLimiter, SQLiteRateLimiter
+
+
+@pytest.mark.asyncio
+async def test_memory_limiter_allows_burst_then_refills():
+    """Test a client gets rate_limit requests, then tokens refill."""
+    # Arrange
+    limiter = MemoryRateLimiter(rate_limit=3, window=0.3)
+
+    # Act
+    burst = [await limiter.allow("10.0.0.1") for _ in range(4)]
+    other_client = await limiter.allow("10.0.0.2")
+    await asyncio.sleep(0.12)
+    refilled = await limiter.allow("10.0.0.1")
+
+    # Assert
+    assert burst == [True, True, True, False]
+    assert other_client is True
+    assert refilled is True
+
+
+@pytest.mark.asyncio
+async def test_memory_limiter_memory_is_bounded():
+    """Test idle and least recently seen clients are evicted."""
+    limiter = MemoryRateLimiter(rate_limit=10, window=0.05, max_clients=100)
+
+    for client in range(1000):
+        await limiter.allow(f"client-{client}")
+    assert len(limiter.buckets) == 100
+
+    await asyncio.sleep(0.06)
+    await limiter.allow("late-client")
+    assert list(limiter.buckets) == ["late-client"]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_limiter_is_shared_between_instances(tmp_path):
+    """Test limiters on one file, as in separate workers, share buckets."""
+    path = str(tmp_path / "rate_limit.sqlite3")
+    first = SQLiteRateLimiter(path, rate_limit=2)
+    second = SQLiteRateLimiter(path, rate_limit=2)
+
+    decisions = [await first.allow("10.0.0.1"),
+                 await second.allow("10.0.0.1"),
+                 await first.allow("10.0.0.1")]
+
+    assert decisions == [True, True, False]
+    assert await second.allow("10.0.0.2") is True
+    await first.close()
+    await second.close()
@@ -0,0 +1,104 @@
+import pytest
+import asyncio
+import sqlite3
+from src.infrastructure.adapters.repository.sqlite_chat_repository import SQLiteChatRepository
+from src.domain.entities import ChatSession
+from tests.utils.test_helpers import create_test_message
+
+
+@pytest.mark.asyncio
+async def test_sqlite_session_roundtrip_and_window(tmp_path):
+    """Test sessions append messages and load whole or windowed."""
+    # Arrange
+    repository = SQLiteChatRepository(str(tmp_path / "chat.sqlite3"))
+    session = ChatSession(metadata={"user": "alice"})
+    session.add_message(create_test_message("hello"))
+
+    # Act
+    await repository.save_session(session)
+    window = await repository.get_session_window(session.id, 1)
+    window.add_message(create_test_message("hi there", role="assistant"))
+    await repository.save_session(window)
+    loaded = await repository.get_session(session.id)
+
+    # Assert
+    assert [msg.content for msg in loaded.messages] == ["hello", "hi there"]
+    assert loaded.messages[0] == session.messages[0]
+    assert loaded.metadata == {"user": "alice"}
+    assert (await repository.get_session_window(session.id, 1)) \
+        .history_offset == 1
+    await repository.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_concurrent_saves_share_commits(tmp_path):
+    """Test concurrent saves are batched and all become readable."""
+    repository = SQLiteChatRepository(str(tmp_path / "chat.sqlite3"))
+    sessions = [ChatSession(messages=[create_test_message(f"message {i}")])
+                for i in range(50)]
+
+    await asyncio.gather(*[repository.save_session(session)
+                           for session in sessions])
+    first = await repository.list_session_summaries(limit=30)
+    second = await repository.list_session_summaries(
+        limit=30, cursor=first.next_cursor)
+
+    listed = {summary.id for summary in first.sessions + second.sessions}
+    assert listed == {session.id for session in sessions}
+    assert second.next_cursor is None
+    await repository.delete_session(sessions[0].id)
+    assert await repository.get_session(sessions[0].id) is None
+    await repository.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_get_messages_pages_history(tmp_path):
+    """Test a range of older messages can be read without the session."""
+    # Arrange
+    repository = SQLiteChatRepository(str(tmp_path / "chat.sqlite3"))
+    session = ChatSession(messages=[create_test_message(f"message {i}")
+                                    for i in range(10)])
+    await repository.save_session(session)
+
+    # Act
+    page = await repository.get_messages(session.id, 3, 4)
+    tail = await repository.get_messages(session.id, 8, 5)
+
+    # Assert
+    assert [msg.content for msg in page] == \
+        [f"message {i}" for i in range(3, 7)]
+    assert [msg.content for msg in tail] == ["message 8", "message 9"]
+    assert await repository.get_messages("missing", 0, 5) == []
+    await repository.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_load_reads_one_snapshot(tmp_path):
+    """Test a commit between the header and message reads is not seen."""
+    path = str(tmp_path / "chat.sqlite3")
+    repository = SQLiteChatRepository(path)
+    session = ChatSession(messages=[create_test_message("first")])
+    await repository.save_session(session)
+
+    writer = sqlite3.connect(path, isolation_level=None)
+
+    def commit_between_reads(statement):
+        # Another writer appends a message just before messages are read
+        if statement.startswith("SELECT id, content"):
+            writer.execute(
+                "INSERT INTO messages VALUES (?, 1, 'late', 'late',"
+                " 'user', 'text', '2024-01-01T00:00:00', '{}')",
+                (session.id,))
+            writer.execute("UPDATE sessions SET message_count = 2"
+                           " WHERE id = ?", (session.id,))
+
+    reader = repository._reader()
+    reader.set_trace_callback(commit_between_reads)
+    loaded = repository._load(session.id, None)
+    reader.set_trace_callback(None)
+
+    assert [msg.content for msg in loaded.messages] == ["first"]
+    assert loaded.history_offset == 0
+    assert len(repository._load(session.id, None).messages) == 2
+    writer.close()
+    await repository.close()
@@ -0,0 +1,58 @@
+import pytest
+from src.infrastructure.adapters.repository.sqlite_ingestion_job_store import SQLiteIngestionJobStore
+from src.domain.entities import Document, IngestionJob
+from src.domain.value_objects.job_status import JobStatus
+
+
+@pytest.mark.asyncio
+async def test_sqlite_job_store_reclaims_only_expired_leases(tmp_path):
+    """Test a live job is not stolen, but an abandoned one is reclaimed."""
+    # Arrange
+    path = str(tmp_path / "jobs.sqlite3")
+    store = SQLiteIngestionJobStore(path)
+    job = IngestionJob(
+        documents=[Document(content="hello", source="doc",
+                            metadata={"lang": "en"})],
+        chunk_size=500
+    )
+    await store.enqueue_job(job)
+    claimed = await store.claim_job(lease_timeout=60)
+    await store.close()
+
+    # Act
+    restarted = SQLiteIngestionJobStore(path)
+    while_live = await restarted.claim_job(lease_timeout=60)
+    reclaimed = await restarted.claim_job(lease_timeout=-1)
+    stale_update = await restarted.update_job(claimed)
+
+    # Assert
+    assert claimed.id == job.id and claimed.status == JobStatus.RUNNING
+    assert while_live is None
+    assert reclaimed.attempts == 2
+    assert reclaimed.documents[0].id == job.documents[0].id
+    assert reclaimed.documents[0].metadata == {"lang": "en"}
+    assert stale_update is False
+    assert await restarted.update_job(reclaimed) is True
+    await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_job_store_tracks_progress_and_outcome(tmp_path):
+    """Test job updates are readable and finished jobs drop documents."""
+    store = SQLiteIngestionJobStore(str(tmp_path / "jobs.sqlite3"))
+    await store.enqueue_job(IngestionJob(
+        documents=[Document(content="x", source="doc")]))
+    job = await store.claim_job(lease_timeout=60)
+
+    job.progress.total_chunks = 10
+    job.progress.stored_chunks = 10
+    job.succeed()
+    await store.update_job(job)
+    loaded = await store.get_job(job.id)
+
+    assert loaded.status == JobStatus.SUCCEEDED
+    assert loaded.progress.fraction == 1.0
+    assert loaded.finished_at == job.finished_at
+    assert loaded.documents == []
+    assert await store.get_job("missing") is None
+    await store.close()
@@ -0,0 +1,74 @@
+import io
+import pytest
+from docx import Document as WordDocument
+from src.infrastructure.document.text_extractor import extract_text
+from src.domain.entities import InvalidDocumentError
+
+
+def create_pdf(text: str) -> bytes:
+    """Helper to build a one-page PDF showing the given text."""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, xref)
+    return pdf
+
+
+def test_extract_text_reads_plain_text():
+    """Test text and markdown files are decoded as UTF-8."""
+    # Act
+    text = extract_text("héllo world".encode("utf-8"), "notes.txt")
+    markdown = extract_text(b"# Title", "README.MD")
+
+    # Assert
+    assert text == "héllo world"
+    assert markdown == "# Title"
+
+
+def test_extract_text_reads_pdf():
+    """Test the text of a PDF page is extracted."""
+    text = extract_text(create_pdf("Hello PDF"), "report.pdf")
+
+    assert "Hello PDF" in text
+
+
+def test_extract_text_reads_docx():
+    """Test the paragraphs of a Word document are joined by lines."""
+    document = WordDocument()
+    document.add_paragraph("First paragraph")
+    document.add_paragraph("Second paragraph")
+    buffer = io.BytesIO()
+    document.save(buffer)
+
+    text = extract_text(buffer.getvalue(), "letter.docx")
+
+    assert text == "First paragraph\nSecond paragraph"
+
+
+def test_extract_text_rejects_unsupported_type():
+    """Test an unknown extension raises InvalidDocumentError."""
+    with pytest.raises(InvalidDocumentError, match="Unsupported"):
+        extract_text(b"data", "image.png")
+
+
+def test_extract_text_rejects_unreadable_file():
+    """Test a corrupt or mis-encoded file raises InvalidDocumentError."""
+    with pytest.raises(InvalidDocumentError, match="broken.pdf"):
+        extract_text(b"not a pdf", "broken.pdf")
+    with pytest.raises(InvalidDocumentError, match="latin.txt"):
+        extract_text("café".encode("latin-1"), "latin.txt")
@@ -0,0 +1,114 @@
+import pytest
+import asyncio
+from unittest.mock import AsyncMock
+from src.infrastructure.adapters.repository.write_behind_chat_repository import WriteBehindChatRepository
+from src.application.interfaces.chat_repository_port import ChatRepositoryPort
+from src.application.exceptions import ChatRepositoryException
+from src.domain.entities import ChatSession
+from tests.utils.test_helpers import create_test_message
+
+
+@pytest.mark.asyncio
+async def test_save_returns_before_write_and_reads_own_writes():
+    """Test saves are buffered, readable and written in the background."""
+    # Arrange
+    backend = AsyncMock(spec=ChatRepositoryPort)
+    release = asyncio.Event()
+
+    async def slow_save(session):
+        await release.wait()
+
+    backend.save_session.side_effect = slow_save
+    repository = WriteBehindChatRepository(backend)
+    session = ChatSession(messages=[create_test_message("hello")])
+
+    # Act
+    await asyncio.wait_for(repository.save_session(session), timeout=0.1)
+    session.add_message(create_test_message("not saved yet"))
+    pending = await repository.get_session(session.id)
+    release.set()
+    await repository.close()
+
+    # Assert
+    assert [msg.content for msg in pending.messages] == ["hello"]
+    backend.get_session.assert_not_called()
+    backend.save_session.assert_called_once()
+    backend.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_saves_of_a_pending_session_coalesce():
+    """Test repeated saves of a queued session write only the latest."""
+    backend = AsyncMock(spec=ChatRepositoryPort)
+    repository = WriteBehindChatRepository(backend)
+    session = ChatSession()
+
+    for turn in range(5):
+        session.add_message(create_test_message(f"turn {turn}"))
+        await repository.save_session(session)
+    await repository.flush()
+
+    backend.save_session.assert_called_once()
+    saved = backend.save_session.call_args.args[0]
+    assert saved.message_count == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_writes_are_retried():
+    """Test a failing write is retried until it succeeds."""
+    backend = AsyncMock(spec=ChatRepositoryPort)
+    backend.save_session.side_effect = [
+        ChatRepositoryException("unavailable"), None]
+    repository = WriteBehindChatRepository(backend, retry_delay=0.01)
+
+    await repository.save_session(ChatSession())
+    await repository.flush()
+
+    assert backend.save_session.call_count == 2
+    assert await repository.get_session("missing") is \
+        backend.get_session.return_value
+
+
+@pytest.mark.asyncio
+async def test_persistent_write_failures_keep_the_session():
+    """Test a session whose writes keep failing is kept and reported."""
+    backend = AsyncMock(spec=ChatRepositoryPort)
+    backend.save_session.side_effect = ChatRepositoryException("unavailable")
+    repository = WriteBehindChatRepository(backend, max_retries=1,
+                                           retry_delay=0.01)
+    session = ChatSession(messages=[create_test_message("hello")])
+
+    await repository.save_session(session)
+    with pytest.raises(ChatRepositoryException, match=session.id):
+        await repository.flush()
+    pending = await repository.get_session(session.id)
+
+    # A later retry writes the session once the backend recovers
+    backend.save_session.side_effect = None
+    await asyncio.sleep(0.1)
+    await repository.flush()
+
+    assert [msg.content for msg in pending.messages] == ["hello"]
+    assert backend.save_session.call_count == 3
+    assert await repository.get_session(session.id) is \
+        backend.get_session.return_value
+
+
+@pytest.mark.asyncio
+async def test_close_raises_for_unwritten_sessions():
+    """Test closing with a session that cannot be written raises."""
+    backend = AsyncMock(spec=ChatRepositoryPort)
+    backend.save_session.side_effect = ChatRepositoryException("unavailable")
+    repository = WriteBehindChatRepository(backend, max_retries=0,
+                                           retry_delay=10)
+    session = ChatSession(messages=[create_test_message("hello")])
+
+    await repository.save_session(session)
+    with pytest.raises(ChatRepositoryException):
+        await repository.flush()
+    with pytest.raises(ChatRepositoryException, match=session.id):
+        await asyncio.wait_for(repository.close(), timeout=1)
+
+    # The failed write is tried once more on close
+    assert backend.save_session.call_count == 2
+    backend.close.assert_called_once()
@@ -0,0 +1,21 @@
+from src.domain.entities import IngestionJob, IngestionProgress
+from src.presentation.schemas.api_models import IngestionJobResponse
+
+
+def test_ingestion_job_response_progress_follows_status():
+    """Test queued jobs report no progress and succeeded jobs report all."""
+    # Arrange
+    queued = IngestionJob()
+    running = IngestionJob(progress=IngestionProgress(total_chunks=4,
+                                                      stored_chunks=1))
+    empty = IngestionJob()
+    empty.succeed()
+
+    # Act
+    responses = [IngestionJobResponse.from_entity(job)
+                 for job in (queued, running, empty)]
+
+    # Assert
+    assert [response.progress for response in responses] == \
+        [0.0, 0.25, 1.0]
+    assert responses[0].status == "queued"
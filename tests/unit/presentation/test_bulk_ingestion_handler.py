@@ -0,0 +1,111 @@
+import pytest
+import json
+from unittest.mock import AsyncMock
+from src.application.use_cases.document_ingestion import DocumentIngestionUseCase
+from src.presentation.api.handlers import ChatHandler
+
+
+@pytest.fixture
+def handler(
+    document_ingestion_use_case: DocumentIngestionUseCase
+) -> ChatHandler:
+    """Create a handler over the ingestion pipeline with mocked ports."""
+    return ChatHandler(
+        chat_completion=AsyncMock(),
+        document_ingestion=document_ingestion_use_case,
+        ingestion_jobs=AsyncMock(),
+        max_document_bytes=2000
+    )
+
+
+async def stream(body: bytes, size: int = 7):
+    """Helper to deliver a body in small chunks, like a request stream."""
+    for i in range(0, len(body), size):
+        yield body[i:i + size]
+
+
+@pytest.mark.asyncio
+async def test_bulk_ingestion_reports_each_line(handler: ChatHandler):
+    """Test NDJSON lines are ingested, skipped or rejected one by one."""
+    # Arrange
+    lines = [
+        json.dumps({"content": "x" * 1000, "source": "long"}),
+        "",
+        "not json",
+        json.dumps({"content": "x" * 3000, "source": "too big"}),
+        json.dumps({"content": "short", "source": "short"}),
+        json.dumps({"content": "y" * 900, "source": "last"})
+    ]
+
+    # Act
+    response = await handler.ingest_documents_bulk(
+        stream("\n".join(lines).encode()), chunk_size=500)
+
+    # Assert
+    outcome = [(result.line, result.status, result.chunks)
+               for result in response.documents]
+    assert outcome == [
+        (1, "ingested", 2),
+        (3, "rejected", 0),
+        (4, "rejected", 0),
+        (5, "skipped", 0),
+        (6, "ingested", 2)
+    ]
+    assert response.error is None
+    assert (response.ingested, response.skipped, response.rejected) == \
+        (2, 1, 2)
+
+
+@pytest.mark.asyncio
+async def test_bulk_ingestion_reports_pipeline_failures(
+    handler: ChatHandler,
+    mock_vector_db: AsyncMock
+):
+    """Test documents not stored when the pipeline fails are reported."""
+    mock_vector_db.upsert_embeddings.side_effect = RuntimeError("store failed")
+    body = json.dumps({"content": "x" * 1000, "source": "doc"}).encode()
+
+    response = await handler.ingest_documents_bulk(stream(body))
+
+    assert response.error is None
+    assert response.failed == 1
+    assert response.documents[0].error == "store failed"
+
+
+@pytest.mark.asyncio
+async def test_bulk_ingestion_isolates_bad_records(
+    handler: ChatHandler,
+    mock_vector_db: AsyncMock
+):
+    """Test null metadata and invalid lines only fail their own line."""
+    # Arrange
+    lines = [
+        json.dumps({"content": "a" * 1000, "source": "first"}),
+        json.dumps({"content": "b" * 1000, "source": "null",
+                    "metadata": None}),
+        json.dumps({"content": "c" * 1000, "source": "bad",
+                    "metadata": {"n": 1}}),
+        json.dumps({"source": "no content"}),
+        json.dumps({"content": "d" * 1000, "source": "last"})
+    ]
+
+    # Act
+    response = await handler.ingest_documents_bulk(
+        stream("\n".join(lines).encode()), chunk_size=500)
+
+    # Assert
+    assert [(result.line, result.status)
+            for result in response.documents] == [
+        (1, "ingested"),
+        (2, "rejected"),
+        (3, "rejected"),
+        (4, "rejected"),
+        (5, "ingested")
+    ]
+    assert response.error is None
+    stored = [
+        chunk.source
+        for call in mock_vector_db.upsert_embeddings.call_args_list
+        for chunk in call.args[0]
+    ]
+    assert sorted(set(stored)) == ["first", "last"]
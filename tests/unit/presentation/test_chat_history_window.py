@@ -0,0 +1,76 @@
+from src.presentation.streamlit.history import ChatHistoryWindow
+from src.presentation.streamlit.formatting import cached_message_html
+
+
+def create_messages(start: int, count: int):
+    """Helper to create message dicts numbered from start."""
+    return [{"role": "user", "content": f"message {i}"}
+            for i in range(start, start + count)]
+
+
+def test_empty_history_shows_nothing():
+    """Test an empty window renders nothing and never fetches."""
+    # Arrange
+    window = ChatHistoryWindow(page_size=3)
+    fetches = []
+
+    # Act
+    window.load_older(lambda offset, limit: fetches.append((offset, limit)))
+    window.trim()
+
+    # Assert
+    assert window.visible == []
+    assert window.hidden_count == 0
+    assert window.history_offset == 0
+    assert fetches == []
+
+
+def test_history_at_offset_zero_pages_from_memory():
+    """Test older messages already in memory are shown without a fetch."""
+    window = ChatHistoryWindow(messages=create_messages(0, 5), page_size=3)
+
+    assert [m["content"] for m in window.visible] == \
+        ["message 2", "message 3", "message 4"]
+    assert window.hidden_count == 2
+
+    window.load_older(lambda offset, limit: 1 / 0)
+
+    assert len(window.visible) == 5
+    assert window.hidden_count == 0
+
+
+def test_trim_then_load_older_crosses_history_offset():
+    """Test a page partly in memory fetches only the stored remainder."""
+    # Arrange
+    stored = create_messages(0, 10)
+    window = ChatHistoryWindow(messages=list(stored), page_size=4)
+    window.trim()
+    fetches = []
+
+    def fetch(offset, limit):
+        fetches.append((offset, limit))
+        return stored[offset:offset + limit]
+
+    # Act
+    window.load_older(fetch)
+    window.load_older(fetch)
+
+    # Assert
+    assert window.history_offset == 0
+    assert fetches == [(2, 4), (0, 2)]
+    assert window.messages == stored
+    assert window.hidden_count == 0
+    assert len(window.visible) == 10
+
+
+def test_cached_message_html_escapes_and_reuses_markup():
+    """Test message HTML is escaped and built once per message."""
+    cached_message_html.cache_clear()
+
+    first = cached_message_html("user", "<b>hi</b>\nthere")
+    second = cached_message_html("user", "<b>hi</b>\nthere")
+
+    assert first == ('<div class="user-message"><strong>You:</strong> '
+                     '&lt;b&gt;hi&lt;/b&gt;<br>there</div>')
+    assert cached_message_html.cache_info().hits == 1
+    assert second is first
@@ -1,6 +1,7 @@
 import pytest
 from typing import List
-from src.domain.entities import Message, MessageType
+from src.domain.entities import Message
+from src.domain.value_objects.message_type import MessageType
 
 
 def create_test_message(content: str, role: str = "user") -> Message: